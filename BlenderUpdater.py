@@ -15,50 +15,33 @@
     along with this program.  If not, see <https://www.gnu.org/licenses/>.
 """
 
-import configparser
 import json
-import logging
 import os
 import os.path
-import platform
-import shutil
 import ssl
-import subprocess
 import sys
-import urllib.parse
-import urllib.request
 import webbrowser
-from datetime import datetime
-from distutils.dir_util import copy_tree
 from distutils.version import StrictVersion
 
 import requests
-from bs4 import BeautifulSoup
 
+import benchmark
+import cancellation
+import engine
+import logsetup
 import mainwindow
+import prefetch
+import resources
+import scheduler
 import qdarkstyle
 
-from PySide2 import QtWidgets, QtCore, QtGui
+from PySide2 import QtWidgets, QtCore
 
 os.environ["QT_AUTO_SCREEN_SCALE_FACTOR"] = "1"
 
-app = QtWidgets.QApplication(sys.argv)
-
-app.setAttribute(QtCore.Qt.AA_EnableHighDpiScaling)
-
 appversion = "1.9.10"
-dir_ = ""
-config = configparser.ConfigParser()
-btn = {}
-lastversion = ""
-installedversion = ""
-LOG_FORMAT = "%(levelname)s %(asctime)s - %(message)s"
-
-logging.basicConfig(
-    filename="BlenderUpdater.log", format=LOG_FORMAT, level=logging.DEBUG, filemode="w"
-)
 
-logger = logging.getLogger()
+logger = logsetup.setup_logging()
 
 
 class WorkerThread(QtCore.QThread):
@@ -69,69 +52,84 @@ class WorkerThread(QtCore.QThread):
     finishedEX = QtCore.Signal()
     finishedCP = QtCore.Signal()
     finishedCL = QtCore.Signal()
-
-    def __init__(self, url, file):
-        super(WorkerThread, self).__init__(parent=app)
-        self.filename = file
-        self.url = url
-        if "macOS" in file:
-            config.set("main", "lastdl", "OSX")
-            with open("config.ini", "w") as f:
-                config.write(f)
-                f.close()
-        elif "win32" in file:
-            config.set("main", "lastdl", "Windows 32bit")
-            with open("config.ini", "w") as f:
-                config.write(f)
-                f.close()
-        elif "win64" in file:
-            config.set("main", "lastdl", "Windows 64bit")
-            with open("config.ini", "w") as f:
-                config.write(f)
-                f.close()
-        elif "glibc211-i686" in file:
-            config.set("main", "lastdl", "Linux glibc211 i686")
-            with open("config.ini", "w") as f:
-                config.write(f)
-                f.close()
-        elif "glibc211-x86_64" in file:
-            config.set("main", "lastdl", "Linux glibc211 x86_64")
-            with open("config.ini", "w") as f:
-                config.write(f)
-                f.close()
-        elif "glibc219-i686" in file:
-            config.set("main", "lastdl", "Linux glibc219 i686")
-            with open("config.ini", "w") as f:
-                config.write(f)
-                f.close()
-        elif "glibc219-x86_64" in file:
-            config.set("main", "lastdl", "Linux glibc219 x86_64")
-            with open("config.ini", "w") as f:
-                config.write(f)
-                f.close()
-
-    def progress(self, count, blockSize, totalSize):
+    finishedWU = QtCore.Signal()
+    regressed = QtCore.Signal(str)
+    failed = QtCore.Signal(str)
+    cancelled = QtCore.Signal()
+
+    def __init__(self, eng, entry, path):
+        super(WorkerThread, self).__init__(parent=QtCore.QCoreApplication.instance())
+        self.engine = eng
+        self.entry = entry
+        self.path = path
+        self.cancel = cancellation.CancelToken()
+        self.signals = {
+            "downloaded": self.finishedDL,
+            "extracted": self.finishedEX,
+            "swapped": self.finishedCP,
+            "cleaned": self.finishedCL,
+        }
+
+    def progress(self, done, total):
         """Updates progress bar"""
-        percent = int(count * blockSize * 100 / totalSize)
-        self.update.emit(percent)
+        if total:
+            self.update.emit(int(done * 100 / total))
+
+    def stage(self, name):
+        if name in self.signals:
+            self.signals[name].emit()
 
     def run(self):
-        urllib.request.urlretrieve(self.url, self.filename, reporthook=self.progress)
-        self.finishedDL.emit()
-        shutil.unpack_archive(self.filename, "./blendertemp/")
-        self.finishedEX.emit()
-        source = next(os.walk("./blendertemp/"))[1]
-        copy_tree(os.path.join("./blendertemp/", source[0]), dir_)
-        self.finishedCP.emit()
-        shutil.rmtree("./blendertemp")
-        self.finishedCL.emit()
+        try:
+            self.engine.install(
+                self.entry,
+                self.path,
+                progress=self.progress,
+                stage=self.stage,
+                cancel=self.cancel,
+            )
+        except cancellation.Cancelled:
+            self.cancelled.emit()
+        except Exception as e:
+            logger.exception("Install failed")
+            self.failed.emit(str(e))
+        else:
+            # Optional, the build can already be started meanwhile
+            if self.engine.warm_up(self.path) is not None:
+                self.finishedWU.emit()
+            report = benchmark.after_install(self.engine, self.path)
+            if report and report["regressions"]:
+                scenes = [r["scene"] for r in report["regressions"]]
+                self.regressed.emit(", ".join(os.path.basename(s) for s in scenes))
+
+
+class CallThread(QtCore.QThread):
+    """Runs a single blocking engine call off the GUI thread"""
+
+    result = QtCore.Signal(object)
+    failed = QtCore.Signal(str)
+
+    def __init__(self, function, *args):
+        super(CallThread, self).__init__(parent=QtCore.QCoreApplication.instance())
+        self.function = function
+        self.args = args
+
+    def run(self):
+        try:
+            self.result.emit(self.function(*self.args))
+        except Exception as e:
+            logger.exception("Background call failed")
+            self.failed.emit(str(e))
 
 
 class BlenderUpdater(QtWidgets.QMainWindow, mainwindow.Ui_MainWindow):
+    newBuild = QtCore.Signal(object)
+
     def __init__(self, parent=None):
         logger.info(f"Running version {appversion}")
         logger.debug("Constructing UI")
         super(BlenderUpdater, self).__init__(parent)
+        resources.register()
         self.setupUi(self)
         self.btn_oneclick.hide()
         self.lbl_quick.hide()
@@ -139,43 +137,26 @@ class BlenderUpdater(QtWidgets.QMainWindow, mainwindow.Ui_MainWindow):
         self.btn_newVersion.hide()
         self.btn_execute.hide()
         self.lbl_caution.setStyleSheet("background: rgb(255, 155, 8);\n" "color: white")
-        global lastversion
-        global dir_
-        global config
-        global installedversion
-        if os.path.isfile("./config.ini"):
-            config_exist = True
+        self.engine = engine.Engine()
+        self.config = self.engine.config
+        self.btn = {}
+        self.thread = None
+        self.dir_ = ""
+        if self.config.exists:
             logger.info("Reading existing configuration file")
-            config.read("config.ini")
-            dir_ = config.get("main", "path")
-            lastcheck = config.get("main", "lastcheck")
-            lastversion = config.get("main", "lastdl")
-            installedversion = config.get("main", "installed")
-            flavor = config.get("main", "flavor")
-            if lastversion != "":
-                self.btn_oneclick.setText(f"{flavor} | {lastversion}")
-            else:
-                pass
-
+            self.dir_ = self.config.get("main", "path")
+            lastversion = self.config.get("main", "lastdl")
+            flavor = self.config.get("main", "flavor")
+            if flavor != "":
+                channel = self.config.get("main", "channel")
+                self.btn_oneclick.setText(f"{flavor} | {lastversion or channel}")
+                self.btn_oneclick.show()
+                self.lbl_quick.show()
+            self.line_path.setText(self.dir_)
         else:
             logger.debug("No previous config found")
-            self.btn_oneclick.hide()
-            config_exist = False
-            config.read("config.ini")
-            config.add_section("main")
-            config.set("main", "path", "")
-            lastcheck = "Never"
-            config.set("main", "lastcheck", lastcheck)
-            config.set("main", "lastdl", "")
-            config.set("main", "installed", "")
-            config.set("main", "flavor", "")
-            with open("config.ini", "w") as f:
-                config.write(f)
-        if config_exist:
-            self.line_path.setText(dir_)
-        else:
-            pass
-        dir_ = self.line_path.text()
+        lastcheck = self.config.get("main", "lastcheck")
+        self.dir_ = self.line_path.text()
         self.btn_cancel.hide()
         self.frm_progress.hide()
         self.btngrp_filter.hide()
@@ -189,6 +170,19 @@ class BlenderUpdater(QtWidgets.QMainWindow, mainwindow.Ui_MainWindow):
         self.btn_Check.clicked.connect(self.check_dir)
         self.btn_about.clicked.connect(self.about)
         self.btn_path.clicked.connect(self.select_path)
+        self.btn_execute.clicked.connect(self.exec_blender)
+        self.btn_oneclick.clicked.connect(self.quick_update)
+        self.btn_cancel.clicked.connect(self.cancel_install)
+        self.poller = None
+        self.pending = None
+        self.tray = None
+        self.newBuild.connect(self.new_build)
+        if self.config.get("schedule", "enabled"):
+            self.start_polling()
+        self.btn_osx.clicked.connect(lambda: self.render_buttons(["osx"]))
+        self.btn_linux.clicked.connect(lambda: self.render_buttons(["linux"]))
+        self.btn_windows.clicked.connect(lambda: self.render_buttons(["windows"]))
+        self.btn_allos.clicked.connect(lambda: self.render_buttons())
         # Check internet connection, disable SSL
         # FIXME - should be changed! (preliminary fix to work in OSX)
         ssl._create_default_https_context = ssl._create_unverified_context
@@ -221,16 +215,17 @@ class BlenderUpdater(QtWidgets.QMainWindow, mainwindow.Ui_MainWindow):
             QtWidgets.QMessageBox.critical(
                 self, "Error", "Unable to get Github update information"
             )
+        self.resume_pending()
+        # Leftovers of crashed or interrupted runs, deleted in the background
+        self.engine.reap()
 
     def select_path(self):
-        global dir_
-        dir_ = QtWidgets.QFileDialog.getExistingDirectory(
+        path = QtWidgets.QFileDialog.getExistingDirectory(
             None, "Select a folder:", "C:\\", QtWidgets.QFileDialog.ShowDirsOnly
         )
-        if dir_:
-            self.line_path.setText(dir_)
-        else:
-            pass
+        if path:
+            self.dir_ = path
+            self.line_path.setText(path)
 
     def getAppUpdate(self):
         webbrowser.open(
@@ -258,9 +253,8 @@ class BlenderUpdater(QtWidgets.QMainWindow, mainwindow.Ui_MainWindow):
 
     def check_dir(self):
         """Check if a vaild directory has been set by the user."""
-        global dir_
-        dir_ = self.line_path.text()
-        if not os.path.exists(dir_):
+        self.dir_ = self.line_path.text()
+        if not os.path.exists(self.dir_):
             QtWidgets.QMessageBox.about(
                 self,
                 "Directory not set",
@@ -271,19 +265,94 @@ class BlenderUpdater(QtWidgets.QMainWindow, mainwindow.Ui_MainWindow):
             logger.info("Checking for Blender versions")
             self.check()
 
-    def hbytes(self, num):
-        """Translate to human readable file size."""
-        for x in [" bytes", " KB", " MB", " GB"]:
-            if num < 1024.0:
-                return "%3.1f%s" % (num, x)
-            num /= 1024.0
-        return "%3.1f%s" % (num, " TB")
+    def start_polling(self):
+        """Poll for new builds in the background and offer a tray icon."""
+        # The poller gets its own engine so it never clears the shown catalog
+        poll_engine = engine.Engine(config=self.config, url=self.engine.url)
+        self.poller = scheduler.from_settings(poll_engine, on_new=self.newBuild.emit)
+        self.poller.start()
+        self.tray = QtWidgets.QSystemTrayIcon(resources.icon("appicon.png"), self)
+        menu = QtWidgets.QMenu(self)
+        menu.addAction("Show", self.restore_from_tray)
+        self.act_install = menu.addAction("Install new build", self.install_pending)
+        self.act_install.setEnabled(False)
+        menu.addSeparator()
+        menu.addAction("Quit", QtCore.QCoreApplication.instance().quit)
+        self.tray.setContextMenu(menu)
+        self.tray.activated.connect(self.restore_from_tray)
+        self.tray.show()
+
+    def changeEvent(self, event):
+        """Minimize to the tray while polling, dropping the build list."""
+        if (
+            event.type() == QtCore.QEvent.WindowStateChange
+            and self.isMinimized()
+            and self.tray is not None
+        ):
+            for i in self.btn:
+                self.btn[i].deleteLater()
+            self.btn = {}
+            self.engine.builds = []
+            QtCore.QTimer.singleShot(0, self.hide)
+        super(BlenderUpdater, self).changeEvent(event)
+
+    def restore_from_tray(self, reason=None):
+        self.showNormal()
+        self.activateWindow()
+
+    def new_build(self, record):
+        """Called when the poller has staged a new build."""
+        self.pending = record
+        if self.tray is not None:
+            self.act_install.setEnabled(True)
+            self.tray.showMessage(
+                "New Blender build", f"{record['version']} is ready to install"
+            )
+
+    def install_pending(self):
+        if self.pending is None:
+            return
+        self.restore_from_tray()
+        self.frm_start.hide()
+        self.btn_oneclick.hide()
+        self.lbl_quick.hide()
+        self.act_install.setEnabled(False)
+        entry, self.pending = self.pending, None
+        self.download(entry)
+
+    def quick_update(self):
+        """Install the newest build matching the last install, skipping the list."""
+        self.dir_ = self.line_path.text()
+        if not os.path.exists(self.dir_):
+            self.check_dir()
+            return
+        self.engine.path = self.dir_
+        self.btn_oneclick.setDisabled(True)
+        self.btn_Check.setDisabled(True)
+        self.statusbar.showMessage("Looking for a newer build...")
+        self.thread = CallThread(self.engine.quick_target)
+        self.thread.result.connect(self.quick_resolved)
+        self.thread.failed.connect(self.quick_failed)
+        self.thread.start()
+
+    def quick_resolved(self, entry):
+        self.btn_oneclick.setEnabled(True)
+        self.btn_Check.setEnabled(True)
+        if entry is None:
+            self.statusbar.showMessage("Ready - newest build is already installed")
+            return
+        self.frm_start.hide()
+        self.btn_oneclick.hide()
+        self.lbl_quick.hide()
+        self.download(entry)
+
+    def quick_failed(self, message):
+        self.btn_oneclick.setEnabled(True)
+        self.btn_Check.setEnabled(True)
+        self.statusbar.showMessage(f"Quick update not possible: {message}")
 
     def check(self):
-        global dir_
-        global lastversion
-        global installedversion
-        dir_ = self.line_path.text()
+        self.dir_ = self.line_path.text()
         self.frm_start.hide()
         self.frm_progress.hide()
         self.btn_oneclick.hide()
@@ -294,193 +363,70 @@ class BlenderUpdater(QtWidgets.QMainWindow, mainwindow.Ui_MainWindow):
         self.btn_newVersion.hide()
         self.btn_execute.hide()
 
-        appleicon = QtGui.QIcon(":/newPrefix/images/Apple-icon.png")
-        windowsicon = QtGui.QIcon(":/newPrefix/images/Windows-icon.png")
-        linuxicon = QtGui.QIcon(":/newPrefix/images/Linux-icon.png")
-        url = "https://builder.blender.org/download/"
         # Do path settings save here, in case user has manually edited it
-        global config
-        config.read("config.ini")
-        config.set("main", "path", dir_)
-        with open("config.ini", "w") as f:
-            config.write(f)
-        f.close()
+        self.engine.path = self.dir_
         try:
-            req = requests.get(url)
+            self.engine.catalog()
         except Exception:
             self.statusBar().showMessage(
                 "Error reaching server - check your internet connection"
             )
             logger.error("No connection to Blender nightly builds server")
             self.frm_start.show()
-        soup = BeautifulSoup(req.text, "html.parser")
-
-        def clean(text):
-            """Removes spaces and uneeded characters from the given text."""
-
-            return text.strip().strip("\xa0")
-
-        def parse_description(element):
-            """Parses the given description element.
-
-            Input text may look like:
-            <span>May 24, 07:44:19 - blender-v283-release - d553edeb7dbb - zip - 171.79MB</span>
-            """
-
-            if element is None:
-                return None
-
-            parts = element.text.split(" - ")
-            output = {}
-            output["date"] = clean(parts[0])
-            # output["name"] = clean(parts[1])
-            output["hash"] = clean(parts[1])
-            output["type"] = clean(parts[2])
-            output["size"] = clean(parts[3])
-            return output
-
-        # iterate through the found versions
-        results = []
-        for li in soup.find_all("li", class_="os"):
-            description_element = li.find("div", class_="name").find("small")
-            arch = li.find("span", class_="build").find(text=True, recursive=False)
-            channel = li.find("span", class_="build-var").text
-            name = li.find("div", class_="name").find(text=True, recursive=False)
-            url = li.find("a", href=True)["href"]
-
-            description_data = parse_description(description_element)
-            if description_data is None:
+            return
+
+        self.lbl_available.show()
+        self.lbl_caution.show()
+        self.btngrp_filter.show()
+        lastcheck = self.config.get("main", "lastcheck")
+        self.statusbar.showMessage(f"Ready - Last check: {lastcheck}")
+        self.render_buttons()
+        prefetch.prefetch_likely(self.engine)
+
+    def render_buttons(self, os_filter=("windows", "osx", "linux")):
+        """Renders the download buttons on screen.
+
+        os_filter: Will modify the buttons to be rendered.
+        """
+        icons = {
+            "osx": resources.icon("Apple-icon.png"),
+            "linux": resources.icon("Linux-icon.png"),
+            "windows": resources.icon("Windows-icon.png"),
+        }
+        # Generate buttons for downloadable versions.
+        for i in self.btn:
+            self.btn[i].hide()
+        i = 0
+        self.btn = {}
+
+        for index, entry in enumerate(self.engine.select()):
+            # Skip based on os_filter entries
+            if entry["os"] not in os_filter:
                 continue
 
-            info = {}
-            info["arch"] = clean(arch)
-            info["build_date"] = description_data["date"]
-            info["channel"] = clean(channel)
-            info["filename"] = clean(url).split("/")[-1]
-            info["hash"] = description_data["hash"]
-            info["name"] = clean(name) + " " + clean(channel)
-            info["size"] = description_data["size"]
-            info["type"] = description_data["type"]
-            info["url"] = clean(url)
-            info["version"] = name + "_" + description_data["hash"]
-
-            # Set "os" based on URL
-            if "windows" in clean(url):
-                info["os"] = "windows"
-            elif "darwin" in clean(url):
-                info["os"] = "osx"
-            else:
-                info["os"] = "linux"
-
-            results.append(info)
-
-        finallist = results
-
-        def render_buttons(os_filter=["windows", "osx", "linux"]):
-            """Renders the download buttons on screen.
-
-            os_filter: Will modify the buttons to be rendered.
-                       If an empty list is being provided, all operating systems
-                       will be shown.
-            """
-            # Generate buttons for downloadable versions.
-            global btn
-            opsys = platform.system()
-            logger.info(f"Operating system: {opsys}")
-            for i in btn:
-                btn[i].hide()
-            i = 0
-            btn = {}
-
-            for index, entry in enumerate(finallist):
-                btn[index] = QtWidgets.QPushButton(self)
-
-                # Switch for skipping rendering buttons
-                skip_entry = False
-
-                # Skip certain file types
-                if entry["type"] in ("msix", "msi", "sha256"):
-                    skip_entry = True
-
-                # Skip based on os_filter entries
-                if entry["os"] not in os_filter:
-                    skip_entry = True
-
-                if skip_entry:
-                    continue
-
-                # set icons according to OS
-                if entry["os"] == "osx":
-                    btn[index].setIcon(appleicon)
-
-                if entry["os"] == "linux":
-                    btn[index].setIcon(linuxicon)
-
-                if entry["os"] == "windows":
-                    btn[index].setIcon(windowsicon)
-
-                buttontext = f"{entry['name']} ({entry['arch']}) | {entry['size']} | {entry['build_date']}"
-                logger.debug(buttontext)
-
-                btn[index].setIconSize(QtCore.QSize(24, 24))
-                btn[index].setText(buttontext)
-                btn[index].setFixedWidth(686)
-                btn[index].move(6, 50 + i)
-                i += 32
-                btn[index].clicked.connect(
-                    lambda throwaway=0, entry=entry: self.download(entry)
-                )
-                btn[index].show()
-
-        def filterall():
-            render_buttons(os_filter=["windows", "osx", "linux"])
-
-        def filterosx():
-            render_buttons(
-                os_filter=[
-                    "osx",
-                ]
-            )
+            self.btn[index] = QtWidgets.QPushButton(self)
+            # set icons according to OS
+            self.btn[index].setIcon(icons[entry["os"]])
 
-        def filterlinux():
-            render_buttons(
-                os_filter=[
-                    "linux",
-                ]
-            )
+            buttontext = f"{entry['name']} ({entry['arch']}) | {entry['size']} | {entry['build_date']}"
 
-        def filterwindows():
-            render_buttons(
-                os_filter=[
-                    "windows",
-                ]
+            self.btn[index].setIconSize(QtCore.QSize(24, 24))
+            self.btn[index].setText(buttontext)
+            self.btn[index].setFixedWidth(686)
+            self.btn[index].move(6, 50 + i)
+            i += 32
+            self.btn[index].clicked.connect(
+                lambda throwaway=0, entry=entry: self.download(entry)
             )
-
-        self.lbl_available.show()
-        self.lbl_caution.show()
-        self.btngrp_filter.show()
-        self.btn_osx.clicked.connect(filterosx)
-        self.btn_linux.clicked.connect(filterlinux)
-        self.btn_windows.clicked.connect(filterwindows)
-        self.btn_allos.clicked.connect(filterall)
-        lastcheck = datetime.now().strftime("%a %b %d %H:%M:%S %Y")
-        self.statusbar.showMessage(f"Ready - Last check: {str(lastcheck)}")
-        config.read("config.ini")
-        config.set("main", "lastcheck", str(lastcheck))
-        with open("config.ini", "w") as f:
-            config.write(f)
-        f.close()
-        filterall()
+            self.btn[index].show()
+        logger.debug(f"Rendered {len(self.btn)} build buttons for {list(os_filter)}")
 
     def download(self, entry):
         """Download routines."""
-        global dir_
-
         url = entry["url"]
         version = entry["version"]
-        variation = entry["arch"]
 
-        if version == installedversion:
+        if self.engine.is_installed(entry):
             reply = QtWidgets.QMessageBox.question(
                 self,
                 "Warning",
@@ -492,38 +438,15 @@ class BlenderUpdater(QtWidgets.QMainWindow, mainwindow.Ui_MainWindow):
             if reply == QtWidgets.QMessageBox.No:
                 logger.debug("Skipping download of existing version")
                 return
-            else:
-                pass
-        else:
-            pass
-
-        if os.path.isdir("./blendertemp"):
-            shutil.rmtree("./blendertemp")
-
-        os.makedirs("./blendertemp")
-        file = urllib.request.urlopen(url)
-        totalsize = file.info()["Content-Length"]
-        size_readable = self.hbytes(float(totalsize))
-
-        global config
-        config.read("config.ini")
-        config.set("main", "path", dir_)
-        config.set("main", "flavor", variation)
-        config.set("main", "installed", version)
-
-        with open("config.ini", "w") as f:
-            config.write(f)
-        f.close()
 
         ##########################
         # Do the actual download #
         ##########################
 
-        dir_ = os.path.join(dir_, "")
-        filename = "./blendertemp/" + entry["filename"]
+        self.dir_ = os.path.join(self.dir_, "")
 
-        for i in btn:
-            btn[i].hide()
+        for i in self.btn:
+            self.btn[i].hide()
         logger.info(f"Starting download thread for {url}{version}")
 
         self.lbl_available.hide()
@@ -533,20 +456,26 @@ class BlenderUpdater(QtWidgets.QMainWindow, mainwindow.Ui_MainWindow):
         self.lbl_task.setText("Downloading")
         self.lbl_task.show()
         self.frm_progress.show()
-        nowpixmap = QtGui.QPixmap(":/newPrefix/images/Actions-arrow-right-icon.png")
+        nowpixmap = resources.pixmap("Actions-arrow-right-icon.png")
         self.lbl_download_pic.setPixmap(nowpixmap)
         self.lbl_downloading.setText(f"<b>Downloading {version}</b>")
         self.progressBar.setValue(0)
         self.btn_Check.setDisabled(True)
-        self.statusbar.showMessage(f"Downloading {size_readable}")
-
-        thread = WorkerThread(url, filename)
-        thread.update.connect(self.updatepb)
-        thread.finishedDL.connect(self.extraction)
-        thread.finishedEX.connect(self.finalcopy)
-        thread.finishedCP.connect(self.cleanup)
-        thread.finishedCL.connect(self.done)
-        thread.start()
+        self.btn_cancel.setEnabled(True)
+        self.btn_cancel.show()
+        self.statusbar.showMessage(f"Downloading {entry['size']}")
+
+        self.thread = WorkerThread(self.engine, entry, self.dir_)
+        self.thread.update.connect(self.updatepb)
+        self.thread.finishedDL.connect(self.extraction)
+        self.thread.finishedEX.connect(self.finalcopy)
+        self.thread.finishedCP.connect(self.cleanup)
+        self.thread.finishedCL.connect(self.done)
+        self.thread.finishedWU.connect(self.warmed_up)
+        self.thread.regressed.connect(self.render_regression)
+        self.thread.failed.connect(self.install_failed)
+        self.thread.cancelled.connect(self.install_cancelled)
+        self.thread.start()
 
     def updatepb(self, percent):
         self.progressBar.setValue(percent)
@@ -555,8 +484,8 @@ class BlenderUpdater(QtWidgets.QMainWindow, mainwindow.Ui_MainWindow):
         logger.info("Extracting to temp directory")
         self.lbl_task.setText("Extracting...")
         self.btn_Quit.setEnabled(False)
-        nowpixmap = QtGui.QPixmap(":/newPrefix/images/Actions-arrow-right-icon.png")
-        donepixmap = QtGui.QPixmap(":/newPrefix/images/Check-icon.png")
+        nowpixmap = resources.pixmap("Actions-arrow-right-icon.png")
+        donepixmap = resources.pixmap("Check-icon.png")
         self.lbl_download_pic.setPixmap(donepixmap)
         self.lbl_extract_pic.setPixmap(nowpixmap)
         self.lbl_extraction.setText("<b>Extraction</b>")
@@ -566,19 +495,21 @@ class BlenderUpdater(QtWidgets.QMainWindow, mainwindow.Ui_MainWindow):
         self.progressBar.setValue(-1)
 
     def finalcopy(self):
-        logger.info("Copying to " + dir_)
-        nowpixmap = QtGui.QPixmap(":/newPrefix/images/Actions-arrow-right-icon.png")
-        donepixmap = QtGui.QPixmap(":/newPrefix/images/Check-icon.png")
+        logger.info("Copying to " + self.dir_)
+        nowpixmap = resources.pixmap("Actions-arrow-right-icon.png")
+        donepixmap = resources.pixmap("Check-icon.png")
         self.lbl_extract_pic.setPixmap(donepixmap)
         self.lbl_copy_pic.setPixmap(nowpixmap)
         self.lbl_copying.setText("<b>Copying</b>")
         self.lbl_task.setText("Copying files...")
-        self.statusbar.showMessage(f"Copying files to {dir_}, please wait... ")
+        self.statusbar.showMessage(f"Copying files to {self.dir_}, please wait... ")
 
     def cleanup(self):
         logger.info("Cleaning up temp files")
-        nowpixmap = QtGui.QPixmap(":/newPrefix/images/Actions-arrow-right-icon.png")
-        donepixmap = QtGui.QPixmap(":/newPrefix/images/Check-icon.png")
+        # The new build is in place, there's nothing left to cancel
+        self.btn_cancel.hide()
+        nowpixmap = resources.pixmap("Actions-arrow-right-icon.png")
+        donepixmap = resources.pixmap("Check-icon.png")
         self.lbl_copy_pic.setPixmap(donepixmap)
         self.lbl_clean_pic.setPixmap(nowpixmap)
         self.lbl_cleanup.setText("<b>Cleaning up</b>")
@@ -587,7 +518,7 @@ class BlenderUpdater(QtWidgets.QMainWindow, mainwindow.Ui_MainWindow):
 
     def done(self):
         logger.info("Finished")
-        donepixmap = QtGui.QPixmap(":/newPrefix/images/Check-icon.png")
+        donepixmap = resources.pixmap("Check-icon.png")
         self.lbl_clean_pic.setPixmap(donepixmap)
         self.statusbar.showMessage("Ready")
         self.progressBar.setMinimum(0)
@@ -597,38 +528,86 @@ class BlenderUpdater(QtWidgets.QMainWindow, mainwindow.Ui_MainWindow):
         self.btn_Quit.setEnabled(True)
         self.btn_Check.setEnabled(True)
         self.btn_execute.show()
-        opsys = platform.system()
-        if opsys == "Windows":
-            self.btn_execute.clicked.connect(self.exec_windows)
-        if opsys.lower == "darwin":
-            self.btn_execute.clicked.connect(self.exec_osx)
-        if opsys == "Linux":
-            self.btn_execute.clicked.connect(self.exec_linux)
-
-    def exec_windows(self):
-        _ = subprocess.Popen(os.path.join('"' + dir_ + "\\blender.exe" + '"'))
-        logger.info(f"Executing {dir_}blender.exe")
-
-    def exec_osx(self):
-        BlenderOSXPath = os.path.join(
-            '"' + dir_ + "\\blender.app/Contents/MacOS/blender" + '"'
+        if self.engine.config.get("warmup", "enabled"):
+            self.statusbar.showMessage("Warming up Blender's Python...")
+
+    def warmed_up(self):
+        logger.info("Warm-up finished")
+        self.statusbar.showMessage("Ready")
+
+    def render_regression(self, scenes):
+        self.statusbar.showMessage(f"Renders slower than previous builds: {scenes}")
+
+    def cancel_install(self):
+        if self.thread is None or not isinstance(self.thread, WorkerThread):
+            return
+        logger.info("Cancelling install")
+        self.btn_cancel.setEnabled(False)
+        self.statusbar.showMessage("Cancelling...")
+        self.thread.cancel.cancel()
+
+    def reset_progress(self):
+        self.progressBar.setMinimum(0)
+        self.progressBar.setMaximum(100)
+        self.progressBar.hide()
+        self.lbl_task.hide()
+        self.frm_progress.hide()
+        self.btn_cancel.hide()
+        self.btn_Quit.setEnabled(True)
+        self.btn_Check.setEnabled(True)
+
+    def install_cancelled(self):
+        self.reset_progress()
+        self.statusbar.showMessage("Installation cancelled")
+
+    def install_failed(self, message):
+        self.reset_progress()
+        self.statusbar.showMessage("Ready")
+        QtWidgets.QMessageBox.critical(
+            self,
+            "Error",
+            f"Installation failed: {message}\n\n"
+            "Installing the same build again continues where it stopped.",
         )
-        os.system("chmod +x " + BlenderOSXPath)
-        _ = subprocess.Popen(BlenderOSXPath)
-        logger.info(f"Executing {BlenderOSXPath}")
 
-    def exec_linux(self):
-        _ = subprocess.Popen(os.path.join(f"{dir_}/blender"))
-        logger.info(f"Executing {dir_}blender")
+    def resume_pending(self):
+        """Offer to finish installs interrupted by a crash or an error."""
+        for record in self.engine.pending():
+            reply = QtWidgets.QMessageBox.question(
+                self,
+                "Interrupted installation",
+                f"Installing {record.entry['version']} to {record.path} was "
+                "interrupted. Do you want to finish it now?",
+                QtWidgets.QMessageBox.Yes | QtWidgets.QMessageBox.No,
+                QtWidgets.QMessageBox.Yes,
+            )
+            if reply == QtWidgets.QMessageBox.No:
+                logger.info(f"Discarding interrupted install {record.filename}")
+                record.remove()
+                continue
+            self.dir_ = record.path
+            self.line_path.setText(record.path)
+            self.download(record.entry)
+            return
+
+    def exec_blender(self):
+        try:
+            self.engine.launch(self.dir_)
+        except OSError:
+            logger.exception("Unable to start Blender")
+            QtWidgets.QMessageBox.critical(self, "Error", "Unable to start Blender")
 
 
 def main():
+    app = QtWidgets.QApplication(sys.argv)
+    app.setAttribute(QtCore.Qt.AA_EnableHighDpiScaling)
     app.setStyleSheet(qdarkstyle.load_stylesheet_pyside2())
     window = BlenderUpdater()
     window.setWindowTitle(f"Overmind Studios Blender Updater {appversion}")
     window.statusbar.setSizeGripEnabled(False)
     window.show()
     app.exec_()
+    window.config.flush()
 
 
 if __name__ == "__main__":
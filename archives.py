@@ -0,0 +1,188 @@
+"""
+    Copyright 2016-2019 Tobias Kummer/Overmind Studios.
+
+    This program is free software: you can redistribute it and/or modify
+    it under the terms of the GNU General Public License as published by
+    the Free Software Foundation, either version 3 of the License, or
+    (at your option) any later version.
+
+    This program is distributed in the hope that it will be useful,
+    but WITHOUT ANY WARRANTY; without even the implied warranty of
+    MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+    GNU General Public License for more details.
+
+    You should have received a copy of the GNU General Public License
+    along with this program.  If not, see <https://www.gnu.org/licenses/>.
+"""
+
+import fnmatch
+import logging
+import os
+import shutil
+import tarfile
+import zipfile
+
+from cancellation import check
+
+logger = logging.getLogger(__name__)
+
+# Bytes written between cancellation checks; a few ms of decompression
+CHUNK_SIZE = 1024 * 1024
+
+
+class Rules:
+    """Include and exclude rules for the members of a build archive.
+
+    Patterns are fnmatch globs matched against the member path below the
+    build's top folder, e.g. "*/datafiles/locale". A pattern matching a
+    folder applies to everything in it. Without include patterns every
+    member is included; exclude patterns win over include patterns.
+    """
+
+    def __init__(self, include=(), exclude=()):
+        self.include = list(include or ())
+        self.exclude = list(exclude or ())
+
+    def __bool__(self):
+        return bool(self.include or self.exclude)
+
+    def wants(self, name):
+        """Return whether the member name should be extracted."""
+        parts = [p for p in name.replace("\\", "/").split("/") if p not in ("", ".")]
+        parts = parts[1:]
+        if not parts:
+            return True
+        paths = ["/".join(parts[:i]) for i in range(1, len(parts) + 1)]
+
+        def matches(patterns):
+            return any(
+                fnmatch.fnmatchcase(path, pattern)
+                for path in paths
+                for pattern in patterns
+            )
+
+        if matches(self.exclude):
+            return False
+        return not self.include or matches(self.include)
+
+    def as_dict(self):
+        return {"include": self.include, "exclude": self.exclude}
+
+
+def _target(staging, name):
+    """Path of an archive member below staging; rejects members outside it."""
+    root = os.path.realpath(staging)
+    path = os.path.realpath(os.path.join(root, name))
+    if path != root and not path.startswith(root + os.sep):
+        raise ValueError(f"Archive member outside of the target folder: {name}")
+    return path
+
+
+def _write(source, path, cancel, throttle):
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    with open(path, "wb") as f:
+        for data in iter(lambda: source.read(CHUNK_SIZE), b""):
+            check(cancel)
+            f.write(data)
+            if throttle:
+                throttle(len(data))
+
+
+def _drain(source, cancel):
+    """Read past the data of a skipped member, checking cancel per chunk."""
+    for _ in iter(lambda: source.read(CHUNK_SIZE), b""):
+        check(cancel)
+
+
+def _skip(stats, size):
+    stats["skipped_files"] += 1
+    stats["skipped_bytes"] += size
+
+
+def _extract_tar(archive, staging, cancel, throttle, rules, stats):
+    dirs = []
+    with tarfile.open(archive) as tar:
+        for member in tar:
+            check(cancel)
+            if rules and not rules.wants(member.name):
+                # Never written, but a compressed tar has to decompress
+                # the data to get to the next member
+                if member.isfile():
+                    with tar.extractfile(member) as source:
+                        _drain(source, cancel)
+                if not member.isdir():
+                    _skip(stats, member.size)
+                continue
+            path = _target(staging, member.name)
+            if member.isdir():
+                os.makedirs(path, exist_ok=True)
+                # Read-only folders get their mode once they are filled
+                dirs.append((path, member))
+                continue
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+            if os.path.lexists(path):
+                os.remove(path)
+            if member.issym():
+                os.symlink(member.linkname, path)
+            elif member.islnk():
+                source = _target(staging, member.linkname)
+                if not os.path.exists(source):
+                    # Link to an excluded member
+                    _skip(stats, member.size)
+                    continue
+                os.link(source, path)
+            elif member.isfile():
+                with tar.extractfile(member) as source:
+                    _write(source, path, cancel, throttle)
+                os.chmod(path, member.mode & 0o7777)
+                os.utime(path, (member.mtime, member.mtime))
+                stats["files"] += 1
+                stats["bytes"] += member.size
+            else:
+                logger.debug(f"Skipping special file {member.name}")
+    for path, member in reversed(dirs):
+        os.chmod(path, member.mode & 0o7777)
+        os.utime(path, (member.mtime, member.mtime))
+
+
+def _extract_zip(archive, staging, cancel, throttle, rules, stats):
+    with zipfile.ZipFile(archive) as zf:
+        for info in zf.infolist():
+            check(cancel)
+            if rules and not rules.wants(info.filename):
+                if not info.is_dir():
+                    _skip(stats, info.file_size)
+                continue
+            path = _target(staging, info.filename)
+            if info.is_dir():
+                os.makedirs(path, exist_ok=True)
+                continue
+            with zf.open(info) as source:
+                _write(source, path, cancel, throttle)
+            stats["files"] += 1
+            stats["bytes"] += info.file_size
+
+
+def extract(archive, staging, cancel=None, throttle=None, rules=None):
+    """Unpack archive into staging, member by member.
+
+    Tar and zip archives are streamed in chunks, checking the CancelToken
+    cancel between them, so even a huge member stops within milliseconds.
+    throttle(nbytes) is called per chunk written, like in downloads.py.
+    Members the Rules rules don't want are never written to disk. Other
+    formats are left to shutil.unpack_archive, without rules. A cancelled
+    extraction leaves its partial output behind for the caller to remove.
+    Returns the number of files and bytes written and skipped.
+    """
+    check(cancel)
+    os.makedirs(staging, exist_ok=True)
+    stats = {"files": 0, "bytes": 0, "skipped_files": 0, "skipped_bytes": 0}
+    if zipfile.is_zipfile(archive):
+        _extract_zip(archive, staging, cancel, throttle, rules, stats)
+    elif tarfile.is_tarfile(archive):
+        _extract_tar(archive, staging, cancel, throttle, rules, stats)
+    else:
+        if rules:
+            logger.warning(f"Extraction rules not supported for {archive}")
+        shutil.unpack_archive(archive, staging)
+    return stats
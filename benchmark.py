@@ -0,0 +1,450 @@
+"""
+    Copyright 2016-2019 Tobias Kummer/Overmind Studios.
+
+    This program is free software: you can redistribute it and/or modify
+    it under the terms of the GNU General Public License as published by
+    the Free Software Foundation, either version 3 of the License, or
+    (at your option) any later version.
+
+    This program is distributed in the hope that it will be useful,
+    but WITHOUT ANY WARRANTY; without even the implied warranty of
+    MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+    GNU General Public License for more details.
+
+    You should have received a copy of the GNU General Public License
+    along with this program.  If not, see <https://www.gnu.org/licenses/>.
+"""
+
+import json
+import logging
+import os
+import re
+import signal
+import statistics
+import subprocess
+import sys
+import tempfile
+import threading
+import time
+from datetime import datetime
+
+import engine
+from locks import FileLock
+
+logger = logging.getLogger(__name__)
+
+RESULTS_FILE = engine.user_cache_dir("benchmarks.json")
+# Results kept per build and kind of benchmark
+RESULTS_KEEP = 20
+DEFAULT_RUNS = 5
+DEFAULT_TIMEOUT = 300
+
+# Printed by Blender's Python once startup is complete
+READY_MARKER = "BLENDERUPDATER-READY"
+TIMING_SCRIPT = f"print({READY_MARKER!r}, flush=True)"
+
+RENDER_TIMEOUT = 3600
+# Previous builds a render time is compared to, and the slowdown (as a
+# fraction) reported as a regression
+BASELINE = 3
+THRESHOLD = 0.1
+# Blender's summary after rendering, e.g. " Time: 00:12.34 (Saving: 00:00.02)"
+RENDER_TIME = re.compile(r"^\s*Time: ((?:\d+:)*\d+(?:\.\d+)?) \(Saving")
+# --factory-startup already leaves GPU compute off, this covers the scene
+CPU_SCRIPT = (
+    "import bpy\n"
+    "for scene in bpy.data.scenes:\n"
+    "    if scene.render.engine == 'CYCLES':\n"
+    "        scene.cycles.device = 'CPU'\n"
+)
+
+
+class Results:
+    """Benchmark results per build hash, kept in a JSON file.
+
+    Each build has its version, build date and a list of results per kind
+    of benchmark ("launch", ...), newest last. Every add() re-reads and
+    replaces the file under a lock, so concurrent runs don't lose results.
+    """
+
+    def __init__(self, filename=RESULTS_FILE, keep=RESULTS_KEEP):
+        self.filename = filename
+        self.keep = keep
+        self._lock = FileLock(filename + ".lock")
+
+    def load(self):
+        try:
+            with open(self.filename, encoding="utf-8") as f:
+                return json.load(f)
+        except FileNotFoundError:
+            return {}
+        except (OSError, ValueError):
+            logger.error(f"Unable to read {self.filename}, starting over")
+            return {}
+
+    def add(self, hash_, kind, result, version=None, date=None):
+        """Append result to the kind results of the build hash_."""
+        os.makedirs(os.path.dirname(os.path.abspath(self.filename)), exist_ok=True)
+        with self._lock:
+            data = self.load()
+            build = data.setdefault(hash_, {})
+            if version:
+                build["version"] = version
+            if date:
+                build["date"] = date
+            results = build.setdefault(kind, [])
+            results.append(result)
+            del results[: -self.keep]
+            self._write(data)
+        return build
+
+    def get(self, hash_, kind=None):
+        """Return all results of a build, or only those of kind."""
+        build = self.load().get(hash_, {})
+        return build.get(kind, []) if kind else build
+
+    def _write(self, data):
+        directory = os.path.dirname(os.path.abspath(self.filename))
+        fd, tmp = tempfile.mkstemp(prefix=".benchmarks-", dir=directory)
+        try:
+            with os.fdopen(fd, "w", encoding="utf-8") as f:
+                json.dump(data, f, indent=2)
+            os.replace(tmp, self.filename)
+        except BaseException:
+            if os.path.exists(tmp):
+                os.remove(tmp)
+            raise
+
+
+def installed_build(config, path):
+    """Return (hash, version, build date) of the build installed at path."""
+    path = os.path.normpath(path)
+    installed = config.section("installed")
+    current = [config.get("main", "installed")] + [
+        engine.install_key(state.get("installed"), name)
+        for name, state in config.section("profile_state").items()
+    ]
+    matches = [
+        key
+        for key, record in installed.items()
+        if record.get("path") and os.path.normpath(record["path"]) == path
+    ]
+    if not matches:
+        return None, None, None
+    key = next((k for k in current if k in matches), matches[-1])
+    record = installed[key]
+    # Older records are keyed by the version alone
+    version = record.get("version") or key
+    # Records of older versions lack the hash, it ends the version
+    hash_ = record.get("hash") or version.rsplit("_", 1)[-1]
+    date = None
+    if record.get("date"):
+        # The builder page leaves out the year, see engine.build_datetime()
+        parsed = engine.build_datetime({"build_date": record["date"]})
+        if parsed != datetime.min:
+            date = parsed.isoformat()
+    return hash_, version, date
+
+
+def evict(path):
+    """Drop the files of an install from the page cache, where supported."""
+    if not hasattr(os, "posix_fadvise"):
+        return False
+    for root, _, files in os.walk(path):
+        for name in files:
+            try:
+                with open(os.path.join(root, name), "rb") as f:
+                    os.posix_fadvise(f.fileno(), 0, 0, os.POSIX_FADV_DONTNEED)
+            except OSError:
+                pass
+    return True
+
+
+def _wait(proc):
+    """Wait for proc; returns its peak resident memory in bytes, if known."""
+    if not hasattr(os, "wait4"):
+        proc.wait()
+        return None
+    _, status, usage = os.wait4(proc.pid, 0)
+    # Like Popen: the exit code, or minus the signal that killed it
+    if os.WIFSIGNALED(status):
+        proc.returncode = -os.WTERMSIG(status)
+    else:
+        proc.returncode = os.WEXITSTATUS(status)
+    # Kilobytes on Linux, bytes on macOS
+    return usage.ru_maxrss * (1 if sys.platform == "darwin" else 1024)
+
+
+def _kill(proc):
+    """Kill proc with any children it started, which could hold its output."""
+    try:
+        if os.name == "nt":
+            proc.kill()
+        else:
+            os.killpg(proc.pid, signal.SIGKILL)
+    except OSError:
+        pass
+
+
+def _run(command, timeout, on_line):
+    """Run command, passing each line of its output to on_line(line).
+
+    Returns (exit code, peak RSS); the process is killed after timeout
+    seconds.
+    """
+    proc = subprocess.Popen(
+        command,
+        stdin=subprocess.DEVNULL,
+        stdout=subprocess.PIPE,
+        stderr=subprocess.STDOUT,
+        start_new_session=os.name != "nt",
+    )
+    killer = threading.Timer(timeout, _kill, (proc,))
+    killer.start()
+    try:
+        for line in proc.stdout:
+            on_line(line.decode(errors="replace").rstrip())
+        peak_rss = _wait(proc)
+    finally:
+        killer.cancel()
+        proc.stdout.close()
+    return proc.returncode, peak_rss
+
+
+def run_once(executable, timeout=DEFAULT_TIMEOUT):
+    """Start Blender headless once and time it.
+
+    Returns the seconds until the timing script ran ("startup"), until
+    Blender exited ("total") and the peak RSS in bytes (None where the OS
+    doesn't report it).
+    """
+    command = [executable, "-b", "--factory-startup", "--python-expr", TIMING_SCRIPT]
+    started = time.monotonic()
+    startup = []
+
+    def on_line(line):
+        if not startup and line.strip() == READY_MARKER:
+            startup.append(time.monotonic() - started)
+
+    returncode, peak_rss = _run(command, timeout, on_line)
+    total = time.monotonic() - started
+    if returncode or not startup:
+        raise RuntimeError(f"{executable} didn't start (exit code {returncode})")
+    return {
+        "startup": round(startup[0], 3),
+        "total": round(total, 3),
+        "peak_rss": peak_rss,
+    }
+
+
+def launch_times(path, runs=DEFAULT_RUNS, timeout=DEFAULT_TIMEOUT):
+    """Benchmark the startup of the Blender installed at path.
+
+    The first run starts with the install evicted from the page cache
+    (where the OS allows it) and counts as cold, the next runs as warm.
+    """
+    executable = engine.blender_executable(path)
+    logger.info(f"Benchmarking startup of {executable}, {runs} runs")
+    evicted = evict(path)
+    cold = run_once(executable, timeout)
+    warm = [run_once(executable, timeout) for _ in range(runs)]
+    startups = [run["startup"] for run in warm]
+    memory = [run["peak_rss"] for run in [cold] + warm if run["peak_rss"]]
+    return {
+        "time": datetime.now().isoformat(timespec="seconds"),
+        "runs": runs,
+        "cold": cold["startup"],
+        "evicted": evicted,
+        "warm": statistics.median(startups) if startups else None,
+        "warm_min": min(startups, default=None),
+        "peak_rss": max(memory, default=None),
+    }
+
+
+def parse_render_time(line):
+    """Return the seconds of a "Time: 01:02.34 (Saving: ...)" line, or None."""
+    match = RENDER_TIME.match(line)
+    if match is None:
+        return None
+    seconds = 0.0
+    for part in match.group(1).split(":"):
+        seconds = seconds * 60 + float(part)
+    return seconds
+
+
+def render_once(executable, scene, frame=1, timeout=RENDER_TIMEOUT):
+    """Render frame of the .blend file scene on the CPU; returns the seconds.
+
+    The time is the one Blender reports, without loading the file.
+    """
+    times = []
+
+    def on_line(line):
+        seconds = parse_render_time(line)
+        if seconds is not None:
+            times.append(seconds)
+
+    with tempfile.TemporaryDirectory(prefix="blenderupdater-render-") as output:
+        command = [
+            executable,
+            "-b",
+            "--factory-startup",
+            scene,
+            "--python-expr",
+            CPU_SCRIPT,
+            "-o",
+            os.path.join(output, "frame_####"),
+            "-f",
+            str(frame),
+        ]
+        returncode, _ = _run(command, timeout, on_line)
+    if returncode or not times:
+        raise RuntimeError(
+            f"Rendering {scene} failed (exit code {returncode}, "
+            f"{'no' if not times else len(times)} render times)"
+        )
+    return round(sum(times), 3)
+
+
+def render_times(path, scenes, frame=1, timeout=RENDER_TIMEOUT):
+    """Render each scene with the Blender installed at path; seconds per scene."""
+    executable = engine.blender_executable(path)
+    timings = {}
+    for scene in scenes:
+        logger.info(f"Rendering benchmark scene {scene}")
+        timings[scene] = render_once(executable, scene, frame, timeout)
+    return timings
+
+
+def regressions(data, hash_, baseline=BASELINE, threshold=THRESHOLD):
+    """Compare the latest render times of a build to the builds before it.
+
+    data is Results.load(). The baseline of a scene is the median of the
+    latest times of the baseline previous builds (by build date) that
+    rendered it. Returns the scenes slower than the baseline by more than
+    the fraction threshold.
+    """
+    order = list(data)
+
+    def key(build):
+        return data[build].get("date") or "", order.index(build)
+
+    current = data.get(hash_, {}).get("render")
+    if not current:
+        return []
+    earlier = sorted(
+        (
+            build
+            for build in data
+            if build != hash_ and data[build].get("render") and key(build) < key(hash_)
+        ),
+        key=key,
+    )
+    found = []
+    for scene, seconds in current[-1]["scenes"].items():
+        previous = [
+            data[build]["render"][-1]["scenes"][scene]
+            for build in earlier
+            if scene in data[build]["render"][-1]["scenes"]
+        ][-baseline:]
+        if not previous:
+            continue
+        reference = statistics.median(previous)
+        change = seconds / reference - 1 if reference else 0.0
+        if change > threshold:
+            found.append(
+                {
+                    "scene": scene,
+                    "seconds": seconds,
+                    "baseline": reference,
+                    "builds": len(previous),
+                    "change": round(change, 3),
+                }
+            )
+    return found
+
+
+def _identify(config, path, hash_=None):
+    found, version, date = installed_build(config, path)
+    if not (hash_ or found):
+        raise LookupError(f"No installed build known at {path}, give its hash")
+    return hash_ or found, version, date
+
+
+def bench(eng, path=None, runs=None, hash_=None, results=None):
+    """Benchmark an installed build and add the result to its history.
+
+    The build is identified by its hash from the installed versions,
+    unless hash_ is given.
+    """
+    path = path or eng.path
+    section = eng.config.section("benchmark")
+    hash_, version, date = _identify(eng.config, path, hash_)
+    result = launch_times(
+        path,
+        runs or section.get("runs") or DEFAULT_RUNS,
+        section.get("timeout") or DEFAULT_TIMEOUT,
+    )
+    results = results or Results()
+    results.add(hash_, "launch", result, version, date)
+    return {"hash": hash_, "version": version, "launch": result}
+
+
+def bench_render(eng, path=None, scenes=None, hash_=None, results=None):
+    """Render the benchmark scenes with an installed build and check them.
+
+    Scenes default to benchmark.scenes in the settings. The times are
+    added to the history of the build, then compared with the previous
+    builds, see regressions(). Regressions are logged as warnings.
+    """
+    path = path or eng.path
+    section = eng.config.section("benchmark")
+    scenes = scenes or section.get("scenes")
+    if not scenes:
+        raise ValueError("No benchmark scenes configured")
+    hash_, version, date = _identify(eng.config, path, hash_)
+    result = {
+        "time": datetime.now().isoformat(timespec="seconds"),
+        "scenes": render_times(
+            path,
+            scenes,
+            section.get("frame") or 1,
+            section.get("render_timeout") or RENDER_TIMEOUT,
+        ),
+    }
+    results = results or Results()
+    results.add(hash_, "render", result, version, date)
+    found = regressions(
+        results.load(),
+        hash_,
+        section.get("baseline") or BASELINE,
+        section.get("threshold", THRESHOLD),
+    )
+    for regression in found:
+        logger.warning(
+            f"Render regression in {version or hash_}: {regression['scene']} took "
+            f"{regression['seconds']}s, {regression['change']:.0%} slower than "
+            f"{regression['baseline']}s"
+        )
+    return {
+        "hash": hash_,
+        "version": version,
+        "render": result,
+        "regressions": found,
+    }
+
+
+def after_install(eng, path):
+    """Post-install hook: render the benchmark scenes if enabled.
+
+    Returns the report of bench_render(), or None if disabled or failed;
+    a failing benchmark never fails the install.
+    """
+    section = eng.config.section("benchmark")
+    if not section.get("on_install") or not section.get("scenes"):
+        return None
+    try:
+        return bench_render(eng, path)
+    except Exception:
+        logger.exception(f"Render benchmark of {path} failed")
+        return None
@@ -0,0 +1,254 @@
+"""
+    Copyright 2016-2019 Tobias Kummer/Overmind Studios.
+
+    This program is free software: you can redistribute it and/or modify
+    it under the terms of the GNU General Public License as published by
+    the Free Software Foundation, either version 3 of the License, or
+    (at your option) any later version.
+
+    This program is distributed in the hope that it will be useful,
+    but WITHOUT ANY WARRANTY; without even the implied warranty of
+    MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+    GNU General Public License for more details.
+
+    You should have received a copy of the GNU General Public License
+    along with this program.  If not, see <https://www.gnu.org/licenses/>.
+"""
+
+import json
+import logging
+import os
+import re
+import shutil
+import subprocess
+from datetime import datetime
+
+import benchmark
+import engine
+
+logger = logging.getLogger(__name__)
+
+BISECT_DIR = engine.user_cache_dir("bisect")
+STATE_FILE = "bisect.json"
+GOOD, BAD, SKIP = "good", "bad", "skip"
+# Exit code of a test command that can't judge a build, as with git bisect run
+SKIP_CODE = 125
+
+
+def _date(text):
+    """Parse an ISO date as naive local time, like engine.build_datetime()."""
+    try:
+        date = datetime.fromisoformat(text)
+    except ValueError:
+        return None
+    if date.tzinfo is not None:
+        date = date.astimezone().replace(tzinfo=None)
+    return date
+
+
+def resolve(builds, ref, last):
+    """Return the build ref (hash or ISO date) from builds, oldest first.
+
+    For a date this is the last build on or before it (last set) or the
+    first build on or after it. A day without a time covers the whole day.
+    """
+    date = _date(ref)
+    if date is not None and last and len(ref) == len("2021-06-01"):
+        date = date.replace(hour=23, minute=59, second=59)
+    if date is None:
+        matches = [entry for entry in builds if entry["hash"] == ref]
+    elif last:
+        matches = [e for e in builds if engine.build_datetime(e) <= date][-1:]
+    else:
+        matches = [e for e in builds if engine.build_datetime(e) >= date][:1]
+    if not matches:
+        raise LookupError(f"No build {ref} in the history")
+    return matches[0]
+
+
+def command_test(command):
+    """Test that runs a shell command per build.
+
+    The command gets the build's Blender executable, folder and hash in
+    the BLENDER, BLENDER_PATH and BLENDER_HASH environment variables.
+    Exit code 0 means good, 125 skip and anything else bad.
+    """
+
+    def test(entry, path):
+        env = dict(
+            os.environ,
+            BLENDER=engine.blender_executable(path),
+            BLENDER_PATH=path,
+            BLENDER_HASH=entry["hash"],
+        )
+        code = subprocess.run(command, shell=True, env=env).returncode
+        if code == SKIP_CODE:
+            return SKIP
+        return GOOD if code == 0 else BAD
+
+    test.description = f"command: {command}"
+    return test
+
+
+def render_test(eng, scenes=None, threshold=None):
+    """Test that renders the benchmark scenes per build, see benchmark.py.
+
+    The first build tested, the good one, sets the reference times. A build
+    rendering any scene more than threshold (default: benchmark.threshold)
+    slower is bad. All times go into the benchmark history.
+    """
+    section = eng.config.section("benchmark")
+    scenes = scenes or section.get("scenes")
+    if not scenes:
+        raise ValueError("No benchmark scenes configured")
+    if threshold is None:
+        threshold = section.get("threshold", benchmark.THRESHOLD)
+    frame = section.get("frame") or 1
+    timeout = section.get("render_timeout") or benchmark.RENDER_TIMEOUT
+    reference = {}
+
+    def test(entry, path):
+        times = benchmark.render_times(path, scenes, frame, timeout)
+        benchmark.Results().add(
+            entry["hash"],
+            "render",
+            {"time": datetime.now().isoformat(timespec="seconds"), "scenes": times},
+            entry["version"],
+            entry.get("date"),
+        )
+        if not reference:
+            reference.update(times)
+            return GOOD
+        slower = [s for s, t in times.items() if t > reference[s] * (1 + threshold)]
+        return BAD if slower else GOOD
+
+    test.description = f"render: {', '.join(scenes)} > {threshold:.0%}"
+    return test
+
+
+class Bisection:
+    """Binary search for the first bad build between a good and a bad one.
+
+    The builds in between come from the history (see history.py), with
+    the OS, architecture and channel of the good build unless given.
+    Each build tested is extracted to its own folder below directory and
+    kept there, as is its archive in the cache, so going back and forth
+    never downloads a build twice. Verdicts are kept in a state file for
+    the same test, so a bisection can be repeated or continued.
+    """
+
+    def __init__(
+        self,
+        eng,
+        good,
+        bad,
+        test,
+        os_=None,
+        arch=None,
+        channel=None,
+        directory=BISECT_DIR,
+    ):
+        self.engine = eng
+        self.test = test
+        self.directory = directory
+        os_ = os_ or engine.current_os()
+        builds = eng.history.builds(os_=os_)
+        start = resolve(
+            engine.select(builds, arch=arch, channel=channel), good, last=True
+        )
+        # Stay on the platform and channel of the good build
+        candidates = engine.select(
+            eng.history.builds(
+                channel=start["channel"], os_=start["os"], arch=start["arch"]
+            )
+        )
+        end = resolve(candidates, bad, last=False)
+        first, last = candidates.index(start), candidates.index(end)
+        if first >= last:
+            raise ValueError("The good build must be older than the bad one")
+        self.builds = candidates[first : last + 1]
+        self.state_file = os.path.join(directory, STATE_FILE)
+        # Render verdicts depend on the good build as well
+        self.key = f"{test.description} from {self.builds[0]['hash']}"
+        self.verdicts = self._load_verdicts()
+        self.steps = []
+
+    def _load_verdicts(self):
+        try:
+            with open(self.state_file, encoding="utf-8") as f:
+                state = json.load(f)
+        except (OSError, ValueError):
+            return {}
+        if state.get("test") != self.key:
+            return {}
+        return state.get("verdicts", {})
+
+    def _save_verdicts(self):
+        os.makedirs(self.directory, exist_ok=True)
+        with open(self.state_file, "w", encoding="utf-8") as f:
+            json.dump({"test": self.key, "verdicts": self.verdicts}, f)
+
+    def folder(self, entry):
+        arch = re.sub(r"\W+", "_", entry["arch"])
+        return os.path.join(self.directory, f"{entry['os']}-{arch}-{entry['hash']}")
+
+    def prepare(self, entry):
+        """Return the folder of an extracted build, downloading it if needed."""
+        path = self.folder(entry)
+        if os.path.isdir(path):
+            logger.info(f"Reusing {path}")
+            return path
+        archive = self.engine.fetch(entry, prune=False)
+        self.engine.verify(entry, archive)
+        staging = path + ".tmp"
+        shutil.rmtree(staging, ignore_errors=True)
+        folder, _ = engine.extract(archive, staging)
+        os.rename(folder, path)
+        shutil.rmtree(staging, ignore_errors=True)
+        return path
+
+    def check(self, entry, reuse=True):
+        """Test a build (or reuse its verdict); returns good, bad or skip."""
+        key = f"{entry['os']}-{entry['arch']}-{entry['hash']}"
+        verdict = self.verdicts.get(key) if reuse else None
+        if verdict is None:
+            verdict = self.test(entry, self.prepare(entry))
+            self.verdicts[key] = verdict
+            self._save_verdicts()
+        logger.info(f"{entry['version']} ({entry['date']}) is {verdict}")
+        self.steps.append({"hash": entry["hash"], "verdict": verdict})
+        return verdict
+
+    def run(self):
+        """Bisect; returns the last good and first bad build found.
+
+        The ends are always tested first, the good one setting the
+        reference of a render test; a bisection whose good build fails or
+        whose bad build passes stops with ValueError. Builds skipped
+        between the two are listed as "untested".
+        """
+        if self.check(self.builds[0], reuse=False) != GOOD:
+            raise ValueError(f"{self.builds[0]['version']} isn't good")
+        if self.check(self.builds[-1], reuse=False) != BAD:
+            raise ValueError(f"{self.builds[-1]['version']} isn't bad")
+        low, high = 0, len(self.builds) - 1
+        skipped = set()
+        while True:
+            middle = [i for i in range(low + 1, high) if i not in skipped]
+            if not middle:
+                break
+            # The untried build closest to the middle
+            index = min(middle, key=lambda i: abs(i - (low + high) / 2))
+            verdict = self.check(self.builds[index])
+            if verdict == GOOD:
+                low = index
+            elif verdict == BAD:
+                high = index
+            else:
+                skipped.add(index)
+        return {
+            "last_good": self.builds[low],
+            "first_bad": self.builds[high],
+            "untested": [self.builds[i] for i in sorted(skipped) if low < i < high],
+            "steps": self.steps,
+        }
@@ -0,0 +1,218 @@
+"""
+    Copyright 2016-2019 Tobias Kummer/Overmind Studios.
+
+    This program is free software: you can redistribute it and/or modify
+    it under the terms of the GNU General Public License as published by
+    the Free Software Foundation, either version 3 of the License, or
+    (at your option) any later version.
+
+    This program is distributed in the hope that it will be useful,
+    but WITHOUT ANY WARRANTY; without even the implied warranty of
+    MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+    GNU General Public License for more details.
+
+    You should have received a copy of the GNU General Public License
+    along with this program.  If not, see <https://www.gnu.org/licenses/>.
+"""
+
+import json
+import logging
+import os
+import threading
+import urllib.parse
+from http.server import BaseHTTPRequestHandler
+
+import daemon
+import downloads
+
+logger = logging.getLogger(__name__)
+
+# Seconds a client waits for the next chunk of an archive still downloading
+STALL_TIMEOUT = 60
+
+
+def parse_range(header, total):
+    """Return (first, last) of a "bytes=" Range header, None if unsatisfiable."""
+    if not header:
+        return 0, total - 1
+    unit, _, spec = header.partition("=")
+    first, _, last = spec.split(",")[0].strip().partition("-")
+    try:
+        if unit.strip() != "bytes":
+            return None
+        if not first:
+            # Suffix range, the last n bytes
+            first, last = max(total - int(last), 0), total - 1
+        else:
+            first = int(first)
+            last = min(int(last), total - 1) if last else total - 1
+    except ValueError:
+        return None
+    if first > last or first >= total:
+        return None
+    return first, last
+
+
+class CacheServer(daemon.UpdateDaemon):
+    """Serves the catalog and the cached archives to other instances on the LAN.
+
+    Works like the daemon (periodic catalog refresh, pre-downloads of the
+    subscribed channels) but listens on the network and only offers
+    read-only endpoints. An archive that isn't cached yet is fetched
+    upstream once; every client asking for it meanwhile is streamed the
+    growing download.
+    """
+
+    def __init__(self, eng, interval=900, channels=(), host="0.0.0.0", port=8977):
+        # Nothing to authorize, and the daemon's token must stay valid
+        super().__init__(eng, interval, channels, host, port, token_file=None)
+
+    def archive(self, name):
+        """Return the cache path of an archive and the job still writing it.
+
+        The job is None when the archive is complete. Raises LookupError
+        for archives that aren't in the catalog.
+        """
+        if "/" in name or "\\" in name or name.startswith("."):
+            raise LookupError(f"Invalid archive name {name}")
+        path = os.path.join(self.engine.cache, name)
+        if os.path.isfile(path):
+            return path, None
+        entry = next((b for b in self.engine.builds if b["filename"] == name), None)
+        if entry is None:
+            raise LookupError(f"Unknown archive {name}")
+        job = self.engine.submit(entry, path)
+        threading.Thread(target=self._prune_after, args=(job,), daemon=True).start()
+        # A download of the same build elsewhere may have been joined
+        return job.filename, job
+
+    def _prune_after(self, job):
+        """Prune the cache once job is done, like Engine.fetch() does."""
+        try:
+            job.wait()
+            self.engine.prune_cache()
+        except Exception as e:
+            logger.warning(f"Not pruning the cache after {job.url}: {e}")
+
+    def handler(self):
+        return _handler(self)
+
+
+def _handler(server):
+    class Handler(BaseHTTPRequestHandler):
+        def log_message(self, format, *args):
+            logger.debug(format % args)
+
+        def reply(self, code, data):
+            body = json.dumps(data).encode()
+            self.send_response(code)
+            self.send_header("Content-Type", "application/json")
+            self.send_header("Content-Length", str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+
+        def do_GET(self):
+            url = urllib.parse.urlsplit(self.path)
+            query = dict(urllib.parse.parse_qsl(url.query))
+            try:
+                if url.path == "/status":
+                    self.reply(200, server.status())
+                elif url.path == "/catalog":
+                    filters = {
+                        "os_": query.get("os"),
+                        "arch": query.get("arch"),
+                        "channel": query.get("channel"),
+                    }
+                    builds = server.catalog(**filters)
+                    self.reply(200, {"refreshed": server.refreshed, "builds": builds})
+                elif url.path.startswith("/archive/"):
+                    name = urllib.parse.unquote(url.path[len("/archive/") :])
+                    self.send_archive(*server.archive(name))
+                else:
+                    self.reply(404, {"error": "not found"})
+            except LookupError as e:
+                self.reply(404, {"error": str(e)})
+            except (ConnectionError, TimeoutError) as e:
+                logger.info(f"Sending {self.path} aborted: {e}")
+            except Exception as e:
+                logger.exception(f"Request {self.path} failed")
+                self.reply(500, {"error": str(e)})
+
+        def send_archive(self, path, job):
+            if job is not None:
+                job.wait_for(0, STALL_TIMEOUT)
+                if job.finished or not job.total or not job.sequential:
+                    # Without a known size there's no Content-Length to
+                    # send, and the pieces of a swarm download don't
+                    # arrive in order: the client gets the archive once
+                    # it's complete
+                    job.wait()
+                    job = None
+            total = job.total if job else os.path.getsize(path)
+            span = parse_range(self.headers.get("Range"), total)
+            if span is None:
+                self.send_response(416)
+                self.send_header("Content-Range", f"bytes */{total}")
+                self.end_headers()
+                return
+            first, last = span
+            f = self.open(path, job)
+            with f:
+                if self.headers.get("Range"):
+                    self.send_response(206)
+                    self.send_header("Content-Range", f"bytes {first}-{last}/{total}")
+                else:
+                    self.send_response(200)
+                self.send_header("Content-Type", "application/octet-stream")
+                self.send_header("Content-Length", str(last - first + 1))
+                self.send_header("Accept-Ranges", "bytes")
+                self.end_headers()
+                self.copy(f, first, last, job)
+
+        def open(self, path, job):
+            """Open the archive, or the .part file of a running download.
+
+            The open .part file stays readable after the download renames it.
+            """
+            if job is not None:
+                try:
+                    return open(path + ".part", "rb")
+                except FileNotFoundError:
+                    job.wait()
+            return open(path, "rb")
+
+        def copy(self, f, first, last, job):
+            position = first
+            f.seek(first)
+            while position <= last:
+                # Only read what the download has flushed so far
+                available = last + 1 if job is None or job.finished else job.done
+                if job is not None and job.finished and job.error is not None:
+                    raise ConnectionError(f"Upstream download failed: {job.error}")
+                if available <= position:
+                    job.wait_for(position, STALL_TIMEOUT)
+                    if job.done <= position and not job.finished:
+                        raise TimeoutError("Upstream download stalled")
+                    continue
+                f.seek(position)
+                data = f.read(min(downloads.CHUNK_SIZE, available - position))
+                if not data:
+                    raise ConnectionError(f"Archive shorter than {last + 1} bytes")
+                self.wfile.write(data)
+                position += len(data)
+
+    return Handler
+
+
+def from_settings(eng):
+    """Create a cache server configured from the "lan" and "daemon" sections."""
+    lan = eng.config.section("lan")
+    config = eng.config.section("daemon")
+    eng.keep = lan.get("keep", eng.keep)
+    return CacheServer(
+        eng,
+        interval=config.get("interval", 900),
+        channels=config.get("channels", []),
+        host=lan.get("host", "0.0.0.0"),
+        port=lan.get("port", 8977),
+    )
@@ -0,0 +1,59 @@
+"""
+    Copyright 2016-2019 Tobias Kummer/Overmind Studios.
+
+    This program is free software: you can redistribute it and/or modify
+    it under the terms of the GNU General Public License as published by
+    the Free Software Foundation, either version 3 of the License, or
+    (at your option) any later version.
+
+    This program is distributed in the hope that it will be useful,
+    but WITHOUT ANY WARRANTY; without even the implied warranty of
+    MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+    GNU General Public License for more details.
+
+    You should have received a copy of the GNU General Public License
+    along with this program.  If not, see <https://www.gnu.org/licenses/>.
+"""
+
+import threading
+
+# Seconds between checks of blocking waits, well below the 100 ms a
+# cancelled install may take to stop
+POLL_INTERVAL = 0.05
+
+
+class Cancelled(Exception):
+    """Raised inside a pipeline stage when its work was cancelled."""
+
+
+class CancelToken:
+    """Cancellation flag shared by all stages of one install.
+
+    The stages call check() between chunks, archive members or files, so
+    they stop shortly after cancel() is called from any thread.
+    """
+
+    def __init__(self):
+        self._event = threading.Event()
+
+    def cancel(self):
+        self._event.set()
+
+    @property
+    def cancelled(self):
+        return self._event.is_set()
+
+    def check(self):
+        """Raise Cancelled if the token was cancelled."""
+        if self._event.is_set():
+            raise Cancelled()
+
+    def wait(self, timeout=None):
+        """Sleep up to timeout seconds; returns True as soon as cancelled."""
+        return self._event.wait(timeout)
+
+
+def check(cancel):
+    """Like cancel.check(), for optional tokens."""
+    if cancel is not None:
+        cancel.check()
@@ -0,0 +1,457 @@
+"""
+    Copyright 2016-2019 Tobias Kummer/Overmind Studios.
+
+    This program is free software: you can redistribute it and/or modify
+    it under the terms of the GNU General Public License as published by
+    the Free Software Foundation, either version 3 of the License, or
+    (at your option) any later version.
+
+    This program is distributed in the hope that it will be useful,
+    but WITHOUT ANY WARRANTY; without even the implied warranty of
+    MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+    GNU General Public License for more details.
+
+    You should have received a copy of the GNU General Public License
+    along with this program.  If not, see <https://www.gnu.org/licenses/>.
+"""
+
+import argparse
+import concurrent.futures
+import json
+import sys
+import time
+
+import benchmark
+import bisection
+import cacheserver
+import daemon
+import downloads
+import engine
+import logsetup
+import priority
+import profiles
+import scheduler
+import swarm
+
+logger = logsetup.setup_logging()
+
+
+def add_filters(parser):
+    parser.add_argument("--os", dest="os_", choices=("windows", "osx", "linux"))
+    parser.add_argument("--arch", help="substring of the architecture, e.g. x86_64")
+    parser.add_argument("--channel", help="substring of the channel, e.g. alpha")
+    parser.add_argument("--hash", dest="hash_", help="exact build hash")
+
+
+def filters(args):
+    return {
+        "os_": args.os_,
+        "arch": args.arch,
+        "channel": args.channel,
+        "hash_": args.hash_,
+    }
+
+
+def build_parser():
+    parser = argparse.ArgumentParser(
+        prog="cli.py", description="Headless Blender nightly build updater"
+    )
+    parser.add_argument("--log-level", help="DEBUG, INFO, WARNING, ERROR")
+    parser.add_argument(
+        "--url", default=engine.BUILDER_URL, help="builder download page"
+    )
+    parser.add_argument(
+        "--priority", help="resource class of installs, e.g. normal, background, idle"
+    )
+    sub = parser.add_subparsers(dest="command", required=True)
+
+    catalog = sub.add_parser("list", help="list available builds")
+    add_filters(catalog)
+
+    install = sub.add_parser("install", help="install the newest matching build")
+    add_filters(install)
+    install.add_argument("--path", help="installation directory")
+    install.add_argument(
+        "--target",
+        action="append",
+        help="further installation directory, can be repeated",
+    )
+    install.add_argument(
+        "--force", action="store_true", help="install even if already installed"
+    )
+    install.add_argument(
+        "--warm-up",
+        action="store_true",
+        help="precompile the bundled Python afterwards, even if not enabled",
+    )
+
+    fetch = sub.add_parser(
+        "fetch", help="download the newest build for each --os/--hash at once"
+    )
+    fetch.add_argument(
+        "--os", dest="os_", action="append", choices=("windows", "osx", "linux")
+    )
+    fetch.add_argument("--arch", help="substring of the architecture, e.g. x86_64")
+    fetch.add_argument("--channel", help="substring of the channel, e.g. alpha")
+    fetch.add_argument("--hash", dest="hash_", action="append", help="exact build hash")
+    fetch.add_argument("--dest", help="target directory (default: archive cache)")
+    fetch.add_argument(
+        "--rate", type=int, help="bandwidth limit of this run in bytes/s"
+    )
+
+    batch = sub.add_parser("batch", help="update all install profiles at once")
+    batch.add_argument(
+        "--profile", action="append", help="only update this profile, can be repeated"
+    )
+
+    quick = sub.add_parser(
+        "update", help="repeat the last install with the newest build"
+    )
+    quick.add_argument("--path", help="installation directory")
+
+    launch = sub.add_parser("launch", help="start the installed Blender")
+    launch.add_argument("--path", help="installation directory")
+    launch.add_argument("args", nargs="*", help="arguments passed to Blender")
+
+    bench = sub.add_parser(
+        "benchmark", help="time headless startups of an installed build"
+    )
+    bench.add_argument("--path", help="installation directory")
+    bench.add_argument("--runs", type=int, help="number of warm runs")
+    bench.add_argument("--hash", dest="hash_", help="build hash to record it under")
+    bench.add_argument(
+        "--render", action="store_true", help="render the benchmark scenes instead"
+    )
+    bench.add_argument(
+        "--scene", action="append", help=".blend file to render, can be repeated"
+    )
+    bench.add_argument(
+        "--history", action="store_true", help="show the recorded results only"
+    )
+
+    bisect = sub.add_parser(
+        "bisect", help="find the first bad build between a good and a bad one"
+    )
+    add_filters(bisect)
+    bisect.add_argument("--good", required=True, help="good build hash or ISO date")
+    bisect.add_argument("--bad", required=True, help="bad build hash or ISO date")
+    bisect.add_argument(
+        "--command",
+        dest="test",
+        help="test command, gets $BLENDER; exit 0 good, 125 skip, else bad",
+    )
+    bisect.add_argument(
+        "--scene",
+        action="append",
+        help="render this .blend file as the test, can be repeated",
+    )
+    bisect.add_argument(
+        "--threshold", type=float, help="render slowdown that counts as bad, e.g. 0.1"
+    )
+
+    sub.add_parser("status", help="show settings and installed version")
+    sub.add_parser(
+        "priority", help="show the resource classes and their measured throughput"
+    )
+
+    probe = sub.add_parser(
+        "mirrors", help="probe the configured mirrors with the newest matching build"
+    )
+    add_filters(probe)
+    probe.add_argument(
+        "--mirror", action="append", help="mirror base URL, can be repeated"
+    )
+
+    watch = sub.add_parser("watch", help="poll for new builds and stage them")
+    watch.add_argument("--interval", type=int, help="seconds between polls")
+    watch.add_argument(
+        "--channel", action="append", help="channel to watch, can be repeated"
+    )
+    watch.add_argument("--once", action="store_true", help="poll once and exit")
+
+    serve = sub.add_parser("daemon", help="keep the catalog warm and serve a JSON API")
+    serve.add_argument("--port", type=int, help="localhost port (0 picks a free one)")
+    serve.add_argument("--interval", type=int, help="seconds between catalog refreshes")
+    serve.add_argument(
+        "--channel", action="append", help="channel to pre-download, can be repeated"
+    )
+
+    peer = sub.add_parser(
+        "swarm", help="download the newest matching build from the swarm peers"
+    )
+    add_filters(peer)
+    peer.add_argument("--stats", help="write the transfer statistics to this file")
+    peer.add_argument(
+        "--linger", type=float, default=0, help="seconds to keep serving pieces"
+    )
+
+    swarm_bench = sub.add_parser(
+        "swarm-bench", help="benchmark a swarm download with local peer processes"
+    )
+    add_filters(swarm_bench)
+    swarm_bench.add_argument("--peers", type=int, default=4, help="number of peers")
+    swarm_bench.add_argument(
+        "--base-port", type=int, default=8990, help="port of the first peer"
+    )
+
+    lan = sub.add_parser(
+        "serve-cache", help="serve the catalog and cached archives on the LAN"
+    )
+    lan.add_argument("--host", help="address to listen on (default 0.0.0.0)")
+    lan.add_argument("--port", type=int, help="port (0 picks a free one)")
+    lan.add_argument(
+        "--channel", action="append", help="channel to pre-download, can be repeated"
+    )
+    return parser
+
+
+def cmd_list(eng, args):
+    eng.catalog()
+    return {"builds": eng.select(**filters(args))}
+
+
+def cmd_install(eng, args):
+    entry = eng.find(**filters(args))
+    if entry is None:
+        raise LookupError("No build matches the given filters")
+    if eng.is_installed(entry) and not args.force:
+        return {"installed": entry, "skipped": True}
+    path = eng.install(entry, path=args.path, extra=args.target)
+    record = eng.config.get("installed", entry["version"])
+    return {
+        "installed": entry,
+        "path": path,
+        "targets": record["targets"],
+        "extract": record.get("extract"),
+        "warmup": eng.warm_up(path, force=args.warm_up),
+        "benchmark": benchmark.after_install(eng, path),
+        "skipped": False,
+    }
+
+
+def cmd_fetch(eng, args):
+    # Only for this run, on top of downloads.rate
+    throttle = downloads.TokenBucket(args.rate).consume if args.rate else None
+    entries = []
+    for hash_ in args.hash_ or []:
+        entries.append(eng.find(hash_=hash_))
+    for os_ in args.os_ or ([] if args.hash_ else [None]):
+        entries.append(eng.find(os_=os_, arch=args.arch, channel=args.channel))
+    if None in entries:
+        raise LookupError("Not every requested build was found")
+    with concurrent.futures.ThreadPoolExecutor(len(entries)) as pool:
+        # Earlier builds on the command line get the better priority
+        futures = [
+            pool.submit(
+                eng.fetch, entry, dest=args.dest, priority=number, throttle=throttle
+            )
+            for number, entry in enumerate(entries)
+        ]
+        files = [future.result() for future in futures]
+    return {"files": files}
+
+
+def cmd_batch(eng, args):
+    return {"profiles": profiles.batch(eng, args.profile)}
+
+
+def cmd_update(eng, args):
+    entry = eng.quick_target()
+    if entry is None:
+        return {"installed": eng.config.get("main", "installed"), "skipped": True}
+    path = eng.install(entry, path=args.path)
+    return {
+        "installed": entry,
+        "path": path,
+        "warmup": eng.warm_up(path),
+        "benchmark": benchmark.after_install(eng, path),
+        "skipped": False,
+    }
+
+
+def cmd_launch(eng, args):
+    proc = eng.launch(args.path, args.args)
+    return {"pid": proc.pid}
+
+
+def cmd_benchmark(eng, args):
+    if args.history:
+        hash_ = (
+            args.hash_
+            or benchmark.installed_build(eng.config, args.path or eng.path)[0]
+        )
+        return {"hash": hash_, **benchmark.Results().get(hash_)}
+    if args.render or args.scene:
+        return benchmark.bench_render(eng, args.path, args.scene, args.hash_)
+    return benchmark.bench(eng, args.path, args.runs, args.hash_)
+
+
+def cmd_bisect(eng, args):
+    if args.test:
+        test = bisection.command_test(args.test)
+    else:
+        test = bisection.render_test(eng, args.scene, args.threshold)
+    return bisection.Bisection(
+        eng,
+        args.good,
+        args.bad,
+        test,
+        os_=args.os_,
+        arch=args.arch,
+        channel=args.channel,
+    ).run()
+
+
+def cmd_status(eng, args):
+    return {
+        "main": eng.config.section("main"),
+        "installed": eng.config.section("installed"),
+    }
+
+
+def cmd_priority(eng, args):
+    section = eng.config.section("priority")
+    classes = dict(priority.CLASSES, **section.get("classes", {}))
+    return {
+        "class": eng.resource_class or section.get("class"),
+        "classes": {
+            name: priority.Policy.from_settings(eng.config, name).as_dict()
+            for name in classes
+        },
+        "throughput": priority.throughput(eng.config),
+    }
+
+
+def cmd_mirrors(eng, args):
+    entry = eng.find(**filters(args))
+    if entry is None:
+        raise LookupError("No build matches the given filters")
+    if args.mirror:
+        eng.mirrors.bases = args.mirror
+    ranked = eng.mirrors.rank(entry["url"], eng.session)
+    return {
+        "ranking": [base or "origin" for base in ranked],
+        "probes": eng.mirrors.results,
+    }
+
+
+def cmd_watch(eng, args):
+    poller = scheduler.from_settings(eng)
+    if args.interval:
+        poller.interval = args.interval
+    if args.channel:
+        poller.channels = args.channel
+    if args.once:
+        return {"staged": poller.poll()}
+    try:
+        poller.run()
+    except KeyboardInterrupt:
+        poller.stop()
+    return {"staged": list(poller.latest.values())}
+
+
+def cmd_daemon(eng, args):
+    service = daemon.from_settings(eng)
+    if args.port is not None:
+        service.port = args.port
+    if args.interval:
+        service.interval = args.interval
+    if args.channel:
+        service.channels = args.channel
+    try:
+        service.serve_forever()
+    except KeyboardInterrupt:
+        service.stop()
+    return {"stopped": True}
+
+
+def cmd_swarm(eng, args):
+    entry = eng.find(**filters(args))
+    if entry is None:
+        raise LookupError("No build matches the given filters")
+    archive = eng.fetch(entry)
+    peers = swarm.shared_swarm(eng.config, eng.cache)
+    result = peers.results.get(entry["filename"], {})
+    if args.stats:
+        with open(args.stats, "w") as f:
+            json.dump(result, f)
+    if args.linger:
+        time.sleep(args.linger)
+    return {"file": archive, "stats": result}
+
+
+def cmd_swarm_bench(eng, args):
+    entry = eng.find(**filters(args))
+    if entry is None:
+        raise LookupError("No build matches the given filters")
+    return swarm.bench(eng.url, entry["hash"], args.peers, args.base_port)
+
+
+def cmd_serve_cache(eng, args):
+    server = cacheserver.from_settings(eng)
+    if args.host:
+        server.host = args.host
+    if args.port is not None:
+        server.port = args.port
+    if args.channel:
+        server.channels = args.channel
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        server.stop()
+    return {"stopped": True}
+
+
+COMMANDS = {
+    "list": cmd_list,
+    "install": cmd_install,
+    "fetch": cmd_fetch,
+    "batch": cmd_batch,
+    "update": cmd_update,
+    "launch": cmd_launch,
+    "benchmark": cmd_benchmark,
+    "bisect": cmd_bisect,
+    "status": cmd_status,
+    "priority": cmd_priority,
+    "mirrors": cmd_mirrors,
+    "watch": cmd_watch,
+    "daemon": cmd_daemon,
+    "serve-cache": cmd_serve_cache,
+    "swarm": cmd_swarm,
+    "swarm-bench": cmd_swarm_bench,
+}
+
+
+def main(argv=None):
+    args = build_parser().parse_args(argv)
+    if args.log_level:
+        logsetup.set_level(args.log_level)
+    eng = engine.Engine(url=args.url)
+    eng.resource_class = args.priority
+    eng.reap()
+    try:
+        return run(eng, args)
+    finally:
+        # The result is out, finish the deferred cleanup before exiting
+        sys.stdout.flush()
+        eng.reaper.wait()
+
+
+def run(eng, args):
+    """Run a command and print its result as JSON; returns the exit code."""
+    try:
+        result = COMMANDS[args.command](eng, args)
+    except Exception as e:
+        logger.exception(f"Command {args.command} failed")
+        json.dump({"error": str(e)}, sys.stdout)
+        sys.stdout.write("\n")
+        return 1
+    finally:
+        eng.config.flush()
+    json.dump(result, sys.stdout, indent=2)
+    sys.stdout.write("\n")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,251 @@
+"""
+    Copyright 2016-2019 Tobias Kummer/Overmind Studios.
+
+    This program is free software: you can redistribute it and/or modify
+    it under the terms of the GNU General Public License as published by
+    the Free Software Foundation, either version 3 of the License, or
+    (at your option) any later version.
+
+    This program is distributed in the hope that it will be useful,
+    but WITHOUT ANY WARRANTY; without even the implied warranty of
+    MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+    GNU General Public License for more details.
+
+    You should have received a copy of the GNU General Public License
+    along with this program.  If not, see <https://www.gnu.org/licenses/>.
+"""
+
+import hmac
+import json
+import logging
+import os
+import secrets
+import threading
+import urllib.parse
+from datetime import datetime
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import downloads
+import engine
+
+logger = logging.getLogger(__name__)
+
+# Secret POST requests must present, readable only by the user
+TOKEN_FILE = engine.user_cache_dir("daemon.token")
+
+
+def write_token(filename=TOKEN_FILE):
+    """Create a new random token in a file only the user can read."""
+    os.makedirs(os.path.dirname(filename), exist_ok=True)
+    token = secrets.token_hex(32)
+    fd = os.open(filename, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o600)
+    with os.fdopen(fd, "w") as f:
+        os.chmod(filename, 0o600)
+        f.write(token)
+    return token
+
+
+def read_token(filename=TOKEN_FILE):
+    """Return the token of the running daemon, for clients."""
+    with open(filename) as f:
+        return f.read().strip()
+
+
+class UpdateDaemon:
+    """Keeps the build catalog warm and serves it over a localhost JSON API.
+
+    The catalog is refreshed every ``interval`` seconds. After each refresh
+    the newest build of every subscribed channel (for this OS) is downloaded
+    into the engine cache, so installing it later needs no download.
+    Requests that change anything (POST) must send the token written to
+    token_file at startup as "Authorization: Bearer <token>"; they act on
+    the configured install folder only. Without token_file no token is
+    written and POST requests are refused.
+    """
+
+    def __init__(
+        self,
+        eng,
+        interval=900,
+        channels=(),
+        host="127.0.0.1",
+        port=8976,
+        token_file=TOKEN_FILE,
+    ):
+        self.engine = eng
+        self.interval = interval
+        self.channels = list(channels)
+        self.host = host
+        self.port = port
+        self.token_file = token_file
+        self.token = None
+        self.refreshed = None
+        self.error = None
+        self.job = None
+        self._lock = threading.Lock()
+        self._stop = threading.Event()
+        self._server = None
+
+    def refresh(self):
+        """Fetch the catalog now and pre-download subscribed channels."""
+        try:
+            builds = self.engine.catalog(direct=True)
+        except Exception as e:
+            self.error = str(e)
+            logger.error(f"Catalog refresh failed: {e}")
+            return
+        with self._lock:
+            self.refreshed = datetime.now().isoformat(timespec="seconds")
+            self.error = None
+        logger.info(f"Catalog refreshed, {len(builds)} builds")
+        for channel in self.channels:
+            entry = engine.newest(builds, os_=engine.current_os(), channel=channel)
+            if entry is None:
+                continue
+            try:
+                self.engine.fetch(entry)
+            except Exception:
+                logger.exception(f"Pre-download of {entry['filename']} failed")
+
+    def _refresh_loop(self):
+        while not self._stop.is_set():
+            self.refresh()
+            self._stop.wait(self.interval)
+
+    def status(self):
+        with self._lock:
+            return {
+                "refreshed": self.refreshed,
+                "builds": len(self.engine.builds),
+                "error": self.error,
+                "channels": self.channels,
+                "installed": self.engine.config.get("main", "installed"),
+                "job": self.job,
+                "downloads": downloads.shared_queue(self.engine.config).status(),
+            }
+
+    def catalog(self, **filters):
+        with self._lock:
+            if any(filters.values()):
+                return engine.select(self.engine.builds, **filters)
+            return list(self.engine.builds)
+
+    def install(self, hash_):
+        """Start installing a build to the install folder in the background."""
+        with self._lock:
+            if self.job and self.job["state"] == "running":
+                raise RuntimeError("Another install is running")
+            entry = engine.newest(self.engine.builds, hash_=hash_)
+            if entry is None:
+                raise LookupError(f"Unknown build {hash_}")
+            self.job = {"hash": hash_, "state": "running", "stage": None, "error": None}
+        threading.Thread(target=self._install, args=(entry,), daemon=True).start()
+        return self.job
+
+    def _install(self, entry):
+        def stage(name):
+            self.job["stage"] = name
+
+        try:
+            self.engine.install(entry, stage=stage)
+            self.job["state"] = "done"
+        except Exception as e:
+            logger.exception("Install failed")
+            self.job.update(state="failed", error=str(e))
+
+    def launch(self):
+        return {"pid": self.engine.launch().pid}
+
+    def serve_forever(self):
+        """Run the refresh loop and the HTTP API until stop() is called."""
+        if self.token_file:
+            self.token = write_token(self.token_file)
+        threading.Thread(target=self._refresh_loop, daemon=True).start()
+        self._server = ThreadingHTTPServer((self.host, self.port), self.handler())
+        self.port = self._server.server_address[1]
+        logger.info(f"Daemon listening on http://{self.host}:{self.port}")
+        self._server.serve_forever()
+
+    def handler(self):
+        """Return the request handler class serving this daemon."""
+        return _handler(self)
+
+    def stop(self):
+        self._stop.set()
+        if self._server is not None:
+            self._server.shutdown()
+            self._server.server_close()
+
+
+def _handler(daemon):
+    class Handler(BaseHTTPRequestHandler):
+        def log_message(self, format, *args):
+            logger.debug(format % args)
+
+        def reply(self, code, data):
+            body = json.dumps(data).encode()
+            self.send_response(code)
+            self.send_header("Content-Type", "application/json")
+            self.send_header("Content-Length", str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+
+        def do_GET(self):
+            url = urllib.parse.urlsplit(self.path)
+            query = dict(urllib.parse.parse_qsl(url.query))
+            if url.path == "/status":
+                self.reply(200, daemon.status())
+            elif url.path == "/catalog":
+                filters = {
+                    "os_": query.get("os"),
+                    "arch": query.get("arch"),
+                    "channel": query.get("channel"),
+                }
+                builds = daemon.catalog(**filters)
+                self.reply(200, {"refreshed": daemon.refreshed, "builds": builds})
+            else:
+                self.reply(404, {"error": "not found"})
+
+        def authorized(self):
+            expected = f"Bearer {daemon.token}".encode()
+            given = self.headers.get("Authorization", "").encode()
+            return daemon.token is not None and hmac.compare_digest(given, expected)
+
+        def do_POST(self):
+            length = int(self.headers.get("Content-Length", 0))
+            if not self.authorized():
+                self.reply(401, {"error": "missing or wrong token"})
+                return
+            try:
+                data = json.loads(self.rfile.read(length) or b"{}")
+                if not isinstance(data, dict):
+                    raise ValueError("The request body must be a JSON object")
+                if self.path == "/install":
+                    self.reply(202, daemon.install(data["hash"]))
+                elif self.path == "/launch":
+                    self.reply(200, daemon.launch())
+                elif self.path == "/refresh":
+                    daemon.refresh()
+                    self.reply(200, daemon.status())
+                else:
+                    self.reply(404, {"error": "not found"})
+            except (ValueError, KeyError, LookupError) as e:
+                self.reply(400, {"error": str(e)})
+            except RuntimeError as e:
+                self.reply(409, {"error": str(e)})
+            except Exception as e:
+                logger.exception(f"Request {self.path} failed")
+                self.reply(500, {"error": str(e)})
+
+    return Handler
+
+
+def from_settings(eng):
+    """Create a daemon configured from the "daemon" settings section."""
+    config = eng.config.section("daemon")
+    return UpdateDaemon(
+        eng,
+        interval=config.get("interval", 900),
+        channels=config.get("channels", []),
+        port=config.get("port", 8976),
+    )
@@ -0,0 +1,413 @@
+"""
+    Copyright 2016-2019 Tobias Kummer/Overmind Studios.
+
+    This program is free software: you can redistribute it and/or modify
+    it under the terms of the GNU General Public License as published by
+    the Free Software Foundation, either version 3 of the License, or
+    (at your option) any later version.
+
+    This program is distributed in the hope that it will be useful,
+    but WITHOUT ANY WARRANTY; without even the implied warranty of
+    MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+    GNU General Public License for more details.
+
+    You should have received a copy of the GNU General Public License
+    along with this program.  If not, see <https://www.gnu.org/licenses/>.
+"""
+
+import hashlib
+import itertools
+import logging
+import os
+import queue
+import threading
+import time
+
+import requests
+
+from cancellation import POLL_INTERVAL, Cancelled, check
+from locks import FileLock
+
+logger = logging.getLogger(__name__)
+
+CHUNK_SIZE = 256 * 1024
+DEFAULT_PRIORITY = 10
+DEFAULT_WORKERS = 3
+
+
+class IncompleteDownload(Exception):
+    """The server closed the connection before sending the whole file."""
+
+
+def download(url, filename, progress=None, session=None, throttle=None):
+    """Download url to filename, calling progress(done, total) per chunk.
+
+    url may also be a list of URLs serving the same file, e.g. mirrors in
+    order of preference. When one fails, even mid-transfer, the download
+    continues from the next one with a Range request.
+    Data goes to filename.part first, so filename only ever exists complete.
+    throttle(nbytes) is called after every chunk and may sleep to limit the
+    rate or raise Cancelled to abort.
+    """
+    urls = [url] if isinstance(url, str) else list(url)
+    part = filename + ".part"
+    state = {"done": 0, "total": 0}
+    try:
+        with open(part, "wb") as f:
+            for number, source in enumerate(urls, 1):
+                try:
+                    _transfer(source, f, state, progress, session, throttle)
+                    break
+                except (requests.RequestException, IncompleteDownload) as e:
+                    if number == len(urls):
+                        raise
+                    logger.warning(
+                        f"Download from {source} failed after {state['done']} "
+                        f"bytes ({e}), continuing from {urls[number]}"
+                    )
+    except Cancelled:
+        os.remove(part)
+        raise
+    os.replace(part, filename)
+    return filename
+
+
+def _transfer(url, f, state, progress, session, throttle):
+    """Append the rest of url to the open file f, starting at state["done"]."""
+    headers = {"Range": f"bytes={state['done']}-"} if state["done"] else {}
+    with (session or requests).get(
+        url, headers=headers, stream=True, timeout=30
+    ) as req:
+        req.raise_for_status()
+        length = int(req.headers.get("Content-Length", 0))
+        # "bytes <first>-<last>/<total>"
+        content_range = req.headers.get("Content-Range", "")
+        first, _, total = content_range.partition(" ")[2].partition("/")
+        if req.status_code == 206 and first.split("-")[0] == str(state["done"]):
+            if total.isdigit():
+                state["total"] = int(total)
+            else:
+                state["total"] = state["total"] or state["done"] + length
+        else:
+            # Range not honoured, start over
+            f.seek(0)
+            f.truncate()
+            state["done"], state["total"] = 0, length
+        for chunk in req.iter_content(CHUNK_SIZE):
+            f.write(chunk)
+            # Readers of the growing .part file only see flushed data
+            f.flush()
+            state["done"] += len(chunk)
+            if progress:
+                progress(state["done"], state["total"])
+            if throttle:
+                throttle(len(chunk))
+    if state["total"] and state["done"] < state["total"]:
+        raise IncompleteDownload(f"{state['done']} of {state['total']} bytes")
+
+
+def download_once(
+    url, filename, progress=None, session=None, throttle=None, fetcher=None
+):
+    """Download like download() (or fetcher), unless another process does.
+
+    An advisory lock on filename.lock serializes downloads of the same file
+    across processes. A second process waits for the lock, reporting the
+    growth of the other's .part file, and then reuses the finished file.
+    """
+    lock = FileLock(filename + ".lock")
+    part = filename + ".part"
+    while not lock.acquire(timeout=0.5):
+        if progress and os.path.isfile(part):
+            progress(os.path.getsize(part), 0)
+        if throttle:
+            # Lets the waiting download be cancelled
+            throttle(0)
+    try:
+        if os.path.isfile(filename):
+            logger.info(f"{filename} was downloaded by another process")
+            return filename
+        return (fetcher or download)(url, filename, progress, session, throttle)
+    finally:
+        lock.release()
+
+
+def upstream_checksum(urls, session=None):
+    """Return the SHA-256 the builder publishes next to an archive, or None."""
+    for url in urls:
+        try:
+            req = (session or requests).get(url + ".sha256", timeout=10)
+            req.raise_for_status()
+            return req.text.split()[0].lower()
+        except (requests.RequestException, IndexError):
+            continue
+    return None
+
+
+def file_sha256(filename, cancel=None):
+    """Return the hex SHA-256 of a file, checking cancel between chunks."""
+    digest = hashlib.sha256()
+    with open(filename, "rb") as f:
+        for data in iter(lambda: f.read(CHUNK_SIZE), b""):
+            check(cancel)
+            digest.update(data)
+    return digest.hexdigest()
+
+
+class TokenBucket:
+    """Thread-safe token bucket limiting the combined rate of all downloads.
+
+    rate is in bytes per second, 0 or None disables the limit. burst is the
+    number of bytes that may be taken at once after an idle period.
+    """
+
+    def __init__(self, rate=None, burst=None):
+        self.rate = rate
+        self.burst = burst or (rate or 0)
+        self.tokens = self.burst
+        self.stamp = time.monotonic()
+        self._lock = threading.Lock()
+
+    def consume(self, amount):
+        """Take amount tokens, sleeping until enough have accumulated."""
+        if not self.rate:
+            return
+        with self._lock:
+            now = time.monotonic()
+            self.tokens = min(self.burst, self.tokens + (now - self.stamp) * self.rate)
+            self.stamp = now
+            self.tokens -= amount
+            debt = -self.tokens
+        if debt > 0:
+            time.sleep(debt / self.rate)
+
+
+class DownloadJob:
+    """A queued or running download, shared by everyone who asked for the URL.
+
+    waiters counts the requests for it, guarded by lock (the queue's).
+    """
+
+    def __init__(
+        self,
+        url,
+        filename,
+        priority,
+        urls=None,
+        fetcher=None,
+        throttle=None,
+        lock=None,
+    ):
+        self.url = url
+        # Mirrors of url in order of preference, see mirrors.py
+        self.urls = urls or [url]
+        # Called like download(), e.g. Swarm.download from swarm.py
+        self.fetcher = fetcher or download
+        # Extra throttle(nbytes) of the requester, e.g. a write rate limit
+        self.throttle = throttle
+        self.filename = filename
+        self.priority = priority
+        self.state = "queued"
+        self.done = 0
+        self.total = 0
+        self.error = None
+        self.waiters = 1
+        self._lock = lock or threading.Lock()
+        self._callbacks = []
+        self._finished = threading.Event()
+        self._cancelled = threading.Event()
+        self._changed = threading.Condition()
+
+    @property
+    def sequential(self):
+        """Whether the file is written front to back, done being its length."""
+        return self.fetcher is download
+
+    def add_progress(self, callback):
+        if callback:
+            self._callbacks.append(callback)
+
+    def _progress(self, done, total):
+        with self._changed:
+            self.done, self.total = done, total
+            self._changed.notify_all()
+        for callback in list(self._callbacks):
+            callback(done, total)
+
+    def _finish(self):
+        with self._changed:
+            self._finished.set()
+            self._changed.notify_all()
+
+    def cancel(self):
+        """Withdraw one request; the download stops when nobody wants it."""
+        with self._lock:
+            self.waiters -= 1
+            if self.waiters <= 0:
+                self._cancelled.set()
+
+    @property
+    def cancelled(self):
+        return self._cancelled.is_set()
+
+    @property
+    def finished(self):
+        return self._finished.is_set()
+
+    def wait_for(self, done, timeout=None):
+        """Block until more than done bytes arrived or the job finished."""
+        with self._changed:
+            self._changed.wait_for(
+                lambda: self.done > done or self._finished.is_set(), timeout
+            )
+
+    def wait(self, timeout=None, cancel=None):
+        """Block until finished; returns the filename or raises the error.
+
+        When the CancelToken cancel fires first, this request is withdrawn
+        (see cancel()) and Cancelled raised right away; the worker stops at
+        its next chunk unless others still wait for the download.
+        """
+        deadline = None if timeout is None else time.monotonic() + timeout
+        while True:
+            remaining = None if deadline is None else deadline - time.monotonic()
+            if cancel is not None:
+                remaining = min(remaining or POLL_INTERVAL, POLL_INTERVAL)
+            if self._finished.wait(remaining):
+                break
+            if cancel is not None and cancel.cancelled:
+                self.cancel()
+                raise Cancelled()
+            if deadline is not None and time.monotonic() >= deadline:
+                raise TimeoutError(f"Download of {self.url} not finished")
+        if self.error is not None:
+            raise self.error
+        return self.filename
+
+    def as_dict(self):
+        return {
+            "url": self.url,
+            "filename": self.filename,
+            "priority": self.priority,
+            "state": self.state,
+            "done": self.done,
+            "total": self.total,
+            "error": str(self.error) if self.error else None,
+        }
+
+
+class DownloadQueue:
+    """Persistent download queue served by a fixed pool of worker threads.
+
+    Jobs run in priority order (lower first). Submitting a URL that is
+    already queued or running returns the existing job instead of starting
+    a second download. Finished jobs are dropped, their requesters keep
+    them. All workers share one TokenBucket.
+    """
+
+    def __init__(self, workers=DEFAULT_WORKERS, rate=None):
+        self.bucket = TokenBucket(rate)
+        self.jobs = {}
+        self._queue = queue.PriorityQueue()
+        self._order = itertools.count()
+        self._lock = threading.Lock()
+        self._workers = []
+        for number in range(workers):
+            worker = threading.Thread(
+                target=self._work, name=f"Download-{number}", daemon=True
+            )
+            worker.start()
+            self._workers.append(worker)
+
+    def submit(
+        self,
+        url,
+        filename,
+        priority=DEFAULT_PRIORITY,
+        progress=None,
+        urls=None,
+        fetcher=None,
+        throttle=None,
+    ):
+        with self._lock:
+            job = self.jobs.get(url)
+            if (
+                job is not None
+                and job.state in ("queued", "running")
+                and not job.cancelled
+            ):
+                job.waiters += 1
+                job.add_progress(progress)
+                if priority < job.priority and job.state == "queued":
+                    # Re-queue with the better priority, the old entry is skipped
+                    job.priority = priority
+                    self._queue.put((priority, next(self._order), job))
+                logger.debug(f"Joining in-flight download of {url}")
+                return job
+            job = DownloadJob(
+                url, filename, priority, urls, fetcher, throttle, self._lock
+            )
+            job.add_progress(progress)
+            self.jobs[url] = job
+            self._queue.put((priority, next(self._order), job))
+            return job
+
+    def _work(self):
+        session = requests.Session()
+        while True:
+            priority, _, job = self._queue.get()
+            with self._lock:
+                if job.state != "queued" or priority != job.priority:
+                    continue
+                job.state = "running"
+            try:
+                if job.cancelled:
+                    raise Cancelled()
+                download_once(
+                    job.urls,
+                    job.filename,
+                    job._progress,
+                    session,
+                    throttle=lambda nbytes, job=job: self._throttle(job, nbytes),
+                    fetcher=job.fetcher,
+                )
+                job.state = "done"
+            except Exception as e:
+                job.error = e
+                job.state = "cancelled" if isinstance(e, Cancelled) else "failed"
+                logger.error(f"Download of {job.url} {job.state}: {e}")
+            with self._lock:
+                if self.jobs.get(job.url) is job:
+                    del self.jobs[job.url]
+            job._finish()
+
+    def _throttle(self, job, nbytes):
+        if job.cancelled:
+            raise Cancelled()
+        self.bucket.consume(nbytes)
+        if job.throttle:
+            job.throttle(nbytes)
+            # It may have slept until the job was cancelled
+            if job.cancelled:
+                raise Cancelled()
+
+    def status(self):
+        with self._lock:
+            return [job.as_dict() for job in self.jobs.values()]
+
+
+_shared = None
+_shared_lock = threading.Lock()
+
+
+def shared_queue(config=None):
+    """Return the process wide download queue, created from the settings."""
+    global _shared
+    with _shared_lock:
+        if _shared is None:
+            section = config.section("downloads") if config is not None else {}
+            _shared = DownloadQueue(
+                workers=section.get("workers", DEFAULT_WORKERS),
+                rate=section.get("rate") or None,
+            )
+        return _shared
@@ -0,0 +1,1092 @@
+"""
+    Copyright 2016-2019 Tobias Kummer/Overmind Studios.
+
+    This program is free software: you can redistribute it and/or modify
+    it under the terms of the GNU General Public License as published by
+    the Free Software Foundation, either version 3 of the License, or
+    (at your option) any later version.
+
+    This program is distributed in the hope that it will be useful,
+    but WITHOUT ANY WARRANTY; without even the implied warranty of
+    MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+    GNU General Public License for more details.
+
+    You should have received a copy of the GNU General Public License
+    along with this program.  If not, see <https://www.gnu.org/licenses/>.
+"""
+
+import glob
+import hashlib
+import json
+import logging
+import os
+import os.path
+import platform
+import re
+import shutil
+import sqlite3
+import subprocess
+import tempfile
+import time
+from datetime import datetime
+
+import requests
+from bs4 import BeautifulSoup
+
+import archives
+import cancellation
+import downloads
+import history
+import journal
+import mirrors
+import priority
+import reaper
+import settings
+import swarm
+import targets
+import warmup
+from locks import FileLock, is_locked
+
+logger = logging.getLogger(__name__)
+
+BUILDER_URL = "https://builder.blender.org/download/"
+# Top-level folders of a build named after its version, e.g. "2.93"
+VERSION_FOLDER = re.compile(r"\d+\.\d+$")
+
+
+def user_cache_dir(name, system=None):
+    """Per-user directory for cached data, shared by all instances of a user.
+
+    The base can be overridden with the BLENDERUPDATER_CACHE environment
+    variable.
+    """
+    system = system or platform.system()
+    base = os.environ.get("BLENDERUPDATER_CACHE")
+    if not base and system == "Windows":
+        local = os.environ.get("LOCALAPPDATA") or os.path.expanduser("~/AppData/Local")
+        base = os.path.join(local, "BlenderUpdater", "Cache")
+    elif not base and system == "Darwin":
+        base = os.path.expanduser("~/Library/Caches/BlenderUpdater")
+    elif not base:
+        xdg = os.environ.get("XDG_CACHE_HOME") or os.path.expanduser("~/.cache")
+        base = os.path.join(xdg, "BlenderUpdater")
+    return os.path.join(base, name)
+
+
+STAGING_DIR = user_cache_dir("staging")
+CACHE_DIR = user_cache_dir("archives")
+HISTORY_FILE = user_cache_dir("history.sqlite")
+# Builds parsed from the builder page, one file per URL; the settings only
+# keep the validators of the conditional request
+CATALOG_DIR = user_cache_dir("catalogs")
+CACHE_KEEP = 3
+# Temporary extraction folder of versions before 1.9.10, relative to the
+# working directory
+LEGACY_STAGING = "blendertemp"
+
+# Archive types that can't be installed by copying files
+SKIP_TYPES = ("msix", "msi", "sha256")
+
+# Filename markers and the names shown for the last downloaded flavor
+LASTDL_NAMES = (
+    ("macOS", "OSX"),
+    ("win32", "Windows 32bit"),
+    ("win64", "Windows 64bit"),
+    ("glibc211-i686", "Linux glibc211 i686"),
+    ("glibc211-x86_64", "Linux glibc211 x86_64"),
+    ("glibc219-i686", "Linux glibc219 i686"),
+    ("glibc219-x86_64", "Linux glibc219 x86_64"),
+)
+
+
+def human_size(num):
+    """Translate to human readable file size."""
+    for x in [" bytes", " KB", " MB", " GB"]:
+        if num < 1024.0:
+            return "%3.1f%s" % (num, x)
+        num /= 1024.0
+    return "%3.1f%s" % (num, " TB")
+
+
+def current_os():
+    """Return the catalog name of the running operating system."""
+    system = platform.system()
+    if system == "Windows":
+        return "windows"
+    if system == "Darwin":
+        return "osx"
+    return "linux"
+
+
+def _clean(text):
+    """Removes spaces and uneeded characters from the given text."""
+    return text.strip().strip("\xa0")
+
+
+def _parse_description(element):
+    """Parses the given description element.
+
+    Input text may look like:
+    <span>May 24, 07:44:19 - blender-v283-release - d553edeb7dbb - zip - 171.79MB</span>
+    """
+    if element is None:
+        return None
+
+    parts = element.text.split(" - ")
+    output = {}
+    output["date"] = _clean(parts[0])
+    output["hash"] = _clean(parts[1])
+    output["type"] = _clean(parts[2])
+    output["size"] = _clean(parts[3])
+    return output
+
+
+def parse_catalog(html):
+    """Parse the builder download page into a list of build entries."""
+    soup = BeautifulSoup(html, "html.parser")
+    results = []
+    for li in soup.find_all("li", class_="os"):
+        description_element = li.find("div", class_="name").find("small")
+        arch = li.find("span", class_="build").find(text=True, recursive=False)
+        channel = li.find("span", class_="build-var").text
+        name = li.find("div", class_="name").find(text=True, recursive=False)
+        url = li.find("a", href=True)["href"]
+
+        description_data = _parse_description(description_element)
+        if description_data is None:
+            continue
+
+        info = {}
+        info["arch"] = _clean(arch)
+        info["build_date"] = description_data["date"]
+        info["channel"] = _clean(channel)
+        info["filename"] = _clean(url).split("/")[-1]
+        info["hash"] = description_data["hash"]
+        info["name"] = _clean(name) + " " + _clean(channel)
+        info["size"] = description_data["size"]
+        info["type"] = description_data["type"]
+        info["url"] = _clean(url)
+        info["version"] = name + "_" + description_data["hash"]
+
+        # Set "os" based on URL
+        if "windows" in _clean(url):
+            info["os"] = "windows"
+        elif "darwin" in _clean(url):
+            info["os"] = "osx"
+        else:
+            info["os"] = "linux"
+
+        results.append(info)
+    return results
+
+
+def fetch_catalog(url=BUILDER_URL, session=None):
+    """Download and parse the list of available builds."""
+    req = (session or requests).get(url, timeout=30)
+    req.raise_for_status()
+    return parse_catalog(req.text)
+
+
+def fetch_catalog_cached(url, cached=None, session=None):
+    """Fetch the catalog unless it didn't change since the cached fetch.
+
+    cached is the dict returned by a previous call (validators plus the
+    parsed builds). Returns the builds and the dict to cache for next time.
+    """
+    headers = {}
+    if cached and cached.get("builds"):
+        if cached.get("etag"):
+            headers["If-None-Match"] = cached["etag"]
+        if cached.get("modified"):
+            headers["If-Modified-Since"] = cached["modified"]
+    req = (session or requests).get(url, headers=headers, timeout=30)
+    if req.status_code == 304:
+        logger.debug("Catalog not modified, using cached builds")
+        return cached["builds"], cached
+    req.raise_for_status()
+    builds = parse_catalog(req.text)
+    cached = {
+        "etag": req.headers.get("ETag"),
+        "modified": req.headers.get("Last-Modified"),
+        "builds": builds,
+    }
+    return builds, cached
+
+
+def build_datetime(entry, now=None):
+    """Return the build date of an entry as datetime.
+
+    The builder page leaves out the year, so dates that would lie in the
+    future are taken from the previous year. Entries from the history
+    carry the full date.
+    """
+    if entry.get("date"):
+        return datetime.fromisoformat(entry["date"])
+    now = now or datetime.now()
+    try:
+        date = datetime.strptime(entry["build_date"], "%B %d, %H:%M:%S")
+    except ValueError:
+        try:
+            date = datetime.strptime(entry["build_date"], "%b %d, %H:%M:%S")
+        except ValueError:
+            return datetime.min
+    date = date.replace(year=now.year)
+    if date > now:
+        date = date.replace(year=now.year - 1)
+    return date
+
+
+def select(builds, os_=None, arch=None, channel=None, hash_=None, installable=True):
+    """Filter build entries.
+
+    os_ and hash_ must match exactly, arch and channel are matched as case
+    insensitive substrings. Unset filters match everything.
+    """
+    selected = []
+    for entry in builds:
+        if installable and entry["type"] in SKIP_TYPES:
+            continue
+        if os_ and entry["os"] != os_:
+            continue
+        if arch and arch.lower() not in entry["arch"].lower():
+            continue
+        if channel and channel.lower() not in entry["channel"].lower():
+            continue
+        if hash_ and entry["hash"] != hash_:
+            continue
+        selected.append(entry)
+    return selected
+
+
+def newest(builds, **filters):
+    """Return the most recent entry matching the filters, or None."""
+    selected = select(builds, **filters)
+    if not selected:
+        return None
+    return max(selected, key=build_datetime)
+
+
+def install_key(version, profile=None):
+    """Key of an install record in the "installed" settings section.
+
+    Profiles get their own records, so two of them installing the same
+    build to different folders don't overwrite each other's path.
+    """
+    return f"{profile}:{version}" if profile else version
+
+
+def lastdl_name(filename):
+    """Return the display name for the flavor of an archive, or None."""
+    for marker, name in LASTDL_NAMES:
+        if marker in filename:
+            return name
+    return None
+
+
+def extract(archive, staging, cancel=None, throttle=None, rules=None):
+    """Unpack archive into staging; returns the build folder and file counts.
+
+    Members excluded by rules (see archives.Rules) are skipped.
+    """
+    stats = archives.extract(archive, staging, cancel, throttle, rules)
+    if stats["skipped_files"]:
+        logger.info(
+            f"Extracted {stats['files']} files ({human_size(stats['bytes'])}), "
+            f"skipped {stats['skipped_files']} files "
+            f"({human_size(stats['skipped_bytes'])})"
+        )
+    folders = [name for name in next(os.walk(staging))[1] if not name.startswith(".")]
+    return os.path.join(staging, folders[0]), stats
+
+
+def copy(source, target):
+    """Copy an extracted build over the installation directory."""
+    targets.place_tree(source, target, methods=("copy",))
+
+
+def staged_path(entry, path):
+    """Directory a build is staged in, next to path so it can be renamed in."""
+    path = os.path.normpath(os.path.abspath(path))
+    parent, base = os.path.split(path)
+    return os.path.join(parent, f".{base}.staged-{entry['hash']}")
+
+
+def old_path(path, stamp="*"):
+    """Directory a replaced build is moved to by swap()."""
+    path = os.path.normpath(os.path.abspath(path))
+    parent, base = os.path.split(path)
+    return os.path.join(parent, f".{base}.old-{stamp}")
+
+
+def replaceable(path, staged):
+    """Whether path may be swapped out as a whole for the staged build.
+
+    That is the case if it is empty or holds just a Blender install: the
+    executable and nothing but files of the staged build and version
+    folders. Anything else could be the user's and is kept.
+    """
+    names = os.listdir(path)
+    if not names:
+        return True
+    if not os.path.exists(blender_executable(path)):
+        return False
+    known = set(os.listdir(staged))
+    return all(name in known or VERSION_FOLDER.match(name) for name in names)
+
+
+def restore(path):
+    """Move the newest build replaced by swap() back to a missing path.
+
+    Returns whether there was one, i.e. a swap was interrupted between
+    its two renames.
+    """
+    old = sorted(glob.glob(old_path(path)), key=os.path.getmtime)
+    if os.path.exists(path) or not old:
+        return False
+    logger.info(f"Swap into {path} was interrupted, restoring {old[-1]}")
+    os.rename(old[-1], path)
+    return True
+
+
+def swap(staged, path):
+    """Replace path with the staged build directory.
+
+    Both directories are renamed, which is atomic on the same filesystem.
+    If path can't be renamed (e.g. it is a mount point) the staged files
+    are copied over it instead. Returns the directory left to delete (the
+    replaced build or the copied one), or None.
+    """
+    path = os.path.normpath(os.path.abspath(path))
+    if not os.path.exists(path):
+        # Interrupted between the two renames, or a first install
+        os.rename(staged, path)
+        return None
+    old = old_path(path, int(time.time()))
+    try:
+        os.rename(path, old)
+    except OSError:
+        logger.info(f"Unable to rename {path}, copying staged build instead")
+        copy(staged, path)
+        return staged
+    try:
+        os.rename(staged, path)
+    except OSError:
+        os.rename(old, path)
+        raise
+    return old
+
+
+def blender_executable(path, system=None):
+    """Return the path of the Blender binary inside an installation."""
+    system = system or platform.system()
+    if system == "Windows":
+        return os.path.join(path, "blender.exe")
+    if system == "Darwin":
+        return os.path.join(path, "blender.app", "Contents", "MacOS", "Blender")
+    return os.path.join(path, "blender")
+
+
+def launch(path, args=(), system=None):
+    """Start Blender from an installation directory."""
+    executable = blender_executable(path, system)
+    if not os.access(executable, os.X_OK) and os.path.isfile(executable):
+        os.chmod(executable, 0o755)
+    logger.info(f"Executing {executable}")
+    return subprocess.Popen([executable, *args])
+
+
+class Engine:
+    """Update workflow shared by the GUI and the command line.
+
+    Keeps the settings and the last fetched catalog; all methods are plain
+    blocking calls, the callers decide which thread they run on.
+    """
+
+    STAGES = journal.PHASES
+
+    def __init__(
+        self, config=None, staging=STAGING_DIR, url=BUILDER_URL, cache=CACHE_DIR
+    ):
+        self.config = config if config is not None else settings.Settings()
+        self.staging = staging
+        self.journals = os.path.join(staging, "journal")
+        self.cache = cache
+        self.keep = CACHE_KEEP
+        self.url = url
+        self.session = requests.Session()
+        self.mirrors = mirrors.from_settings(self.config, url)
+        self.history = history.History(HISTORY_FILE)
+        self.reaper = reaper.shared_reaper()
+        # Overrides the resource class of the settings and profiles
+        self.resource_class = None
+        self.builds = []
+        self.prefetcher = None
+
+    @property
+    def path(self):
+        return self.config.get("main", "path")
+
+    @path.setter
+    def path(self, value):
+        self.config.set("main", "path", value)
+
+    def catalog(self, direct=False):
+        """Fetch the current list of builds.
+
+        Unless direct is set, the in-memory catalog of a configured daemon
+        or LAN cache server is used; the builder page is only fetched when
+        neither can be reached. The builder page is requested conditionally;
+        on 304 the builds parsed last time are read back from CATALOG_DIR.
+        """
+        builds = None
+        if not direct:
+            for name, section in (("Daemon", "daemon"), ("LAN cache", "lan")):
+                base = self.config.get(section, "url")
+                if base and builds is None:
+                    builds = self._remote_catalog(name, base)
+        if builds is None:
+            validators = self.config.get("cache", self.url)
+            cached = None
+            if validators:
+                cached = dict(validators, builds=self._load_catalog())
+            builds, fresh = fetch_catalog_cached(self.url, cached, self.session)
+            if fresh is not cached:
+                self._save_catalog(builds)
+                validators = {"etag": fresh["etag"], "modified": fresh["modified"]}
+                self.config.set("cache", self.url, validators)
+        self.builds = builds
+        try:
+            self.history.add(builds, build_datetime)
+        except (OSError, sqlite3.Error) as e:
+            logger.warning(f"Unable to update the build history: {e}")
+        lastcheck = datetime.now().strftime("%a %b %d %H:%M:%S %Y")
+        self.config.set("main", "lastcheck", lastcheck)
+        logger.info(f"Found {len(self.builds)} builds")
+        return self.builds
+
+    def _catalog_file(self):
+        key = hashlib.sha1(self.url.encode()).hexdigest()[:12]
+        return os.path.join(CATALOG_DIR, f"{key}.json")
+
+    def _load_catalog(self):
+        try:
+            with open(self._catalog_file(), encoding="utf-8") as f:
+                return json.load(f)
+        except (OSError, ValueError):
+            return None
+
+    def _save_catalog(self, builds):
+        os.makedirs(CATALOG_DIR, exist_ok=True)
+        fd, tmp = tempfile.mkstemp(dir=CATALOG_DIR, suffix=".tmp")
+        try:
+            with os.fdopen(fd, "w", encoding="utf-8") as f:
+                json.dump(builds, f)
+            os.replace(tmp, self._catalog_file())
+        except OSError as e:
+            logger.warning(f"Unable to cache the catalog: {e}")
+            if os.path.exists(tmp):
+                os.remove(tmp)
+
+    def _remote_catalog(self, name, base):
+        """Return the catalog of a daemon or cache server, None if unavailable."""
+        try:
+            req = self.session.get(base.rstrip("/") + "/catalog", timeout=5)
+            req.raise_for_status()
+            data = req.json()
+            if data["refreshed"]:
+                return data["builds"]
+        except (requests.RequestException, ValueError, KeyError):
+            logger.warning(f"{name} at {base} not available")
+        return None
+
+    def policy(self, name=None):
+        """Return a fresh resource class (default: priority.class), see priority.py."""
+        return priority.Policy.from_settings(self.config, self.resource_class or name)
+
+    def rules(self, profile=None):
+        """Return the extraction rules of a profile or the "install" section.
+
+        A profile's include and exclude lists replace those of the section.
+        """
+        section = self.config.section("install")
+        values = self.config.get("profiles", profile) or {} if profile else {}
+        return archives.Rules(
+            values.get("include", section.get("include")),
+            values.get("exclude", section.get("exclude")),
+        )
+
+    def select(self, **filters):
+        return select(self.builds, **filters)
+
+    def find(self, hash_=None, **filters):
+        """Return the newest build matching a hash and/or filters.
+
+        A hash no longer listed in the catalog is looked up in the history.
+        """
+        if not self.builds:
+            self.catalog()
+        entry = newest(self.builds, hash_=hash_, **filters)
+        if entry is None and hash_:
+            entry = newest(self.history.find(hash_), **filters)
+        return entry
+
+    def is_installed(self, entry, profile=None):
+        if profile:
+            state = self.config.get("profile_state", profile) or {}
+            return entry["version"] == state.get("installed")
+        return entry["version"] == self.config.get("main", "installed")
+
+    def quick_target(self):
+        """Return the build a one-click update would install, or None.
+
+        Uses the os/arch/channel of the last install and returns None if the
+        newest matching build is already installed.
+        """
+        main = self.config.section("main")
+        if not main.get("flavor"):
+            raise LookupError("No previous install to repeat")
+        self.catalog()
+        entry = newest(
+            self.builds,
+            os_=main.get("os") or current_os(),
+            arch=main["flavor"],
+            channel=main.get("channel"),
+        )
+        if entry is None:
+            raise LookupError("No build matches the last install")
+        if self.is_installed(entry):
+            logger.info(f"{entry['version']} is already installed")
+            return None
+        return entry
+
+    def cached(self, entry):
+        """Return the cache path of a build archive if it was downloaded."""
+        archive = os.path.join(self.cache, entry["filename"])
+        return archive if os.path.isfile(archive) else None
+
+    def fetch(
+        self,
+        entry,
+        progress=None,
+        dest=None,
+        priority=downloads.DEFAULT_PRIORITY,
+        prune=True,
+        cancel=None,
+        throttle=None,
+    ):
+        """Download a build archive into the cache (or dest), unless it is there.
+
+        The download goes through the shared download queue, so concurrent
+        requests for the same build share one transfer. It starts at the
+        fastest configured mirror and fails over to the others. A running
+        prefetch of the same archive is sped up and joined, a prefetch of
+        anything else is cancelled. Waiting stops with Cancelled when the
+        CancelToken cancel fires. throttle(nbytes) is called per chunk
+        received, see priority.py.
+        """
+        prefetch = self.prefetcher
+        if prefetch is not None and prefetch.running:
+            if prefetch.entry["filename"] == entry["filename"]:
+                prefetch.hurry()
+            else:
+                prefetch.cancel()
+        directory = dest or self.cache
+        archive = os.path.join(directory, entry["filename"])
+        if os.path.isfile(archive):
+            logger.info(f"Using cached {entry['filename']}")
+            if progress:
+                size = os.path.getsize(archive)
+                progress(size, size)
+            return archive
+        job = self.submit(entry, archive, priority, progress, throttle)
+        result = job.wait(cancel=cancel)
+        if result != archive:
+            # Joined a download of the same build to another directory
+            shutil.copyfile(result, archive)
+        if dest is None and prune:
+            self.prune_cache()
+        return archive
+
+    def submit(
+        self,
+        entry,
+        archive,
+        priority=downloads.DEFAULT_PRIORITY,
+        progress=None,
+        throttle=None,
+    ):
+        """Queue the download of a build to archive; returns the DownloadJob."""
+        os.makedirs(os.path.dirname(archive) or ".", exist_ok=True)
+        logger.info(f"Downloading {entry['url']}")
+        urls = self.mirrors.urls(entry["url"], self.session)
+        fetcher = None
+        if self.config.get("swarm", "enabled"):
+            fetcher = swarm.shared_swarm(self.config, self.cache).download
+        return downloads.shared_queue(self.config).submit(
+            entry["url"], archive, priority, progress, urls, fetcher, throttle
+        )
+
+    def prune_cache(self, keep=None):
+        """Delete all but the keep most recently downloaded archives.
+
+        keep defaults to the keep attribute. Archives within the retention
+        of an install profile are kept too.
+        """
+        keep = keep or self.keep
+        if not os.path.isdir(self.cache):
+            return
+        protected = set()
+        profiles = self.config.section("profiles")
+        for name, state in self.config.section("profile_state").items():
+            retention = profiles.get(name, {}).get("retention", 1)
+            protected.update(state.get("history", [])[-retention:])
+        archives = [
+            os.path.join(self.cache, name)
+            for name in os.listdir(self.cache)
+            if not name.endswith((".part", ".lock")) and name not in protected
+        ]
+        archives.sort(key=os.path.getmtime, reverse=True)
+        for archive in archives[keep:]:
+            logger.info(f"Removing cached {archive}")
+            os.remove(archive)
+
+    def staged(self, entry, path=None):
+        """Return the staged directory of a build if it is ready to swap in."""
+        staged = staged_path(entry, path or self.path)
+        return staged if os.path.isdir(staged) else None
+
+    def stage(self, entry, path=None, progress=None, policy=None):
+        """Download and extract a build next to path, ready to be swapped in.
+
+        Another process staging the same build is waited for. The calling
+        thread takes on the resource class policy (default: from the
+        settings), see priority.py.
+        """
+        path = path or self.path
+        staged = staged_path(entry, path)
+        if os.path.isdir(staged):
+            return staged
+        policy = policy or self.policy()
+        policy.apply()
+        with FileLock(staged + ".lock"):
+            if os.path.isdir(staged):
+                return staged
+            archive = self.fetch(entry, progress, throttle=policy.throttle("download"))
+            self.verify(entry, archive)
+            staged, _ = self._extract_staged(
+                entry,
+                path,
+                archive,
+                throttle=policy.throttle("extract"),
+                rules=self.rules(),
+            )
+            return staged
+
+    def _extract_staged(
+        self, entry, path, archive, cancel=None, throttle=None, rules=None
+    ):
+        staged = staged_path(entry, path)
+        tmp = staged + ".tmp"
+        self.reaper.discard(tmp)
+        logger.info(f"Extracting {entry['filename']} to {staged}")
+        try:
+            folder, stats = extract(archive, tmp, cancel, throttle, rules)
+            os.rename(folder, staged)
+        except cancellation.Cancelled:
+            self.reaper.discard(tmp)
+            raise
+        shutil.rmtree(tmp)
+        return staged, stats
+
+    def verify(self, entry, archive, cancel=None):
+        """Check an archive against the checksum published next to it.
+
+        A corrupt archive is deleted and IOError raised. Returns the
+        checksum, or None if the server doesn't publish one. The checksum
+        is kept in the history, which covers builds no longer published.
+        """
+        urls = self.mirrors.urls(entry["url"], self.session)
+        checksum = downloads.upstream_checksum(urls, self.session)
+        checksum = checksum or entry.get("checksum")
+        if checksum is None:
+            logger.warning(f"No checksum published for {entry['filename']}")
+            return None
+        if downloads.file_sha256(archive, cancel) != checksum:
+            os.remove(archive)
+            raise IOError(f"Checksum mismatch, deleted {archive}")
+        logger.info(f"Verified {entry['filename']}")
+        try:
+            self.history.set_checksum(entry["filename"], checksum)
+        except (OSError, sqlite3.Error) as e:
+            logger.warning(f"Unable to update the build history: {e}")
+        return checksum
+
+    def pending(self):
+        """Return the journals of installs that were interrupted."""
+        return journal.Journal.pending(self.journals)
+
+    def resume(
+        self,
+        record,
+        progress=None,
+        stage=None,
+        target_progress=None,
+        cancel=None,
+        policy=None,
+    ):
+        """Continue an interrupted install from its journal."""
+        return self.install(
+            record.entry,
+            record.path,
+            progress,
+            stage,
+            target_progress=target_progress,
+            cancel=cancel,
+            policy=policy,
+        )
+
+    def install(
+        self,
+        entry,
+        path=None,
+        progress=None,
+        stage=None,
+        extra=None,
+        target_progress=None,
+        profile=None,
+        cancel=None,
+        policy=None,
+    ):
+        """Download, verify, extract and swap a build into path and the extra targets.
+
+        Each of STAGES is recorded in an install journal before the next
+        begins, and stage(name) is called after it. An install interrupted
+        by a crash or an error continues at the first incomplete stage when
+        it is started again. The build is extracted next to path and
+        renamed into place, a build staged for path beforehand is used as
+        is. The extra targets are written from the extracted build in
+        parallel, each with the fastest method it supports (see
+        targets.py); a failing one doesn't affect the others.
+        progress(done, total) reports download bytes and
+        target_progress(target, done, total) files per target. The
+        installed version is recorded only after the swap. Installs for a
+        profile are recorded in its profile_state instead of the main
+        settings.
+
+        Every stage stops with Cancelled shortly after the CancelToken
+        cancel fires; the partial download and the extracted build are
+        removed and the journal discarded. Only an install already writing
+        path or the extra targets keeps its journal to be finished later.
+        The swap itself can't be cancelled.
+
+        The calling thread and the threads writing the targets run under
+        the resource class policy (default: from the settings), which also
+        caps parallel targets and disk writes; the throughput per stage is
+        recorded in the "metrics" settings, see priority.py.
+        """
+        path = path or self.path
+        if path:
+            restore(path)
+        if not path or not os.path.isdir(path):
+            raise NotADirectoryError(f"Not a valid destination directory: {path}")
+        if extra is None:
+            extra = self.config.get("main", "targets") or []
+        extra = [t for t in extra if os.path.normpath(t) != os.path.normpath(path)]
+        stage = stage or (lambda name: None)
+        policy = policy or self.policy()
+        policy.apply()
+        record = journal.Journal.open(
+            self.journals, entry, path, extra=extra, profile=profile
+        )
+        if record.phase:
+            logger.info(f"Resuming install of {entry['version']} after {record.phase}")
+        extra = record.get("extra", extra)
+        profile = profile or record.get("profile")
+        name = lastdl_name(entry["filename"])
+        if name and not profile:
+            self.config.set("main", "lastdl", name)
+
+        staged = record.get("staged") or staged_path(entry, path)
+        mode = record.get("mode", "swap")
+        if not record.done("extracted") and os.path.isdir(staged):
+            # Staged in the background beforehand, see scheduler.py
+            logger.info(f"Using staged build {staged}")
+            record.advance("extracted", staged=staged, mode=mode)
+        elif record.done("extracted") and not record.done("swapped"):
+            if not os.path.isdir(staged):
+                if record.get("swapping") and os.path.isdir(path):
+                    # Interrupted right after the swap
+                    self._record(
+                        entry,
+                        path,
+                        record.get("results"),
+                        profile,
+                        record.get("extract"),
+                    )
+                    self.config.flush()
+                    record.advance("swapped")
+                else:
+                    # Lost, e.g. deleted by hand, extract again
+                    record.reset("verified")
+
+        writing = False
+        try:
+            if not record.done("extracted"):
+                archive = self.cached(entry)
+                if not record.done("downloaded") or archive is None:
+                    with policy.measure("download"):
+                        archive = self.fetch(
+                            entry,
+                            progress,
+                            cancel=cancel,
+                            throttle=policy.throttle("download"),
+                        )
+                    record.advance("downloaded")
+                stage("downloaded")
+                if not record.done("verified"):
+                    with policy.measure("verify", os.path.getsize(archive)):
+                        self.verify(entry, archive, cancel)
+                    record.advance("verified")
+                stage("verified")
+                with policy.measure("extract"):
+                    staged, mode, stats = self._extract_for(
+                        entry,
+                        path,
+                        archive,
+                        record,
+                        cancel,
+                        policy.throttle("extract"),
+                        self.rules(profile),
+                    )
+                record.advance("extracted", staged=staged, mode=mode, extract=stats)
+            else:
+                stage("downloaded")
+                stage("verified")
+            stage("extracted")
+
+            if not record.done("swapped"):
+                cancellation.check(cancel)
+                methods = self.config.get("install", "methods") or targets.METHODS
+                logger.info(f"Installing to {', '.join([path] + extra)}")
+                place = dict(
+                    workers=policy.workers,
+                    cancel=cancel,
+                    throttle=policy.throttle("copy"),
+                    initializer=policy.apply,
+                )
+                if mode == "swap" and not replaceable(path, staged):
+                    logger.info(f"{path} holds other files, copying into it")
+                    mode = "merge"
+                    record.advance("extracted", mode=mode)
+                if mode == "swap":
+                    # The extra targets are written in place, so from here
+                    # on a cancelled install is kept to be finished later
+                    writing = bool(extra)
+                    with policy.measure("copy"):
+                        results = targets.place_all(
+                            staged, extra, methods, target_progress, **place
+                        )
+                    results[path] = {"ok": True, "method": "swap", "error": None}
+                    record.advance("extracted", swapping=True, results=results)
+                    superseded = swap(staged, path)
+                    if superseded:
+                        self.reaper.discard(superseded)
+                else:
+                    writing = True
+                    with policy.measure("copy"):
+                        results = targets.place_all(
+                            staged, [path] + extra, methods, target_progress, **place
+                        )
+                    if not results[path]["ok"]:
+                        raise OSError(
+                            f"Writing {path} failed: {results[path]['error']}"
+                        )
+                self._record(entry, path, results, profile, record.get("extract"))
+                priority.record(self.config, policy)
+                # The journal must not claim more than the settings file has
+                self.config.flush()
+                record.advance("swapped")
+        except cancellation.Cancelled:
+            if writing:
+                written = extra if mode == "swap" else [path] + extra
+                logger.warning(
+                    f"Install cancelled, {', '.join(written)} partially written"
+                )
+            else:
+                logger.info(f"Install of {entry['version']} cancelled")
+                self._discard(record, staged, mode)
+            raise
+        stage("swapped")
+
+        # The rest only queues deletions for the reaper, the install is done
+        if mode == "merge":
+            self.reaper.discard(staged)
+        elif mode == "copy":
+            self.reaper.discard(self._copy_staging(record))
+        record.remove()
+        stage("cleaned")
+        return path
+
+    def _extract_for(
+        self, entry, path, archive, record, cancel=None, throttle=None, rules=None
+    ):
+        """Extract a build for installing to path; returns (folder, mode, stats).
+
+        The build goes next to path so it can be swapped in ("swap"), or
+        copied into it if path holds anything else ("merge", decided when
+        installing, see replaceable()). If the parent of path isn't
+        writable, it is extracted into the staging directory and copied
+        over path instead ("copy").
+        """
+        staged = staged_path(entry, path)
+        stats = None
+        try:
+            with FileLock(staged + ".lock"):
+                if not os.path.isdir(staged):
+                    _, stats = self._extract_staged(
+                        entry, path, archive, cancel, throttle, rules
+                    )
+            return staged, "swap", stats
+        except PermissionError:
+            logger.info(f"Can't write next to {path}, copying into it instead")
+        staging = self._copy_staging(record)
+        self.reaper.discard(staging)
+        try:
+            folder, stats = extract(archive, staging, cancel, throttle, rules)
+            return folder, "copy", stats
+        except cancellation.Cancelled:
+            self.reaper.discard(staging)
+            raise
+
+    def _copy_staging(self, record):
+        """Folder a build is extracted to for copying, see _extract_for."""
+        name = os.path.splitext(os.path.basename(record.filename))[0]
+        return os.path.join(self.staging, name)
+
+    def _discard(self, record, staged, mode):
+        """Remove the extracted build and journal of a cancelled install."""
+        if mode in ("swap", "merge"):
+            self.reaper.discard(staged)
+        else:
+            self.reaper.discard(self._copy_staging(record))
+        record.remove()
+
+    def reap(self):
+        """Queue the removal of leftovers from crashed or interrupted runs.
+
+        Runs in the reaper's background thread, see reaper.py.
+        """
+        self.reaper.defer(self._sweep)
+
+    def _sweep(self):
+        for path in self.leftovers():
+            reaper.remove(path)
+
+    def leftovers(self):
+        """Return files and folders no install, download or journal needs.
+
+        These are builds replaced by a swap, interrupted extractions next
+        to the known install folders, staging folders without a journal,
+        and downloads that nobody is still writing. Files locked by another
+        process are left alone. Lock files themselves are kept: another
+        process may be waiting on one, and a new file at the same path
+        wouldn't lock against it.
+        """
+        found = []
+        paths = {self.path} | {
+            profile.get("path") for profile in self.config.section("profiles").values()
+        }
+        paths |= {
+            record.get("path") for record in self.config.section("installed").values()
+        }
+        for path in sorted(p for p in paths if p):
+            pattern = staged_path({"hash": "*"}, path)
+            if os.path.isdir(path):
+                # Otherwise the replaced build is the only one, see restore()
+                found += glob.glob(old_path(path))
+            found += glob.glob(pattern + reaper.TRASH_MARKER + "*")
+            for tmp in glob.glob(pattern + ".tmp"):
+                if not is_locked(tmp[: -len(".tmp")] + ".lock"):
+                    found.append(tmp)
+        if os.path.isdir(self.staging):
+            journals = {
+                os.path.splitext(os.path.basename(record.filename))[0]
+                for record in self.pending()
+            }
+            for name in os.listdir(self.staging):
+                if name != "journal" and name not in journals:
+                    found.append(os.path.join(self.staging, name))
+            found += glob.glob(os.path.join(self.journals, "*.tmp"))
+        if os.path.isdir(self.cache):
+            for name in os.listdir(self.cache):
+                if not name.endswith(".part"):
+                    continue
+                archive = os.path.join(self.cache, os.path.splitext(name)[0])
+                if not is_locked(archive + ".lock"):
+                    found.append(os.path.join(self.cache, name))
+        if os.path.isdir(LEGACY_STAGING):
+            found.append(os.path.abspath(LEGACY_STAGING))
+        return found
+
+    def _record(self, entry, path, results, profile, stats=None):
+        """Store the installed version in the settings."""
+        if profile:
+            state = self.config.get("profile_state", profile) or {}
+            history = state.get("history", [])
+            if entry["filename"] not in history:
+                history.append(entry["filename"])
+            self.config.set(
+                "profile_state",
+                profile,
+                {"installed": entry["version"], "history": history[-20:]},
+            )
+        else:
+            self.config.update(
+                "main",
+                {
+                    "path": path,
+                    "flavor": entry["arch"],
+                    "os": entry["os"],
+                    "channel": entry["channel"],
+                    "installed": entry["version"],
+                },
+            )
+        self.config.set(
+            "installed",
+            install_key(entry["version"], profile),
+            {
+                "version": entry["version"],
+                "profile": profile,
+                "url": entry["url"],
+                "hash": entry["hash"],
+                "arch": entry["arch"],
+                "path": path,
+                "date": entry["build_date"],
+                "targets": results,
+                "extract": stats,
+            },
+        )
+
+    def warm_up(self, path=None, force=False):
+        """Prepare the build at path for a fast first start, see warmup.py.
+
+        Runs only if enabled in the "warmup" settings or forced and never
+        fails the install it follows; returns what was done or None.
+        """
+        section = self.config.section("warmup")
+        if not (force or section.get("enabled")):
+            return None
+        path = path or self.path
+        try:
+            return warmup.warm_up(
+                path,
+                blender_executable(path),
+                section.get("workers", 0),
+                section.get("timeout") or warmup.COMPILE_TIMEOUT,
+            )
+        except Exception:
+            logger.exception(f"Warm-up of {path} failed")
+            return None
+
+    def launch(self, path=None, args=()):
+        return launch(path or self.path, args)
@@ -0,0 +1,209 @@
+"""
+    Copyright 2016-2019 Tobias Kummer/Overmind Studios.
+
+    This program is free software: you can redistribute it and/or modify
+    it under the terms of the GNU General Public License as published by
+    the Free Software Foundation, either version 3 of the License, or
+    (at your option) any later version.
+
+    This program is distributed in the hope that it will be useful,
+    but WITHOUT ANY WARRANTY; without even the implied warranty of
+    MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+    GNU General Public License for more details.
+
+    You should have received a copy of the GNU General Public License
+    along with this program.  If not, see <https://www.gnu.org/licenses/>.
+"""
+
+import contextlib
+import json
+import logging
+import os
+import sqlite3
+from datetime import datetime
+
+logger = logging.getLogger(__name__)
+
+# Catalog entry keys with a column of their own, the rest goes to "extra"
+COLUMNS = (
+    "filename",
+    "hash",
+    "version",
+    "name",
+    "channel",
+    "os",
+    "arch",
+    "type",
+    "size",
+    "build_date",
+    "date",
+    "url",
+    "checksum",
+    "first_seen",
+    "last_seen",
+)
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS builds (
+    filename TEXT PRIMARY KEY,
+    hash TEXT,
+    version TEXT,
+    name TEXT,
+    channel TEXT,
+    os TEXT,
+    arch TEXT,
+    type TEXT,
+    size TEXT,
+    build_date TEXT,
+    date TEXT,
+    url TEXT,
+    checksum TEXT,
+    first_seen TEXT,
+    last_seen TEXT,
+    extra TEXT
+);
+CREATE INDEX IF NOT EXISTS builds_series ON builds (channel, os, arch, date);
+CREATE INDEX IF NOT EXISTS builds_hash ON builds (hash);
+"""
+
+INSERT = f"""
+INSERT OR IGNORE INTO builds ({', '.join(COLUMNS)}, extra)
+VALUES ({', '.join('?' * (len(COLUMNS) + 1))})
+"""
+
+# Refreshes only touch what the builder page can change. Not an upsert,
+# which needs SQLite 3.24
+REFRESH = "UPDATE builds SET url = ?, size = ?, last_seen = ? WHERE filename = ?"
+
+
+class History:
+    """Every build ever seen in the catalog, kept in an SQLite database.
+
+    The builder page only lists the latest builds of each channel. The
+    history keeps the ones that dropped off for rollbacks and bisections.
+    Builds are keyed by filename and stored as catalog entries with an
+    absolute "date" (the page leaves out the year), "first_seen",
+    "last_seen" and the "checksum" once an archive was verified. Lookups
+    by series (channel, OS, architecture, date) and by hash are indexed.
+    """
+
+    def __init__(self, filename):
+        self.filename = filename
+        self._ready = False
+
+    @contextlib.contextmanager
+    def _connect(self):
+        """A connection per call, so any thread or process can use the history."""
+        if not self._ready:
+            self._setup()
+        connection = sqlite3.connect(self.filename, timeout=30)
+        connection.row_factory = sqlite3.Row
+        try:
+            with connection:
+                yield connection
+        finally:
+            connection.close()
+
+    def _setup(self):
+        os.makedirs(os.path.dirname(os.path.abspath(self.filename)), exist_ok=True)
+        connection = sqlite3.connect(self.filename, timeout=30)
+        try:
+            # Readers don't block the writer of another process
+            connection.execute("PRAGMA journal_mode=WAL")
+            with connection:
+                connection.executescript(SCHEMA)
+        finally:
+            connection.close()
+        self._ready = True
+
+    @staticmethod
+    def _row(entry):
+        extra = {key: value for key, value in entry.items() if key not in COLUMNS}
+        return [entry.get(column) for column in COLUMNS] + [json.dumps(extra)]
+
+    @staticmethod
+    def _entry(row):
+        entry = {key: row[key] for key in COLUMNS if row[key] is not None}
+        entry.update(json.loads(row["extra"] or "{}"))
+        return entry
+
+    def add(self, builds, dated):
+        """Record the builds of a catalog fetch; returns how many were new.
+
+        Known builds are updated in place, so a refresh only writes what
+        changed. dated(entry) returns the build datetime of an entry, see
+        engine.build_datetime().
+        """
+        now = datetime.now().isoformat(timespec="seconds")
+        rows = [
+            self._row(
+                dict(
+                    entry,
+                    date=dated(entry).isoformat(),
+                    first_seen=now,
+                    last_seen=now,
+                )
+            )
+            for entry in builds
+        ]
+        refreshed = [
+            (entry.get("url"), entry.get("size"), now, entry["filename"])
+            for entry in builds
+        ]
+        with self._connect() as connection:
+            before = connection.execute("SELECT COUNT(*) FROM builds").fetchone()[0]
+            connection.executemany(REFRESH, refreshed)
+            connection.executemany(INSERT, rows)
+            new = connection.execute("SELECT COUNT(*) FROM builds").fetchone()[0]
+        new -= before
+        if new:
+            logger.info(f"Added {new} builds to the history")
+        return new
+
+    def builds(self, since=None, until=None, channel=None, os_=None, arch=None):
+        """Return the recorded builds, oldest first.
+
+        since and until are ISO dates (inclusive) limiting the build date;
+        channel, os_ and arch must match exactly.
+        """
+        conditions = []
+        values = []
+        for column, value in (("channel", channel), ("os", os_), ("arch", arch)):
+            if value:
+                conditions.append(f"{column} = ?")
+                values.append(value)
+        if since:
+            conditions.append("date >= ?")
+            values.append(since)
+        if until:
+            if len(until) == len("2021-06-01"):
+                # A day covers all builds on it
+                until += "T23:59:59"
+            conditions.append("date <= ?")
+            values.append(until)
+        query = "SELECT * FROM builds"
+        if conditions:
+            query += " WHERE " + " AND ".join(conditions)
+        with self._connect() as connection:
+            rows = connection.execute(query + " ORDER BY date", values).fetchall()
+        return [self._entry(row) for row in rows]
+
+    def find(self, hash_):
+        """Return the recorded builds with the given hash (one per OS/arch)."""
+        with self._connect() as connection:
+            rows = connection.execute(
+                "SELECT * FROM builds WHERE hash = ? ORDER BY date", (hash_,)
+            ).fetchall()
+        return [self._entry(row) for row in rows]
+
+    def set_checksum(self, filename, checksum):
+        """Store the verified SHA-256 of a build's archive."""
+        with self._connect() as connection:
+            connection.execute(
+                "UPDATE builds SET checksum = ? WHERE filename = ?",
+                (checksum, filename),
+            )
+
+    def __len__(self):
+        with self._connect() as connection:
+            return connection.execute("SELECT COUNT(*) FROM builds").fetchone()[0]
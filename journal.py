@@ -0,0 +1,127 @@
+"""
+    Copyright 2016-2019 Tobias Kummer/Overmind Studios.
+
+    This program is free software: you can redistribute it and/or modify
+    it under the terms of the GNU General Public License as published by
+    the Free Software Foundation, either version 3 of the License, or
+    (at your option) any later version.
+
+    This program is distributed in the hope that it will be useful,
+    but WITHOUT ANY WARRANTY; without even the implied warranty of
+    MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+    GNU General Public License for more details.
+
+    You should have received a copy of the GNU General Public License
+    along with this program.  If not, see <https://www.gnu.org/licenses/>.
+"""
+
+import glob
+import hashlib
+import json
+import logging
+import os
+import tempfile
+from datetime import datetime
+
+logger = logging.getLogger(__name__)
+
+# Install phases in order; the journal records the last completed one
+PHASES = ("downloaded", "verified", "extracted", "swapped", "cleaned")
+
+
+class Journal:
+    """On-disk record of an install in progress.
+
+    One JSON file per build and installation directory. Every completed
+    phase is written (atomically, synced) before the next one starts, so
+    after a crash the install can continue at the first incomplete phase.
+    The file is removed once the install is cleaned up.
+    """
+
+    def __init__(self, filename, data):
+        self.filename = filename
+        self.data = data
+
+    @classmethod
+    def open(cls, directory, entry, path, **values):
+        """Load the journal of installing entry to path, or start a new one."""
+        key = hashlib.sha1(os.path.abspath(path).encode()).hexdigest()[:12]
+        filename = os.path.join(directory, f"{entry['hash']}-{key}.json")
+        if os.path.isfile(filename):
+            journal = cls.load(filename)
+            if journal is not None:
+                return journal
+        data = {"entry": entry, "path": path, "phase": None}
+        data.update(values)
+        return cls(filename, data)
+
+    @classmethod
+    def load(cls, filename):
+        try:
+            with open(filename) as f:
+                return cls(filename, json.load(f))
+        except (OSError, ValueError):
+            logger.warning(f"Ignoring unreadable install journal {filename}")
+            return None
+
+    @classmethod
+    def pending(cls, directory):
+        """Return the journals of all unfinished installs in directory."""
+        journals = []
+        for filename in sorted(glob.glob(os.path.join(directory, "*.json"))):
+            journal = cls.load(filename)
+            if journal is not None:
+                journals.append(journal)
+        return journals
+
+    @property
+    def entry(self):
+        return self.data["entry"]
+
+    @property
+    def path(self):
+        return self.data["path"]
+
+    @property
+    def phase(self):
+        return self.data["phase"]
+
+    def get(self, key, default=None):
+        return self.data.get(key, default)
+
+    def done(self, phase):
+        """Return whether phase (and all before it) completed."""
+        if self.phase is None:
+            return False
+        return PHASES.index(self.phase) >= PHASES.index(phase)
+
+    def advance(self, phase, **values):
+        """Record phase as completed, together with values to resume from."""
+        self.data.update(values)
+        self.data["phase"] = phase
+        self.data["updated"] = datetime.now().isoformat(timespec="seconds")
+        self.write()
+
+    def reset(self, phase=None):
+        """Go back to just after phase (None: the beginning)."""
+        self.data["phase"] = phase
+        self.write()
+
+    def write(self):
+        directory = os.path.dirname(self.filename)
+        os.makedirs(directory, exist_ok=True)
+        fd, tmp = tempfile.mkstemp(dir=directory, suffix=".tmp")
+        try:
+            with os.fdopen(fd, "w") as f:
+                json.dump(self.data, f, indent=2)
+                f.flush()
+                os.fsync(f.fileno())
+            os.replace(tmp, self.filename)
+        except BaseException:
+            if os.path.exists(tmp):
+                os.remove(tmp)
+            raise
+
+    def remove(self):
+        if os.path.exists(self.filename):
+            os.remove(self.filename)
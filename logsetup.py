@@ -0,0 +1,126 @@
+"""
+    Copyright 2016-2019 Tobias Kummer/Overmind Studios.
+
+    This program is free software: you can redistribute it and/or modify
+    it under the terms of the GNU General Public License as published by
+    the Free Software Foundation, either version 3 of the License, or
+    (at your option) any later version.
+
+    This program is distributed in the hope that it will be useful,
+    but WITHOUT ANY WARRANTY; without even the implied warranty of
+    MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+    GNU General Public License for more details.
+
+    You should have received a copy of the GNU General Public License
+    along with this program.  If not, see <https://www.gnu.org/licenses/>.
+"""
+
+import atexit
+import copy
+import json
+import logging
+import logging.handlers
+import os
+import queue
+from datetime import datetime, timezone
+
+LOG_FILE = "BlenderUpdater.log"
+LOG_MAX_BYTES = 1024 * 1024
+LOG_BACKUPS = 5
+DEFAULT_LEVEL = "INFO"
+
+_listener = None
+_handler = None
+
+
+class JsonFormatter(logging.Formatter):
+    """Formats each record as a single line JSON object."""
+
+    def format(self, record):
+        entry = {
+            "time": datetime.fromtimestamp(record.created, timezone.utc).isoformat(),
+            "level": record.levelname,
+            "logger": record.name,
+            "thread": record.threadName,
+            "message": record.getMessage(),
+        }
+        if record.exc_info:
+            entry["exception"] = self.formatException(record.exc_info)
+        elif record.exc_text:
+            # Rendered by _QueueHandler.prepare
+            entry["exception"] = record.exc_text
+        return json.dumps(entry)
+
+
+class _QueueHandler(logging.handlers.QueueHandler):
+    """Queue handler that keeps the traceback out of the message.
+
+    QueueHandler.prepare() merges the traceback into msg and drops
+    exc_info. Here the traceback is rendered into exc_text instead, for
+    the JsonFormatter to write to its own field.
+    """
+
+    def prepare(self, record):
+        record = copy.copy(record)
+        record.message = record.getMessage()
+        if record.exc_info:
+            record.exc_text = logging.Formatter().formatException(record.exc_info)
+        record.msg = record.message
+        record.args = None
+        record.exc_info = None
+        return record
+
+
+def resolve_level(level=None):
+    """Return the numeric log level from an argument, the environment or the default."""
+    if level is None:
+        level = os.environ.get("BLENDERUPDATER_LOGLEVEL", DEFAULT_LEVEL)
+    if isinstance(level, int):
+        return level
+    value = logging.getLevelName(str(level).upper())
+    return value if isinstance(value, int) else logging.INFO
+
+
+def setup_logging(level=None, filename=LOG_FILE):
+    """Route the root logger through a queue to a rotating JSON file handler.
+
+    The calling thread only enqueues records; formatting and disk writes
+    happen on the listener's background thread.
+    """
+    global _listener, _handler
+    if _listener is not None:
+        return logging.getLogger()
+
+    file_handler = logging.handlers.RotatingFileHandler(
+        filename, maxBytes=LOG_MAX_BYTES, backupCount=LOG_BACKUPS, encoding="utf-8"
+    )
+    file_handler.setFormatter(JsonFormatter())
+
+    log_queue = queue.SimpleQueue()
+    _listener = logging.handlers.QueueListener(
+        log_queue, file_handler, respect_handler_level=False
+    )
+    _listener.start()
+    atexit.register(shutdown_logging)
+
+    logger = logging.getLogger()
+    _handler = _QueueHandler(log_queue)
+    logger.addHandler(_handler)
+    logger.setLevel(resolve_level(level))
+    return logger
+
+
+def set_level(level):
+    """Change the root log level at runtime."""
+    logging.getLogger().setLevel(resolve_level(level))
+
+
+def shutdown_logging():
+    """Flush pending records, stop the background listener and detach it."""
+    global _listener, _handler
+    if _listener is not None:
+        _listener.stop()
+        _listener = None
+    if _handler is not None:
+        logging.getLogger().removeHandler(_handler)
+        _handler = None
@@ -12,7 +12,7 @@ from PySide2.QtCore import *
 from PySide2.QtGui import *
 from PySide2.QtWidgets import *
 
-import res_rc
+# Resources are registered lazily from res.rcc, see resources.py
 
 class Ui_MainWindow(object):
     def setupUi(self, MainWindow):
@@ -0,0 +1,163 @@
+"""
+    Copyright 2016-2019 Tobias Kummer/Overmind Studios.
+
+    This program is free software: you can redistribute it and/or modify
+    it under the terms of the GNU General Public License as published by
+    the Free Software Foundation, either version 3 of the License, or
+    (at your option) any later version.
+
+    This program is distributed in the hope that it will be useful,
+    but WITHOUT ANY WARRANTY; without even the implied warranty of
+    MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+    GNU General Public License for more details.
+
+    You should have received a copy of the GNU General Public License
+    along with this program.  If not, see <https://www.gnu.org/licenses/>.
+"""
+
+import logging
+import threading
+import time
+
+import requests
+
+logger = logging.getLogger(__name__)
+
+PROBE_SIZE = 256 * 1024
+PROBE_TTL = 600
+# Transfer size the ranking is optimised for; small enough that latency
+# still matters, large enough that throughput decides between mirrors
+REFERENCE_SIZE = 32 * 1024 * 1024
+
+
+def mirror_url(base, url, origin):
+    """Return the URL of a build archive on the mirror at base.
+
+    Mirrors are expected to have the same layout as origin below their base
+    URL; archives outside of origin are looked up by filename.
+    """
+    if url.startswith(origin):
+        rel = url[len(origin) :]
+    else:
+        rel = url.rsplit("/", 1)[-1]
+    return base.rstrip("/") + "/" + rel.lstrip("/")
+
+
+def archive_url(server, url):
+    """Return the URL of a build archive on a LAN cache server."""
+    return server.rstrip("/") + "/archive/" + url.rsplit("/", 1)[-1]
+
+
+def probe(url, size=PROBE_SIZE, session=None, timeout=10):
+    """Measure latency and throughput of url with a small Range request.
+
+    Returns a dict with "ok", "rtt" (seconds to the response headers),
+    "throughput" (bytes per second) and "error".
+    """
+    result = {"url": url, "ok": False, "rtt": None, "throughput": None, "error": None}
+    headers = {"Range": f"bytes=0-{size - 1}"}
+    started = time.monotonic()
+    try:
+        with (session or requests).get(
+            url, headers=headers, stream=True, timeout=timeout
+        ) as req:
+            req.raise_for_status()
+            first = time.monotonic()
+            received = 0
+            # A server ignoring Range sends the whole file, stop after size
+            for chunk in req.iter_content(64 * 1024):
+                received += len(chunk)
+                if received >= size:
+                    break
+            elapsed = max(time.monotonic() - first, 1e-6)
+    except requests.RequestException as e:
+        result["error"] = str(e)
+        return result
+    result["ok"] = received > 0
+    result["rtt"] = round(first - started, 4)
+    result["throughput"] = round(received / elapsed)
+    if not result["ok"]:
+        result["error"] = "Empty response"
+    return result
+
+
+def score(result):
+    """Estimated seconds for a REFERENCE_SIZE transfer, lower is better."""
+    return result["rtt"] + REFERENCE_SIZE / max(result["throughput"], 1)
+
+
+class Mirrors:
+    """Ranks download mirrors by a measured Range probe.
+
+    The ranking is kept for ttl seconds. urls() returns the
+    candidate URLs for a build, fastest healthy mirror first, so downloads
+    can fail over to the next one mid-transfer. A LAN cache server, see
+    cacheserver.py, always comes first and isn't probed.
+    """
+
+    def __init__(self, bases=(), origin=None, size=PROBE_SIZE, ttl=PROBE_TTL, lan=None):
+        self.bases = [base for base in bases if base]
+        self.lan = lan
+        self.origin = origin
+        self.size = size
+        self.ttl = ttl
+        self.results = {}
+        self._ranked = None
+        self._stamp = 0
+        self._lock = threading.Lock()
+
+    def urls(self, url, session=None):
+        """Return url and its mirrored copies, best first."""
+        lan = [archive_url(self.lan, url)] if self.lan else []
+        if not self.bases:
+            return lan + [url]
+        with self._lock:
+            if self._ranked is None or time.monotonic() - self._stamp > self.ttl:
+                self._ranked = self.rank(url, session)
+                self._stamp = time.monotonic()
+            ranked = list(self._ranked)
+        return lan + [self._resolve(base, url) for base in ranked]
+
+    def _resolve(self, base, url):
+        return url if base is None else mirror_url(base, url, self.origin)
+
+    def rank(self, url, session=None):
+        """Probe every mirror and the origin for url; returns the bases in order.
+
+        None stands for the origin itself. Mirrors failing the probe go
+        last, in configured order, as a last resort for failover.
+        """
+        healthy, failed = [], []
+        for base in self.bases + [None]:
+            result = probe(self._resolve(base, url), self.size, session)
+            self.results[base or "origin"] = result
+            if result["ok"]:
+                healthy.append((score(result), base))
+                logger.debug(
+                    f"Mirror {base or 'origin'}: rtt {result['rtt']}s, "
+                    f"{result['throughput']} B/s"
+                )
+            else:
+                failed.append(base)
+                logger.warning(f"Mirror {base or 'origin'} failed: {result['error']}")
+        healthy.sort(key=lambda item: item[0])
+        ranked = [base for _, base in healthy] + failed
+        logger.info(f"Using mirror {ranked[0] or 'origin'}")
+        return ranked
+
+    def reset(self):
+        """Forget the ranking, the next download probes again."""
+        with self._lock:
+            self._ranked = None
+
+
+def from_settings(config, origin):
+    """Create the mirror list from the "mirrors" settings section."""
+    section = config.section("mirrors")
+    return Mirrors(
+        section.get("urls", []),
+        origin,
+        size=section.get("probe_size", PROBE_SIZE),
+        ttl=section.get("ttl", PROBE_TTL),
+        lan=config.get("lan", "url"),
+    )
@@ -0,0 +1,144 @@
+"""
+    Copyright 2016-2019 Tobias Kummer/Overmind Studios.
+
+    This program is free software: you can redistribute it and/or modify
+    it under the terms of the GNU General Public License as published by
+    the Free Software Foundation, either version 3 of the License, or
+    (at your option) any later version.
+
+    This program is distributed in the hope that it will be useful,
+    but WITHOUT ANY WARRANTY; without even the implied warranty of
+    MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+    GNU General Public License for more details.
+
+    You should have received a copy of the GNU General Public License
+    along with this program.  If not, see <https://www.gnu.org/licenses/>.
+"""
+
+import logging
+import os
+import threading
+import time
+
+import cancellation
+import downloads
+import engine
+
+logger = logging.getLogger(__name__)
+
+# Queue priority, behind the downloads the user asked for
+PRIORITY = downloads.DEFAULT_PRIORITY + 10
+
+
+class Prefetcher:
+    """Downloads the build the user will most likely install next.
+
+    The download goes through the shared download queue at a low priority
+    and under the "background" resource class, limited to ``rate`` bytes
+    per second on top of the queue's limit. Engine.fetch() lifts the limit
+    and joins the download when the user picks the same build, and
+    cancels the prefetch when they pick another one.
+    """
+
+    def __init__(self, eng, entry, rate=2 * 1024 * 1024):
+        self.engine = eng
+        self.entry = entry
+        self.rate = rate
+        self.error = None
+        self.policy = eng.policy("background")
+        self._write = self.policy.throttle("download")
+        self._job = None
+        self._cancelled = False
+        self._lock = threading.Lock()
+        self._hurry = threading.Event()
+        self._thread = None
+        self._started = None
+        self._done = 0
+
+    def start(self):
+        self._thread = threading.Thread(target=self.run, name="Prefetch", daemon=True)
+        self._thread.start()
+        self.engine.prefetcher = self
+
+    def run(self):
+        self.policy.apply()
+        archive = os.path.join(self.engine.cache, self.entry["filename"])
+        self._started = time.monotonic()
+        logger.info(f"Prefetching {self.entry['filename']}")
+        try:
+            job = self.engine.submit(
+                self.entry, archive, PRIORITY, throttle=self._throttle
+            )
+            with self._lock:
+                self._job = job
+                if self._cancelled:
+                    job.cancel()
+            job.wait()
+            logger.info(f"Prefetched {self.entry['filename']}")
+        except cancellation.Cancelled:
+            logger.info(f"Prefetch of {self.entry['filename']} cancelled")
+        except Exception as e:
+            self.error = e
+            logger.warning(f"Prefetch of {self.entry['filename']} failed: {e}")
+
+    def _throttle(self, nbytes):
+        # Runs on the queue's worker, also for requests that joined
+        self._done += nbytes
+        if self._hurry.is_set():
+            return
+        self._write(nbytes)
+        if not self.rate:
+            return
+        ahead = self._done / self.rate - (time.monotonic() - self._started)
+        if ahead > 0:
+            # Wake up early when the limit is lifted or the prefetch cancelled
+            self._hurry.wait(ahead)
+
+    def hurry(self):
+        """Remove the rate limit."""
+        self._hurry.set()
+
+    def cancel(self):
+        """Withdraw the prefetch; the download stops unless others joined it."""
+        with self._lock:
+            if self._cancelled:
+                return
+            self._cancelled = True
+            if self._job is not None:
+                self._job.cancel()
+        self._hurry.set()
+
+    def wait(self, timeout=None):
+        if self._thread is not None:
+            self._thread.join(timeout)
+
+    @property
+    def running(self):
+        return self._thread is not None and self._thread.is_alive()
+
+
+def prefetch_likely(eng):
+    """Start prefetching the newest build matching the last install.
+
+    Returns the Prefetcher, or None if prefetching is disabled, nothing
+    matches or the build is already installed or cached.
+    """
+    config = eng.config.section("prefetch")
+    main = eng.config.section("main")
+    if not config.get("enabled") or not main.get("flavor"):
+        return None
+    entry = engine.newest(
+        eng.builds,
+        os_=main.get("os") or engine.current_os(),
+        arch=main["flavor"],
+        channel=main.get("channel"),
+    )
+    if entry is None or eng.is_installed(entry) or eng.cached(entry):
+        return None
+    if eng.prefetcher is not None and eng.prefetcher.running:
+        if eng.prefetcher.entry["filename"] == entry["filename"]:
+            return eng.prefetcher
+        eng.prefetcher.cancel()
+    prefetcher = Prefetcher(eng, entry, config.get("rate"))
+    prefetcher.start()
+    return prefetcher
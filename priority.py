@@ -0,0 +1,242 @@
+"""
+    Copyright 2016-2019 Tobias Kummer/Overmind Studios.
+
+    This program is free software: you can redistribute it and/or modify
+    it under the terms of the GNU General Public License as published by
+    the Free Software Foundation, either version 3 of the License, or
+    (at your option) any later version.
+
+    This program is distributed in the hope that it will be useful,
+    but WITHOUT ANY WARRANTY; without even the implied warranty of
+    MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+    GNU General Public License for more details.
+
+    You should have received a copy of the GNU General Public License
+    along with this program.  If not, see <https://www.gnu.org/licenses/>.
+"""
+
+import contextlib
+import ctypes
+import logging
+import os
+import platform
+import sys
+import threading
+import time
+
+import downloads
+
+logger = logging.getLogger(__name__)
+
+# Built-in resource classes; settings can change them or add more.
+# nice: CPU nice level (only ever raised), ionice: "idle" or
+# "best-effort[:0-7]", cpus: CPU numbers to run on, workers: targets
+# written in parallel, write_rate: bytes/s written to disk (0 unlimited)
+CLASSES = {
+    "normal": {},
+    "background": {"nice": 10, "ionice": "best-effort:7", "workers": 2},
+    "idle": {
+        "nice": 19,
+        "ionice": "idle",
+        "workers": 1,
+        "write_rate": 32 * 1024 * 1024,
+    },
+}
+
+IOPRIO_CLASSES = {"realtime": 1, "best-effort": 2, "idle": 3}
+# glibc has no ioprio_set() wrapper, the syscall number depends on the CPU
+IOPRIO_SET = {
+    "x86_64": 251,
+    "i386": 289,
+    "i686": 289,
+    "aarch64": 30,
+    "armv7l": 314,
+    "ppc64le": 273,
+}
+IOPRIO_WHO_PROCESS = 1
+IOPRIO_CLASS_SHIFT = 13
+# On Linux, who 0 of setpriority() and ioprio_set() is the calling thread
+CALLING_THREAD = 0
+
+# Windows thread priorities and background mode (lower I/O priority)
+THREAD_PRIORITY_BELOW_NORMAL = -1
+THREAD_PRIORITY_LOWEST = -2
+THREAD_PRIORITY_IDLE = -15
+THREAD_MODE_BACKGROUND_BEGIN = 0x00010000
+
+
+def _set_nice(nice):
+    """Lower the CPU priority of the calling thread to nice."""
+    if os.name == "nt":
+        if nice >= 19:
+            level = THREAD_PRIORITY_IDLE
+        elif nice >= 10:
+            level = THREAD_PRIORITY_LOWEST
+        else:
+            level = THREAD_PRIORITY_BELOW_NORMAL
+        return _set_windows_priority(level)
+    if not sys.platform.startswith("linux"):
+        # Elsewhere this would renice the whole process
+        return False
+    try:
+        # Raising the priority again needs privileges, only ever lower it
+        if nice > os.getpriority(os.PRIO_PROCESS, CALLING_THREAD):
+            os.setpriority(os.PRIO_PROCESS, CALLING_THREAD, nice)
+        return True
+    except OSError:
+        return False
+
+
+def _set_ionice(spec):
+    """Set the I/O class of the calling thread, e.g. "best-effort:7"."""
+    name, _, level = spec.partition(":")
+    if os.name == "nt":
+        return name == "idle" and _set_windows_priority(THREAD_MODE_BACKGROUND_BEGIN)
+    number = IOPRIO_SET.get(platform.machine())
+    if not sys.platform.startswith("linux") or number is None:
+        return False
+    value = IOPRIO_CLASSES[name] << IOPRIO_CLASS_SHIFT
+    if name != "idle":
+        value |= int(level or 4)
+    libc = ctypes.CDLL(None, use_errno=True)
+    return libc.syscall(number, IOPRIO_WHO_PROCESS, CALLING_THREAD, value) == 0
+
+
+def _set_windows_priority(level):
+    kernel32 = ctypes.windll.kernel32
+    return bool(kernel32.SetThreadPriority(kernel32.GetCurrentThread(), level))
+
+
+def _set_affinity(cpus):
+    try:
+        # pid 0 is the calling thread on Linux
+        os.sched_setaffinity(0, cpus)
+        return True
+    except (AttributeError, OSError, ValueError):
+        return False
+
+
+def lower_thread_priority(nice=19):
+    """Renice the calling thread where the OS supports per-thread priorities."""
+    _set_nice(nice)
+
+
+class Policy:
+    """A resource class the install pipeline runs under.
+
+    apply() sets nice level, I/O class and CPU affinity of the calling
+    thread, where the OS allows it; every thread working on an install
+    calls it. throttle(stage) holds the disk writes of all stages together
+    to write_rate and counts them, measure(stage) times a stage. The
+    results per stage are kept in stats, see record().
+    """
+
+    def __init__(
+        self,
+        name="normal",
+        nice=None,
+        ionice=None,
+        cpus=None,
+        workers=None,
+        write_rate=None,
+    ):
+        if ionice and ionice.partition(":")[0] not in IOPRIO_CLASSES:
+            raise ValueError(f"Unknown I/O class {ionice}")
+        self.name = name
+        self.nice = nice
+        self.ionice = ionice
+        self.cpus = cpus
+        self.workers = workers
+        self.write_rate = write_rate
+        self.bucket = downloads.TokenBucket(write_rate or None)
+        self.stats = {}
+        self._lock = threading.Lock()
+
+    @classmethod
+    def from_settings(cls, config, name=None):
+        """Create the class name (default: priority.class) from the settings."""
+        section = config.section("priority")
+        name = name or section.get("class") or "normal"
+        classes = dict(CLASSES)
+        classes.update(section.get("classes", {}))
+        if name not in classes:
+            raise LookupError(f"Unknown resource class {name}")
+        return cls(name, **classes[name])
+
+    def apply(self):
+        """Apply the class to the calling thread; returns what took effect."""
+        applied = {}
+        if self.nice is not None and _set_nice(self.nice):
+            applied["nice"] = self.nice
+        if self.ionice and _set_ionice(self.ionice):
+            applied["ionice"] = self.ionice
+        if self.cpus and _set_affinity(self.cpus):
+            applied["cpus"] = self.cpus
+        logger.debug(
+            f"Resource class {self.name} on {threading.current_thread().name}: "
+            f"{applied or 'unchanged'}"
+        )
+        return applied
+
+    def throttle(self, stage):
+        """Return a throttle(nbytes) for the disk writes of stage."""
+
+        def throttle(nbytes):
+            self.count(stage, nbytes)
+            self.bucket.consume(nbytes)
+
+        return throttle
+
+    def count(self, stage, nbytes=0, seconds=0.0):
+        with self._lock:
+            stats = self.stats.setdefault(stage, {"bytes": 0, "seconds": 0.0})
+            stats["bytes"] += nbytes
+            stats["seconds"] += seconds
+
+    @contextlib.contextmanager
+    def measure(self, stage, nbytes=0):
+        """Time the block as stage, adding nbytes to what it wrote."""
+        started = time.monotonic()
+        yield
+        self.count(stage, nbytes, time.monotonic() - started)
+
+    def as_dict(self):
+        return {
+            "name": self.name,
+            "nice": self.nice,
+            "ionice": self.ionice,
+            "cpus": self.cpus,
+            "workers": self.workers,
+            "write_rate": self.write_rate,
+        }
+
+
+def record(config, policy):
+    """Add the stage throughput of a finished install to the "metrics" section.
+
+    Totals are kept per resource class as "throughput-<class>", so the
+    classes can be compared on the same machine.
+    """
+    key = f"throughput-{policy.name}"
+    totals = config.get("metrics", key) or {}
+    for stage, stats in policy.stats.items():
+        if not stats["bytes"] or not stats["seconds"]:
+            continue
+        total = totals.setdefault(stage, {"bytes": 0, "seconds": 0.0, "runs": 0})
+        total["bytes"] += stats["bytes"]
+        total["seconds"] = round(total["seconds"] + stats["seconds"], 3)
+        total["runs"] += 1
+        total["rate"] = round(total["bytes"] / total["seconds"])
+    config.set("metrics", key, totals)
+    return totals
+
+
+def throughput(config):
+    """Return the recorded bytes/s per resource class and stage."""
+    result = {}
+    for key, totals in config.section("metrics").items():
+        if key.startswith("throughput-"):
+            result[key[len("throughput-") :]] = {
+                stage: total["rate"] for stage, total in totals.items()
+            }
+    return result
@@ -0,0 +1,122 @@
+"""
+    Copyright 2016-2019 Tobias Kummer/Overmind Studios.
+
+    This program is free software: you can redistribute it and/or modify
+    it under the terms of the GNU General Public License as published by
+    the Free Software Foundation, either version 3 of the License, or
+    (at your option) any later version.
+
+    This program is distributed in the hope that it will be useful,
+    but WITHOUT ANY WARRANTY; without even the implied warranty of
+    MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+    GNU General Public License for more details.
+
+    You should have received a copy of the GNU General Public License
+    along with this program.  If not, see <https://www.gnu.org/licenses/>.
+"""
+
+import concurrent.futures
+import logging
+
+import benchmark
+import engine
+
+logger = logging.getLogger(__name__)
+
+# Keys of a profile in the "profiles" settings section, with defaults
+PROFILE_DEFAULTS = {
+    "channel": "",
+    "os": "",
+    "arch": "",
+    "path": "",
+    "targets": [],
+    "retention": 1,
+    # Resource class, see priority.py; empty uses priority.class
+    "priority": "",
+    # Optional "include" and "exclude" lists replace those of the
+    # "install" section, see Engine.rules()
+}
+
+
+def load(config, names=None):
+    """Return the configured profiles (optionally only the named ones)."""
+    profiles = {}
+    for name, values in config.section("profiles").items():
+        if names and name not in names:
+            continue
+        profile = dict(PROFILE_DEFAULTS, **values)
+        if not profile["path"]:
+            raise ValueError(f"Profile {name} has no path")
+        profiles[name] = profile
+    if names:
+        missing = set(names) - set(profiles)
+        if missing:
+            raise LookupError(f"Unknown profiles: {', '.join(sorted(missing))}")
+    return profiles
+
+
+def resolve(builds, profile):
+    """Return the newest build for a profile, or None."""
+    return engine.newest(
+        builds,
+        os_=profile["os"] or engine.current_os(),
+        arch=profile["arch"] or None,
+        channel=profile["channel"] or None,
+    )
+
+
+def batch(eng, names=None):
+    """Update all (or the named) profiles from a single catalog fetch.
+
+    Downloads of all profiles run concurrently through the shared download
+    queue, so profiles tracking the same build download it once. The
+    installs then run in parallel, one per profile. Returns a result dict
+    per profile; a failing profile doesn't stop the others.
+    """
+    profiles = load(eng.config, names)
+    builds = eng.catalog()
+    results = {}
+    todo = {}
+    for name, profile in profiles.items():
+        entry = resolve(builds, profile)
+        if entry is None:
+            results[name] = {"state": "failed", "error": "No matching build"}
+        elif eng.is_installed(entry, profile=name):
+            results[name] = {"state": "current", "version": entry["version"]}
+        else:
+            todo[name] = entry
+
+    def update(name):
+        entry = todo[name]
+        profile = profiles[name]
+        eng.install(
+            entry,
+            profile["path"],
+            extra=profile["targets"],
+            profile=name,
+            policy=eng.policy(profile["priority"] or None),
+        )
+        record = eng.config.get("installed", engine.install_key(entry["version"], name))
+        return {
+            "state": "installed",
+            "version": entry["version"],
+            "extract": record.get("extract"),
+            "warmup": eng.warm_up(profile["path"]),
+            "benchmark": benchmark.after_install(eng, profile["path"]),
+        }
+
+    with concurrent.futures.ThreadPoolExecutor(max(len(todo), 1)) as pool:
+        # Start all downloads first, the installs pick up the cached archives
+        fetches = [
+            pool.submit(eng.fetch, entry, prune=False) for entry in todo.values()
+        ]
+        concurrent.futures.wait(fetches)
+        futures = {name: pool.submit(update, name) for name in todo}
+        for name, future in futures.items():
+            try:
+                results[name] = future.result()
+            except Exception as e:
+                logger.exception(f"Updating profile {name} failed")
+                results[name] = {"state": "failed", "error": str(e)}
+    eng.prune_cache()
+    return results
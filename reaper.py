@@ -0,0 +1,121 @@
+"""
+    Copyright 2016-2019 Tobias Kummer/Overmind Studios.
+
+    This program is free software: you can redistribute it and/or modify
+    it under the terms of the GNU General Public License as published by
+    the Free Software Foundation, either version 3 of the License, or
+    (at your option) any later version.
+
+    This program is distributed in the hope that it will be useful,
+    but WITHOUT ANY WARRANTY; without even the implied warranty of
+    MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+    GNU General Public License for more details.
+
+    You should have received a copy of the GNU General Public License
+    along with this program.  If not, see <https://www.gnu.org/licenses/>.
+"""
+
+import logging
+import os
+import queue
+import shutil
+import threading
+import uuid
+
+import priority
+
+logger = logging.getLogger(__name__)
+
+# Marks folders moved aside by discard(), for sweeps after a crash
+TRASH_MARKER = ".trash-"
+
+
+def trash_path(path):
+    """Hidden name next to path to move it to before it is deleted."""
+    parent, base = os.path.split(os.path.normpath(path))
+    if not base.startswith("."):
+        base = "." + base
+    return os.path.join(parent, f"{base}{TRASH_MARKER}{uuid.uuid4().hex[:8]}")
+
+
+def remove(path):
+    """Delete a file or a whole folder, ignoring what is already gone."""
+    logger.info(f"Removing {path}")
+    if os.path.isdir(path) and not os.path.islink(path):
+        shutil.rmtree(path, ignore_errors=True)
+    elif os.path.lexists(path):
+        try:
+            os.remove(path)
+        except FileNotFoundError:
+            pass
+
+
+class Reaper:
+    """Deletes leftovers in a low priority background thread.
+
+    Removing a replaced Blender build means thousands of files, which
+    shouldn't delay the end of an install. discard() moves a folder aside
+    with a rename, so its name can be reused at once, and deletes it
+    later; defer() queues any other cleanup. Work left when the process
+    exits is picked up by the next sweep, see Engine.reap().
+    """
+
+    def __init__(self):
+        self._queue = queue.Queue()
+        self._pending = 0
+        self._idle = threading.Condition()
+        self._thread = None
+        self._lock = threading.Lock()
+
+    def defer(self, function, *args):
+        """Call function(*args) in the background thread."""
+        with self._idle:
+            self._pending += 1
+        self._queue.put((function, args))
+        with self._lock:
+            if self._thread is None:
+                self._thread = threading.Thread(
+                    target=self._run, name="Reaper", daemon=True
+                )
+                self._thread.start()
+
+    def discard(self, path):
+        """Delete the file or folder at path in the background."""
+        if not os.path.lexists(path):
+            return
+        trash = trash_path(path)
+        try:
+            os.rename(path, trash)
+        except OSError:
+            trash = path
+        self.defer(remove, trash)
+
+    def _run(self):
+        priority.lower_thread_priority()
+        while True:
+            function, args = self._queue.get()
+            try:
+                function(*args)
+            except Exception:
+                logger.exception("Background cleanup failed")
+            with self._idle:
+                self._pending -= 1
+                self._idle.notify_all()
+
+    def wait(self, timeout=None):
+        """Block until the queued work is done; returns False on timeout."""
+        with self._idle:
+            return self._idle.wait_for(lambda: self._pending == 0, timeout)
+
+
+_shared = None
+_shared_lock = threading.Lock()
+
+
+def shared_reaper():
+    """Return the process wide reaper."""
+    global _shared
+    with _shared_lock:
+        if _shared is None:
+            _shared = Reaper()
+        return _shared
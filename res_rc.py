@@ -1,1161 +0,0 @@
-# -*- coding: utf-8 -*-
-
-# Resource object code
-#
-# Created: Di Sep 24 23:34:11 2019
-#      by: The Resource Compiler for PySide2 (Qt v5.11.2)
-#
-# WARNING! All changes made in this file will be lost!
-
-from PySide2 import QtCore
-
-qt_resource_data = b"\
-\x00\x00\x02\x9a\
-\x89\
-PNG\x0d\x0a\x1a\x0a\x00\x00\x00\x0dIHDR\x00\
-\x00\x00\x18\x00\x00\x00\x18\x08\x06\x00\x00\x00\xe0w=\xf8\
-\x00\x00\x00\x09pHYs\x00\x00\x0b\x12\x00\x00\x0b\x12\
-\x01\xd2\xdd~\xfc\x00\x00\x02LIDATH\xc7\xed\
-\xd5O\x88\x95e\x14\x06\xf0\xdf\xb9\x0c\x0e\x15(5\xb9\
-h!AH\xb9-\xa9\x10,\xccEa9R\x8bD\
-\x05\x89\x09\x06\x8c\x99{\xcd\x5c\xb4\x08\xe2\x86\xd2B\x22\
-r\xeeT:\x13\x84a\x83\x0b\x17\xa2\x94\xa4\xe1\xa2\x16\
-C\x11\xb8\xa8(\x82\x88f\x11\x84\xcc\xd4\x80 3y\
-\xefi\xe1\xe7\xf0\xcdm\x9a\xdb\x8dYz6\x1f\xdf\xf3\
-\x9es\x9e\xf3\x9e\x7f/\xb7\xa4\x83D7\xca9l\x87\
-p\x12G\xf4y3\xeaZ\x9dl*]\x86\x93\xb8\x1d\
-\x87L\xbb\x98/\xbbgE\x09\xa2\xe1\x9c\x8aM\xf8\x05\
-[5\xfd\x90\xc3\x9e_\xb1\x14-\xa4jH\x9f\xf0\x91\
-\xf0\xf4\x0d\xc0\x98P\x8b\x86\xb9\x8e\x04Y\xf3\xb1\xb4\x13\
-=]\xf2Nj\xd9\x1d\xef\xfau\xf9\x14\xa5\xa7\xfe\x87\
-s\xd8\xa4\xe2rV=\xb9\xfc\x0d\xaa\x1ed\x91\xd2c\
-x\xa6\xf4\xff\x93pX\xd3Wz\xccjZ/\xbc\x80\
-\x81\x22\xb0y\xe9\xd9\x18u\xbec\x0d\xb2f\xaf\xf4\x01\
-V\x15\xd0is\xf6\xc4\x95\x13\xab\xf5\xce\xf5S\xb9\x93\
-\xfc\xc6\xa9\xc1/s\xbfG\xb5\x5c\xc0j\xcc`C4\
-\x5cY\xb2\x8b\x92\xc8\xaa7\xa4\x13%\xe7\xbfk\x1a\x88\
-\xd9\xf1\x8d\xb1j\xfe\xe7\xc8\xf802\xdf\x8e\xf4Ee\
-\xd7\xf8D\x1c\xcd\xaf\x85C\x85\xee]\xa8-Y\x83\xac\
-\xeaUs\x12\xaf\xb7\xdd\xf0L\xbc\xe7j\xf0>\xd6,\
-\xb2I\xbb\xed\x1a\xef\xd72Q\x82\xfb\xffA\x90\x07\xdd\
-\x8d\xcf\xa5=\x05t\xbdT\xad?\x8a\xef\xba\x7f\xe9\xf8\
-u\xe6\xfdY\x02\xee[D\x90C\xee7o\x12\x9b\x0b\
-\xe8<\x8e\x94\xf2\xf6\x08D\xcb\xa9%\xbc\xcfj\xfaT\
-\xaf\x87\xdb\x1b\xa8R8\x7f\x5c\xc5$\xd6\x17G\xc7\xf4\
-\xd9!\xfcX2x\x22\x87mi\xe5\x9aW2\xd51\
-\x85k\xd2\xa5l\xe5\x9648\x85zI\xff\xb7\x05\x96\
-\xac\x9a.\x0a\xd3\x12^\x8d\x11o-Ll\xc5T\xb1\
-\x7f`F\x1a\x88Qg\xdb\xea\xb6\x16\xa3\xd8Y\x8a\xff\
-X\x8cx\xe9&\xc1D\xd1\xfb\xfb\xa2\xe1t\xdb\x06=\
-,\xbc\xd6\x96\x92\xef\xf1\xd9\x8d\x86\xb3\x01[q[\xe9\
-\xfc/\xe1\xa1\x18\xf1]\xc7]\x94u=\xa6\x9d\xc5\xb6\
-.\xa6\xfa@4\xbc\xf3\x9f\xb6i\xd4]\xc7s8\x8e\
-f\x07\xf5\x19i\xefM\xe7\xdd?8\xfb= \xbd(\
-m\xc7\xbd\xb8\xa3\x98\xdao\xf1\x899c1f\xf6\xd6\
-;\xde\x95\xfc\x0d\xe8\xbd\xb8\xdf\x8e\x97\x85c\x00\x00\x00\
-\x00IEND\xaeB`\x82\
-\x00\x00\x01}\
-\x89\
-PNG\x0d\x0a\x1a\x0a\x00\x00\x00\x0dIHDR\x00\
-\x00\x00\x18\x00\x00\x00\x18\x08\x06\x00\x00\x00\xe0w=\xf8\
-\x00\x00\x00\x06bKGD\x00\xff\x00\xff\x00\xff\xa0\xbd\
-\xa7\x93\x00\x00\x012IDATH\x0d\xedT\xbdN\
-\xc40\x0c\xb6\xd3\xf6\x00\xe9$t\x03\xcb\x89\xc9\xed\xc6\
-\x03\xc1\x80x\x04f^\x83W8\x84\xd0\xdd\xce#\xf0\
-,l\x88\xa1l\xd4\xe6KEN\x0d\xea%\x95\x80\xad\
-\x95c'\xf5\xe7\x1f9\x8e\x89\xe6/S\x01\xce\xe8\x0f\
-\xabwo\xa7\x95\x1e\xd5\xca\xda\x18\xb9\x86\xc9j\x80\x1b\
-\xac\xba\xbb\x5c\x9eC\xf6T\xf6\xfc\x10{\xfaX\x97E\
-'\xa6N\xba\xab\xe5\xa6\xd8\xb6\x0f\xd4;\xe2\x86\x8c\xce\
-\x94\x0d\x96Lp\x0e9NQ\x80r\xdb\xde\x1b\x93\xc0\
-N`*pvl\xe6\x08\x1e\xbc\xf5\x06\xec:\x1c\xb0\
-\x9fDQ\x008\xbdEf\x9e&\x19O\x01\xb9)\xa0\
-\xdf`\xe6\x00\xd9\xea\xfd\xbc\xe4\xbb\x94\x05\x9a \xa9\x1f\
-\xb3\x8d\x02\xe0BVc \xffO\xc1Rz\xa8\xf7\xe4\
-\xb1\xe1\x10\xbdd<$$\x19T\xb1\xc4\xeb\xe4\x94~\
-\x88\xf6\xd8pFRa\xfb?r\x0e\x90\xadk\x5c\x22\
-#LK~\x81\xd5+\xd6\x9fP\xd4\xa6\x18\xc97{\
-\xaf;;Y|\xb6\xd2\x15N\x8cM\xbe\xff?c\xd2\
-\xd6~\xe2\xe2\xbc\xc0\xcaR\xd4\xa6Y\xf4\x10\xf0\xf8\xbe\
-\xaa\xaaJT\x15\x090F<\x92`\xf6\x89\x5c\xa0M\
-\xd7C\xe8\xbcOV\xe0\x0bTxK\x010vZ\xc7\
-\x00\x00\x00\x00IEND\xaeB`\x82\
-\x00\x00\x02\xe3\
-\x89\
-PNG\x0d\x0a\x1a\x0a\x00\x00\x00\x0dIHDR\x00\
-\x00\x00\x18\x00\x00\x00\x18\x08\x06\x00\x00\x00\xe0w=\xf8\
-\x00\x00\x00\x06bKGD\x00\xff\x00\xff\x00\xff\xa0\xbd\
-\xa7\x93\x00\x00\x02\x98IDATH\x0d\xd5UKL\
-\x13Q\x14\xbd\xf7\xf5\x03\xa9nt\xe7'\xc1\xb8\xd2\x8d\
-!.\x8c\x1a\x89\xa5j\x22\xd8v\xe1/a\xe9\x82D\
-cL\x5c\xe8B\xa82\xda\x82\xf1\x83\x9a\x18\x16\x1a7\
-~\x16~\x22\x89\x96Pc\x80b\x5c\xa0i\xa2,0\
-\xbaD\x17\xe8R$\x05\xb4\xed\x5c\xcf\x9b\xc2\xd8\x0e\xd8\
-\x16e\xc3\xe4\x9c\xb9\xe7\xddw?3/\xed\x1d\xa2\xa5\
-~q\xb9\x178\xd1\xdbP\xb5\x227\xbd\xc3$^O\
-L+\xd9\x94\x09\xd3\xc5#\x93\xe9\xa9\xd4\xf5\xc3CS\
-\xe5\xf2\xff\xda\xa05\x1eX\x83\xcd6\x14h\x02\x97\x83\
-NL\x08\xf3}\x0f\xe7\xa2\xc6\xbe\xc1o\xce\xcd\xd95\
-j\xcc\xca?\xb6\xf5y\xfd\x01f\xbe\x0b\xcf2P#\
-\x85b)\xfd\xf4\xa4\xc8\x0b\xc7\x16\x12\xda\x06\xab\xc0\x1f\
-,\xd2\x1c\x0d'\x1fC\xcf\x01;=\x91x\xe0\x08|\
-w@\xc5\xc4OQ\xf8l,\xd8\xf7\x11\xeb\x22\x9c\x89\
-\xfb7\xb8HE\xe1<\x08\x0a\x09\x1f\x8b\x85\xfboA\
-\x17\x81\x0bW\xad=\x81\xed,\x94\x84\xcfK\xcc\xa7b\
-\xc1\xfeN\xe8\x92@\xceI\xe4\x5cC\x90)\xa6;@\
-*S\x8b\x07\xfb\x14\x0b\x0d\xbc\x84\x0f/\xac\xef\xa0a\
-\x18\x8a\x85\xbb \xbd\xcct\xb5\x92\xe2\x88\xa5\xf6\xe0\xc0\
-\x0df\xb9\x08\xedbW\xb6\x0f\xc5\xafd\xaa\xd5[\xac\
--\xe83\xb4Df\xf3\xab\x10\x91\xd4b\xf1\xf9\xbb\xaa\
-\x8a\xc0\x96\x87\x10\xe3\x0d\x0e\xe1\x17\xa6\x8f\x09\xe9\xe4A\
-\xd2\xf0\xa5=}\xe3\xb0\x16\xec\x06\xccj\xbf\xe5!\xe9\
-\xba\xd9\x98\xf8\x99\xd7\xa5\xef\xc6y\x83\x95\xc9\xa3\x8a\xe4\
-!\x22?\x80\x82\x9e\x8f`m\xb8g\x15\x93l\x15,\
-L\x96\x04LE\xc0\xb1\x9a\x08L\xcd\xb0\xad\xe5E\xdd\
-*3+\xd3X\xdb\xb0\x1b\xa0\xf8j\xed\xf5N\xd2(\
-\xfd\xe3\xd5\xb1\xf7\xf5Wg\xaa}D\xce\x8d\xc5Z\x17\
-6\xb0\xba\xff\xf2\xd1:Z\xc4\xab\xa0\x01\x0f\xe9\xbaJ\
-\xb8A\xdb\x852\xd2\xb3{\xa3\x11\x0f\xf9\x9cyv\x03\
-\x11\xb3;\xbf\xc9\xc7\x8d\xa4\xbf:\xaf+\xbb[\xf1b\
-&\xb2\x94\x1eky\xb6kSa\x96\xdd\xc0\xf3ng\
-\x9c\x88\x87\xb1Y\x93K[#\x00\xb22d\xd3\xaa\x03\
-\x915\xe0\x17\xef\xfb\xba\x11X\x1bl+\x08\xfci\x16\
-<*\x22\xf1\xfa\xd3x\xb0\xcbH\xcf\xe2\x14\xea\xda\xc3\
-\x83o\xa0m\x145\xd0\xde\xc2a\x87\x89\xd9MJE\
-J\x0c\xbbN\xe44\x82\x98\x89r4\x1aL\xde\x86.\
-\xc2\x9c\x06zwf\x5c\xdf\x83\xf6\x81\x1a\xa5\xc6\xf5\xb8\
-05c&=\xd1\x81N\xce\xdb@\x07\x19\xbd\xfe\xb5\
-\xd9\x9c:\x07\xdd\x04\xce\xfb\xc1\x81\xff\x81[\x99\x17\x16\
-\xfc\xc1A\xa2\x8d\xff\xfdd\xda\x85\x96\xac\xf8\x0diS\
-\xe9S2\xd6`J\x00\x00\x00\x00IEND\xaeB\
-`\x82\
-\x00\x00\x02P\
-\x89\
-PNG\x0d\x0a\x1a\x0a\x00\x00\x00\x0dIHDR\x00\
-\x00\x00\x18\x00\x00\x00\x18\x08\x06\x00\x00\x00\xe0w=\xf8\
-\x00\x00\x00\x06bKGD\x00\xff\x00\xff\x00\xff\xa0\xbd\
-\xa7\x93\x00\x00\x02\x05IDATH\x0d\xedU\xcfK\
-UA\x14\xfef|\xdcw\x1f\xbc\xf0\xe9\x93\x0a\xb5\x08\
-\x84Vn\x22j\x91PQ\xff@\xcbvI\xb6\x8al\
-\xa7H\xfe\x16\x92\xa7%\xf4\x83\x16\xa1\xf4\x97TP\xb9\
-\xd2\x85\x90\x22\xd2B\x0a\xc5\xa5<\xd1h\xee\xc5\xebt\
-f\x1ew\x98w\xb9\xcc\xe5\xd6\xd6a\xce\x9c\xef\x9e3\
-\xe7\xfb83\x03\x178\x1d\x19'\xc0\xec|\xfd\xce\xd5\
-\x9e\x02k\xf9@\xb1kd%\xb2<\xf3\x0f$V\x0a\
-\x5c>\xf4?\xaen\xc7\x85<\x06\xca\x17\x18_\x22\x7f\
-\x93,/9\x95\xa0\x04\x86[\xc7\x92-\xaa\x8f\xd8\x9a\
-\x04\x00v#N\xfc\x87\xef\xb3k\x13\x02\xf0\xec\xa4\xc6\
-,\xb9EG]K\xd1N:\xaby\xcfe\x94^-\
-\x81_\xb8\x84\xe4`g*(\x0e\x8e@\xf9d\xce\xfe\
-v\x0ax\xf7\xee\x83\x9f\xeb\x84?:\x0b\xde\xd9m\xea\
-\x14\xa9?QC\xa1\xef6\xbc\x81\xc7&\x9e\x06\x9c\x02\
-\xe2\xed\x1c\xa2\x8d5\xb0J;\xfc\xe9\x97\xba\x13\xd6F\
-xfA\xe3\x93\xed\x1f\x08\x17\xdf\xa4\xf1\x9aX\xd33\
-=\xba{]\x9aL\x0c\xbc\x22\xfc\xe1)\xb4\xf4^\x81\
-<<\x80\x0c\x02\xf0\x8e\xb3P\xe4\xe2\xf93\xc8\xdfG\
-\xf1N\xe3\xcb\x9fV\x0c\xaf\xb3\x03]\x11\x06\x10\xf3S\
-\x88\xb66\xe8\xbc[\x1b\xe4\xbb\xbf f\xd3\xc9u\x8d\
-\xb5d\x0b\xd0fV.C\x1d\x0dA=Yk\x85\xbe\
-\xab\x1ag-\x99\x02\xac\xbd\x0a\x7fb^_\xf6\xc9\xce\
-OD\x9b\xeb\xba\x13\x7fl\x0e\xbc\xfbb\x16?\x9c\x02\
-\xac\xda\xd1 ?\xdf\x05E.fF j\xa3\x88\xd6\
-\xe9\xe2\xa9\x0b\x7f\x9c\x843D\x9c\x02\xc5'\xc3\xe0\x8a\
-|o\x07\xfaB\x0f\xeb@\x18\x22X\x98n\xdc\x09\x89\
-x\x8f\x9e:\xbbp\x0a\x84\xef_#\xfa\xbe\x0619\
-\x04Y\xdf7DR\x08\x04\xb51\x1c/\x7fF\xf0\xee\
-\x85\x89\xa7\x01\xf3\x9cT2\xf5\x99\xaaDNs=\xd3\
-0'W\xda\xf6\xc0\x0e&\x8fh\xd9N\xfe\x1bf\xdf\
-\xec\xba&\x01\x1e\xb1\x07\x94\xfcJ\x16\x91\xe5\x9d\x11\xfd\
-p\xbep\xc9\xfbq:\xf2\x9c\xc0_\xe9_\x8a\x03\xee\
-4\x1e5\x00\x00\x00\x00IEND\xaeB`\x82\
-\x00\x00\x02\x91\
-\x89\
-PNG\x0d\x0a\x1a\x0a\x00\x00\x00\x0dIHDR\x00\
-\x00\x00\x18\x00\x00\x00\x18\x08\x06\x00\x00\x00\xe0w=\xf8\
-\x00\x00\x00\x06bKGD\x00\xff\x00\xff\x00\xff\xa0\xbd\
-\xa7\x93\x00\x00\x02FIDATH\x0d\xedS=h\
-\x14Q\x10\x9e\xd9\xdd\xb7{{?j\xfc9\x15\x0c\xa6\
-\x12!\x856!\x85\x8d\x17\xc4\x22\xa0bc\xa1)D\
-\x11\x14\xd4\xce\xca\x80 il\x85`%\x82\xe0\x09b\
-!6i4\x16r\x85\x85W\xf8\xd7\x88\x82\x10E\xf1\
-\xe7\x88\x97\xcd\xe5\xed\xed\xbeq\x16/g\xee\xed\xde\xee\
-\xd9g\x99\xe1}3\xdf\xbcov\xe7\xbd\x05X\x7f2\
-&\x80\x19|\x22}\xe8\xc1\xaf\x8d\xaa\x9d\x9b\x06P\xc7\
-\xe6O\x15\xf7$\x16u\x92Vg\x1dx9p\xfb{\
-I\xb5\x9d\x1a\x00\x8d\x02\xe0\xcb\xac\x8dFV\x81\xce;\
-n\xe1\x1a\xe7X\x9c\xe5\x11f\x18\xa7\x9a\x95\xca&\x91\
-D\xa7\x81g\x83\x087\x9e\x9e,<b\x9cj\xa9g\
-p\xf8\xfe\xf2p\x18\xd2Q\x85h\x03b\x9dv\xe6j\
-\xf8\xa5u\xc9Vj\xde\xb7\x8c\x1c(\x18\x8f\xd4MR\
-\xcf\x9eL\x15_GX\xf7\xbe\x0d&\xaa\xdeU \x88\
-\xc6!\xfem\xc2&\x02} \x80\xdd\x9c\x1bb\xef\x1a\
-\x01\xde\xcb\x0d\xb9g\xe7&Qv\x93\x0c\x12\xcf\xa0R\
-]\xba\xc2\xe23\xcc\xaf\x11\xe7\x08\xa8D\x00\xfb\x19\xf5\
-\x88s\x0c\xdcxR6Z\xfb\x22\xbc\xd6c_p\xf0\
-Nc\x93a\xdb\x0b\x5cT`\x1f\xc8\x82@\xb5\xc9\xa4\
-\xca\xf3\xa9\x0d5}\x83\xa5'\x0c\xe1T\xf8\x0a\x0e,\
-\xee\xb5\x02h.\xcbO\xef.\x97c\xe2\x91v\xac\x01\
-!\x8c 3\x8a\x08\xa4\x1f\x82\xdf\x0eA)Nh\x16\
-\x84!\xb4\xe4_\xbe\x94\x17\x0b\x1a\xdd\x0d\xad.\xea\x80\
-v\x10\xd8\xcd%\x1f\x16=\x9f\x85y\xe2\x9d|\xda\xa2\
-\x08\xcb\xfd\xf8\xd8!\xff\xf6\xa4j4\xe5\xc0\xe2\x91\xf0\
-\x8a\x0c\xf6\x8e\xcd~\x1e\x8e\xb0\xee\xb1\x06\xaePw\x11\
-\xa3!\xe9\xa5\xfd\xe3P)cQ\x9a\xf5\xf1\x9b\x0b\xbb\
-\xf4\xaaX\x83\x17\xe7\xb6\x7f\xcb9\xe6W\xbd0+^\
-\xf1\xc3\xad?\xa5\xf9\x1e\x88z4{\x82U\x11a\x89\
-\xeb\xab\xf8\x7fV\xdb\x15U\xfe\xe3{\xae\x84\x91$\xf0\
-\xe6\xe2\xe6[\xaec}L\xe2\xfa\xe5\x1caxX\xde\
-rA\xe7\x13\x1bDEy\x11N\x08\xcb\xf0#\x9c\xe5\
-\xa6a\xa8|\xd1:\xf2\xf6\x04\xc6\xeaSOst\xf6\
-\xc7X \xc3\xc7<\xdf\x1d\xb6@\xcfv\xc4\x1co\xa8\
-\x13\xd0\x08\xff\x1f\xc7}\x19n\xb3\x85\xd5t\x0bx\xe6\
-\xd5\xf9\xf2\xc3\xac\x17Y\xe7\x13'\xf0\x07\xd7\xc2\xbfG\
-Uz\xb3Z\x00\x00\x00\x00IEND\xaeB`\x82\
-\
-\x00\x00\x11\xe7\
-\x89\
-PNG\x0d\x0a\x1a\x0a\x00\x00\x00\x0dIHDR\x00\
-\x00\x00\xaa\x00\x00\x00!\x08\x06\x00\x00\x00I\x010\x99\
-\x00\x00\x00\x09pHYs\x00\x00\x0b\x12\x00\x00\x0b\x12\
-\x01\xd2\xdd~\xfc\x00\x00\x11\x99IDATx\xda\xed\
-\x9cy\x94\x5cU\x9d\xc7?\xf7\xbe\xf7j\xaf\xae\xea}\
-K:d%\x90\xc5\x08\x81\x10\x08'\x11A\x22NT\
-\x14\x8e:\x8e\xc7e\x06e\xf4\xc8\xe2\xb808\xc3\x00\
-\x8a2*\x03\xa3\xe3\x11\x14G\x1d\x8f::\xca\x8c\x0b\
-\x22#\x8a\x08\x89BX\xa2\x10\xd2\x84$d\xedN\xa7\
-\xd7\xda\xab\xder\xef\xfc\xf1^UW\x87$\xa4\x1b4\
-\x99s\xea\xf7Ou\xbf[\xef\xdd\xfb\xee\xfd\xde\xdf\xef\
-\xfb\xfb\xfe\xee)\xe1)-\xa5@\x0d\x97\xbd\xb6\xbb\xb6\
-e>\xf1\xab\x81\xe2e\xc3e\xafKi\x04\x0dk\xd8\
-\x9f\xd9\x0c\x81j\x8f\x98\x83\xaf\x9b\x15\xfb\xc1\xfb\x177\
-}\xae%l\x8c+\x8d\x14Zk\x9e\x1e\xb3\x97\x7fp\
-\xd3\xa1\x9f\xee\xce9}QCjS6@\xda\xb0\x13\
-c\x1a\xf0\x14\xba\xe8)\xb1\xa0\xc9\xday\xe7y\x1d\x1b\
-\x16\xa7C\xdb\xc4P\xd1\xed\xbc\xf4\x81\x81\x8d\xfb\xf2\xee\
-\xfc\xe6\xb0t]\x85\xa1i\x00\xb5a'\xce\x04(S\
-\xa2\xc6*\xca\x9c\x9f\xb4\xfa\xef\xb9\xa8\xfb<#r\xe9\
-U\xb7<4Xz}\x00R\x93\x06H\x1bv\x12`\
-Uid\xc2\x12\xce@\xd1\xeb\x04\xb4X\xfd\xe3\xbd{\
-F+\xaa\xcf\x14\xe8\x86'm\xd8I\xe6Y\xb5\xa3\xb4\
-\xe8\x8d\x9b\xdb\xe5\x84\xadz\x0d\x01\x0d\x906\xec$\xe4\
-\xab\xc2\x94\x82C%o\xb6\x09\xc8\x19fg\xaf K\
-\xd0h@\xe9\xc6\xe24\xec\x88\x805g\xccI3\xb6\
-\xc2}\x05\xdd\xb0%!fJ\xa4h\x00\xb6a/6\
-s&7)\x0do\x9d\x9b`N\xc2\xc2~\x99\x82\xab\
-\x00J\x9e\xa6\x7f\xc2f\xf3p\x05[i\x92\x96\xc0\x9b\
-&X\xa58\xf28\x1b6\xbd9\x14\x80\x0a\xd6\xa5:\
-\x7f\x015<\xa1\xf3jN\x17T\xb6\xd2t\xc7Ln\
-Y\xd9F\xcc\x14\xe8W\x80\x00T\x9f\xd1?as\xe3\
-\x93cl\x1a*\x91\x0a\xc9\xe3\x06\xab\x06\xf2\x8e~\xd1\
-\xa4G}~B\x03\xaf\xc7\xb1\xb6\x02\xca\x9e\xa6\xe4j\
-L\xe9\x831i\xf9\x82z\xd6Q5p\x9aR\x103\
-\xc4\x9f}N\xa7\xe7Q\x83\x9de\x0a\x81\x10>\xb3\xf4\
-\xaa\xe1_i|\xdd@\xf8\x9fR\xfa\x10Q\x87]\x13\
-S\x81/\x85@\x04`Z\x9c\x0e\xf1\xdd\xd7t\xf1\x81\
-G\x0eq\xff\xfe\xc2q\x81U\x03\x96\x14,m\x0f#\
-\x84?\x1e\x09T<\xcds\x19\x07\x8d\xc6\x12G\x9eX\
-\xf1\x12 >V{}\x9b\x0c\xe6E\xeb\xc9\xb6\xea+\
-\xeb\xa3x\xae\xa3\xb5\x1d\x09@U\xef&\xea\xde\xf9X\
-c\x16\x87\x8d\xe7\xa5\xfa\x96\x02J\xaef~\x93\xc5\xd5\
-K\xd3,k\x0e\xf1\xb3}En\x7fz\x1c\xa5aC\
-_\x82\xf7,J\x92\x0e\x19|f\xcb\x18\x0f\x0e\x94\x88\
-[\xa2\xb6\xdcG\xf3\xb0\xf5c?!\xa1\x1f4\x12\x10\
-\x08\x8c`0\x18L\xcd\xcbt\xe0'\xcd\xc3\xae\x89I\
-/\x9c\xb1\x15\xbf\xd8_ i\x09\xd6tFI\x86|\
-\x8e\xfa\xa9\x95\xad\xfca\xacB\xc6V\x98\xe2\xe8\x0bc\
-\x08\x18\xb7\x15\xef^\xd8\xc4-+[\xf1\xf4d\x98\x12\
-\xc0#\x07K|p\xd30\x8e\xf2\xc7\xab\xeb\x00v4\
-\x10\xbeT{\xf5;*x[!\xa0\xecj\x84\x80\xb0\
-\xe1o:W\xf9\x1b%$E\xcd;U\xc7\xebjj\
-^+$\x8fNq\xaa\x80\xabx\x1a\xa5!b\x08\x14\
-\xe0)\x8d%\x8f\xbc\xf1\x0c\xe1\xf7m{\xc1x\xe4d\
-D\xa9\xef[\x06c\xad\x02Vi\x88[\x92;\xcf\xeb\
-`V\xc2\xe4\xf9\x8c\xc3\xac\xb8I\xd1\xd5\x5c\xd0\x13\xe5\
-\xdf\xcemgw\xde\xc1U\xd0\x1e1\xf0\xb4\xc6\x10\x92\
-\x92\xa7\xf0\xb4\xff\xac\xfa\xdc\xe2Hc\x17/3\xf7\x98\
-\x11P\xa5\x10\x93\x9c\xb0\xba\xad\x86\x86\xe0\xe7\xf7\xc2\xc4\
-8,Z\x0c\xaf\xbb\x182\x19\xb8\xf7\xa708\x08K\
-\x97\xc1\xc5\xeb\xc1\xb2\xd0Z#\x84\xe0@\xd1\xe5\x9a\xdf\
-\x0d\x03\xb0\xbc%\xc4\x7f\xac\xeb\xa23j\xd0\x155\xb8\
-dv\x8c\xbb\xfb\xb34\x87\x8f\xe5U\xfd\xc9\x8e\x9b\xfe\
-`\xee\xd9\x9d\xe7\x99\xb1\x0a!Cp\xe9\x9c\x04k\xba\
-\xa2\xac\xeb\x8er\xcf\xee<)\xcb\xdf0U0\xbb\xc1\
-g\xbd\xc3\xafNf}{\xf5\xfb\xf5\xe6i?\xf9\xab\
-(M\xc9\xf1=\x91\xd2p\xa0\xe0\xe2(M\xd2\x92,\
-j\xb28X\xf2\xc89\xaa\xb6PYG\x910%\xf3\
-\x9b,\xc6*\x1eC%\x8f\xa4%\x8f\x08ROC\xc9\
-U\xcc\x8e[\x84\x0d\xc1\xae\x9cC\xdc\x14\xb4FM\x86\
-\xcb\xde\x8b6pu\xe3\xa7B\x92Yq\x8b\x8a\xd2\xec\
-/\xb8\x18\xc2\x07J\xc6V$,\xc9\xbc\xa4E\xc9\xd3\
-\xec+\xb8\x84$DM\xc9H\xd9\xe3\xd4\x94\xc5\xbc&\
-\x8b\xbb\xfa3\x5c\xb5i\x98\xae\x98A\xd1U,i\x0e\
-\x03\xf0\xc1\x8d\xc3<8P\xa4'f\x92\xb0$c\x15\
-\x8f\xde\xb8I\xd2\x94\xec-\xb8\x14]M\x22\xf0\xb2\x8e\
-\xd2T\x94\xa6/naI\xc1\x9e\xbc\x03@\xd4\x143\
-\x06\xab\xf9\x8a\x90\x9bJ\x05\xfe\xf9\xb3\xb0s'D\x22\
-\xf0\xd0C\xf0\xe8\xef|\xa0\xee\xd9\xe3_{\xe4a8\
-4\x04\xef\xfb\x9b\x1a*L\x01\xcdaI\xd8\x10<9\
-Z\xe1\xdf\x9f\xcb\xf0\xf7+Z\x008\xb3-\xc2\xd7E\
-\xf68\xd8)5 \xff\xf7\xee<\xdf\xdb\xe1\xdf3^\
-Q|aU\x1b\x09S\x92\xb5\x157\xbc\xba\x85\xd5\x1d\
-Q\xde\xf6\xebA\x1c\xed\x83\xe9G\xaf\xed\xe6;;s\
-|\xee\x0f\xe3\xfc\xeb\xeav^\xd5\x1a\xe6\x1d\xbf>\x88\
-\xa34\xcda\x83\x1f^\xd8\xcd]\xdb2|\xeb\xf9,\
-\xe9:\x1a\xa2\xb4\xe6\x9bk\xbby!\xe7\x102\x04o\
-\xec\x8b\x03p\xfb\xd3\x13<6R\xe6\xee\xf3;\x88\x9b\
-\x92\x83%\x97+\x1f9\xc4\xd6q\x1bW\xc1\x9b\xe6$\
-\xf8\xd4\x99\xad\xa4B\x12Wk\xbe\xf2l\x86;\x9e\x99\
- R\xc7\xf9D\xddf\xbamU;o\x9d\x9b@\x00\
-O\x8eT({\x9a\xbe\x84\xc9\xfa_\x1c\xa8Q\x1c\x1d\
-\x84\xee\xbc\xa3\xf9\xcb\xf9I\xae{U\x0b\xe9\xb0\x0f\xfe\
-\xa7F+\x5c\xb5i\x98\x17\xf2\x0e\x97\xcfMp\xfd\x8a\
-\x16\xda#\x06\x00\xbf\x19,q\xc3\x13\xa3l\xcf\xd8|\
-dY3\x1f:=\x85\xd2\xf0\xf6yI\xde6/\xc9\
-g\xb7\x8cq~W\x94\xf5\xb3bh\xe0\xdb\xeb:\xc9\
-\xd8\x8a\xf7>4\xc4@\xd1\xe5\xf6s\xda\xb9ln\x02\
-\x80\xfd\x05\x97\x8f>:\xc2\xa3\xc3e\xc2R\xd0\x14\x92\
-|aU;\xeb\xba\xa3\x00l\x1d\xb7\xb9\xf6\xf7\xc3\xec\
-\xc8:\xc4f\x08V\xf9\xb2@\xaa\x95\xff\xb9s\x07\x1c\
-8\x00mm\x10\x8bAK\x0b<\xff<\x8c\x8e\xfa\x7f\
-W\xafm~\x0cJ\xa5\x80\xbfN\x86\x1dWi\xe2\xa6\
-`\xa0\xe8\xd5\x1e\xdd\x12\x96\x18\xe2\xf8H{\xd5\xe3\xbd\
-}~\x92[\xcfn\xe7\xb6s:\xb8jI\x9a]9\
-\x87_\x1e(\x92\xb0$s\x93\x16K\x9aC$,\x89\
-\xedA*dpJ\xd2bn\xd2B\x01\x0bS\x16\xa7\
-\xa7C\xc4L\x81\xad \x1d\x92\xcc\x8e\x9b\x9c\x92\xb4\x02\
-\x1e.j|+fJ\xbac\x06\x97\xcdM\x101\x04\
-7=9\xc6\x81\xa2\xcb\xb5\xcb\xd2|aU\x1bw\xf7\
-g\xf9\xd6\xf6,]Q\x93+NM1VQ\xac\xe9\
-\x8a\xf0\xc5\xd5\xed<3n\xf3\xd1GG\xb8wo\x91\
-\x0f/Is\xe5i)2\x8e\xaa\xbd\x83\x14Pp\x15\
-\x1f[\xde\xcces\x13\xdc\xbf\xbf\xc8\x0dO\x8cb\x08\
-8\xb73B\xc4\x10D\x0c9\x85Ndm\xc5\xc5\xb3\
-b\xdczv\x1b\xe3\xb6\xc7-[\xc6\xf8Z\x7f\x86\xd3\
-\xd3!\x9aB\x92\xb5]Qn?\xa7\x9d\xbc\xa3\xf8\xd4\
-Sc|{G\x8eu\xddQ\xber^\x07QS2\
-Xt\xd9\x9ds\x91\x02&l\x8fg\xc7+\x8cU\x14\
-{\xf2.#e\x0f\x01\xec\xcb\xbb<\x9fq\x18\xb7\x15\
-7\x9e\xd1\xcaes\x13\xdc\xb9-\xc3'\x1f\x1f\xc5\xd3\
-\xf0\xad\xb5\x9d,l\xb2(\xb8\x8a/\x9d\xdb\xc1\x9a\xae\
-\x08\x9f\xff\xe38\x9f~j\x8cYq\x93o\xae\xed\xa4\
-9,q\xd4\xcc\x92\xef\x97\xe9Q\x83.cq_\x92\
-\xf5\xbcI\x06\x1f\x0e\x07q\xd2\xf3\xbd\xae\xe7A8\x02\
-\x96Yw\xb7\xc0\x10\x02KB\xd1\xd5\xccIN\xb6\xe5\
-\x1d\x8d\xd2:\x80\xc7K;u\x807\xcc\x8e\xf3\xc6\xbe\
-8J\xfb\x0b\xbe=c\x93\x0aI\xf6\xe6'\x0b\x0a\xb5\
-\x04CO\x95Z\x94\x9e\xca\xa1j_\x0bn\xd0\x87\x85\
-\xfe\x88!\xd9\x9eqx\xdfo\x87\x18\xab(\x94\xd6\xdc\
-tf+w<3\xc1\x97\xb7N\xd0\x1e5\xb9pV\
-\x8c\xc5\xe9\x10\xa6\x80w/l\xa2\xa247>9\xca\
-x\xc5c\xe3P\x89\xc5)\x8b+\x16\xa7\xf8\xee\xce\x5c\
-\x8d\xb7\xda\x0a\xba\xa2&\xef\x98\x9fd\xe3P\x99\xf7>\
-4\x84\x06\xbe\xbf+\xcf\xaf.\xe9%\x15\x92\xb51\xd5\
-\x14\x13\x01\xefZ\x90D\x03\xef\xfa\xcd\x10\xfd\x136Q\
-S\xf0\xc5\xad\x13d\x1d\xc5\xf7/\xe8\xc6\xd3\xf0\xce\x07\
-\x0f\xb23\xe7b{\x9a\x83E\x97\x8f-o\xe6\x0d\xb3\
-\xe3|\xb5?\xcb\xe3\xc3\x15\x1e\xde0\x8b\x1f\xef)p\
-\xddc#\xf4%,\xbe\xb73G\xc6\xf6\xb8~E\x0b\
-\x1f\x7ft\x84\x8d\x87\xca\x9c\xd1\x16\xe6\x9d\x0b\x92\xfc\xcf\
-\xee<_\xd9\x96\xc1\x100Tr\xb9\xfb\xfcN\xde<\
-'\x01\xe4Y\xdd\x11\xe1\x8b['\xf8\xf6\x8e\x1c\x12_\
-M\xf8\xf4\xcaV6\xf4%\xf8Z\x7f\x86\x96\xb0\x9c\xb6\
-\xfch\xce,\x95\x0a\x16\xae\x8a\x90SN\x81\x05\x0b\xe1\
-\xd9\xad\x90LN\x05,\x80a\xc0\xc4\x04\x5c\xba\x06L\
-\x0b<\x05\x86\x1f\xfeF+\x1e\x1a\xcd\x92\xe6\x10\x7f\xb5\
-\xa0\xa9v\xcbS\xa3\x95\xe3~\x99*\xc0>\xff\xc7q\
-~=P\x22b\x08\x966\x87\xf8\xccY\xad\xdc|f\
-+\x1b\xfew\xa0F\xf0\xa5\xf0\xc3H\x95c\x8b)\x0a\
-D\xa0%\x8a\xba\xf6\xe0\x1d\xc5a3\x10\x920R\xf6\
-\x08IAW\xd4\xa0\x14\x0cv\xb8\xe4\xd1\x1d31%\
-\xe4\x1dE\xd4\x90\xc4-Io\xdc$,\x05\xf7\xad\xef\
-\xc1\xacK(K\x9e&\x15\x92\xe4\x1d\x17\x0b\x81\xa34\
-\xad\x11\x9f\x0e=8P\xc4\x94\xd0\x133\xd9_p\xd9\
-<\x5cf\xc3\x9c8\xea\xb0w\x8f\x1a\x92\x05M\x16\x7f\
-\x1c\xab\xb0\xaf\xe0\xd0\x970\xf1\x82H\x95\xb4$\x0bS\
-\x16O\x8c\x94\xd9_p\x99\x1d7\xc9\xda\x8a\x07\x07K\
-|ly3\xf3\x9b,b\x86\xa09\xa0\x0b\x11C\xd0\
-\x1a1\x88\x9b\xfe\xb5X\x90\x0c\xa7\xc2\x92&K0/\
-i\x01pI_\x9c7\x9f\x92\x98B\xbdZ#\x92E\
-)\xbf\xfd\x03\x8bS\x5c\xb5$\x0d\xf8\xe3\x00\xe8\x8e\x19\
-\xc7\xa9\xb7\xbcR@\xd5\xba\xce3\x05Y\xc8\x07\xfe\x16\
-n\xfe'\x9f\x97F\xa3>X\xc1\xf7\xb4\x13\xe3\xb0v\
-\x1d\xbc\xf5r\x7f\x98\x01\x0a:#\x06\x1f_\xdeLs\
-X\xb2\xa1/N[\xc0\x9fF\xca\x1e?\xd9\x93'~\
-\x9c|\xa6:\x96\xed\x19\x9b\x87\x07\x8b\xa4\xc3\x92M\x87\
-J|\xe8\xf4\x94\xbf\x10\xa6\xc0\x0d\x0a\x13eOSV\
-\x8aJ0\xbb\xd5\xe7W\xbb)y\x9a\x8a\xa7({\xfa\
-\x98b\x90\xae\xa3\x1cn]\xd1\xc3\x94\xe0j\x8d\xd4\x82\
-\xea\xb1^Gi\x5c\x05\x05W\xf3\xfe\x87\x87\xfc\x8d\x80\
-\xa0\xe2)\xb2\x8eb\xa8\xe4aI?\xab\x97\x81\x8a\x00\
-0;aRp\xfc\xef8J\xd3\x133q\x0f\x0b\x9d\
-\x02\xbf\xbf\x09G\xd1\x1d5\xb1\xa4`\xc2VH\xe1G\
-\xa9\xb0\x14dmEO\xcc\xc4\x10\x82\xac\xed1n+\
-zb\xd1\xa0\xc2\xe8\xf9g@\xf5\xe4\x5cz\xdaW5\
-\xbc\xba(\xe3\xe9\xaa^\xedo\x93\xfb\xf6\x15\xb9\xfb\xb9\
-\x0c\xed\x11\x83r\x90\xddo\x1d\xaf\xb0\xa6\xcb\x7f\xee7\
-\xb6g\xb9o_\x81\xd6\x88A\xd1\xd5\xb8J\xb3'\xef\
-\x92\xb4$J\xeb?3G\xadzU\xa5\xa0\xa7\x07>\
-\xf9\x8f\x90NC\xb1\xe8{\xd1\xaa']\xb5\x1a>|\
-u-\xbd\xaez\xa9\xd6\x88\xc1G\x96\xa5y\xef\xa2&\
-Z\x03\x90*\x0d\x9f||\x94\xfd\x05\xd7\x97P\x8e\x83\
-zT\x1d\xfb\x92\xe60\x17\xf7\xc5Y\xd3\x15\xe5\xda\xa5\
-iz\xe3&\x07\x0a.%W\xb3+\xe0`\xaf\x9f\x1d\
-#n\x1al\x08\x12\xa0]9\x07\x01\x8cU\x14aC\
-pQo\x8c\xa4e\xf0\xf6yI\x7f\x81\xd4\xd1\xbd\xb8\
->\xc6\xa6\xa1*a\x09_.\xba\x7f\x7f\x81\xb8)8\
-\xbb=\xc2\x96\xd1\x0a\xcfNT8\xaf+\xca\xdc\xa4U\
-\x93\x8c\xb4\xf6%\xa5}\x05\x97\xc7\x86\xcb\xbc{a\x13\
-\x97\xcfK\x12\x96\x82k\x96\xa6Y\xd5\x11!\xe7\xa8)\
-U\xb8*\xb0\xef\xdfW\xa4#jp\xfd\x8a\x16\xda\x22\
-\x06\xf3\x93\x167\x9d\xd1Bw\xcc\xe0\x87/\xe4\x99\x15\
-7\xb9~E3\xa9\x90\xc1y\x9dQ\xfe\xe1\xd5\xcd8\
-J\xf3\xf0\xc12\x91\xe0\xe8\xdcKE\xad\x88!y.\
-c\xb3#\xeb\xf0\xda\x9e(qS\xb2q\xa8D\xc9\xd5\
-\xbc~v\x8c\x98)\xd9<\x5c&\xef(\xd6\xcf\x8aa\
-+\xcd\xc6\xa12\x11Cpq\xf0\xffL\x0b0/?\
-\xeb\x07?9R\x0af\xf7\xc1\x0d7\xc2go\x81C\
-\x87\xc0ua\xf5\xb9p\xcdG|\xcfZ\xf5\xbeG\xa9\
-Lm\x9b\xb0\xb9iZ\x95\xa9\xa9Y\xff5K\xd3\xfc\
-\xdd\xb2t\xedyyG\xf1\xa5g'\x88\x98\x82\x1f\xec\
-\xca\xf1\xa69qn=\xab\x8d[V\xb6a\x08?\x1b\
-\xfd\xe9\xde<\xe9\x90\xe4\x9e\xddy\xde4'\xce\x1d\xe7\
-\xb4s\xc790a\xab\xe0\xd5\xa6V\xb7\x84\x98\xf44\
-\x8e\xd25y\xcb\x09\x16\xc1\x0d\x12/\xa5\xc1\xd3\x1a[\
-\xf9\x1a\xe57\xb6gY\xd1\x1a\xe6\xea\xa5i>\x1c\x84\
-D)\xe0\xd6?\x8c\xe1\xd5q\xf1\xaaX\x7f\xf3\x93c\
-|sm'w\xad\xe9\x00\xfc\x04k4Hl\xbc:\
-\xf1_iHX\x92\xafo\xcfrvG\x84\xf7-j\
-\xe2=\x0b\x9bjb\xfbo\x0f\x96\xf8\xf2\xb3\x19\xcej\
-\x8fp\xc5\xe2\x14\x7f}j\x0a)\xfc(\xf0\x89\xcd\xa3\
-\xec\xcc:\xc4\x0cQ\x03\x91}X\x08\xab\xbd\x97\xf29\
-t\xc9\xd5\x5c\xf7\xd8\x08_=\xbf\x83\xff\xbc\xa0\xab\x96\
-\x0fdl\xc5wv\xe4xz\xcc\xe6\xba\xcd\xa3\xfc\xcb\
-\xaa6\xee[\xdf[k\xdf\x95s\xb8s[\x86\xca\x8c\
-\x02?\x88\xd3\xfek\xf7q\xdfS-\xa1\xf6\xc6M~\
-\xb1\xbe\xb7&\xab\xd4\xa0\xa7\x94\x0f\xda\xb1Q\xf8\xf4\xcd\
-\xd0\xd7\x07W_;\xf9\x0d!\xa6\x00s\xa0\xe8\xf2\x93\
-=\x05\xb2\x8eb\xcbh\x85\xc7\x87\xcb\xd8\x8a\xe3\xae\xf5\
-\x8b\x00\x18-a\xc9\xba\xee\x18\x02]\x13\xe2\xf3\xaef\
-\xf3p\x99\x83E\x8f\x84%(\xba\x9a\xb6\x88\xc1_\xf4\
-\xc5\xe9\x89\x19\xbc\x90s\xb9w_\x81\x9c\xa3\x88\x99\x92\
-\xd1\xb2\xc7\xf2\x960\x17\xf4D\x19(\xbad\x1d\xc5\xd7\
-\xcf\xef\xe4\xb6\xa7\xc7\xb9\xed\xe9\x09Z\xc3F\x00(\x7f\
-\x0e\xce\xe9\x880a+\xfa'lL!HX\x92\x95\
-\xeda~7T\xc6V\x1aGi^\xd5\x1aF\x06|\
-\xdb\x14\x02Gk\xce\xef\x8c\xf2\xea\xb60\x15O\xf3\x9b\
-\xc1\x12[\xc7m\xe2\xa6xQ\xa5\xa8\xe8j:\x22\x06\
-\x97\xf4\xc5i\x09K\xee\xdd[\xc0Q0+n\xb2i\
-\xa84E\xf4\x17\x80\xa35\x12\xc1\x85\xbd1NK[\
-d\x02\x1e\xfaB\xce\xc1\x0a\xfa^\xdb\xe5\xf7\x9d\xb5\x15\
-\x0f\x0c\x94\xd8\x99\xb5\x83P\xec?gMW\x94\xfe\x09\
-\x9b\x83E\x97P\x00\xde\xf6\x88\xc9\xb2\xe6\x10\x0f\x0f\x95\
-j\x1as\xc1\xd1\xb4E\x0d.\xea\x891;a\xb0'\
-\xe7r\xff\x81\x22Y[\x113\x05YGqJ\xc2\xe2\
-\x82\x9e\x18\xed\x11I\x7f\xc6\xe1\x81\x03E\xdcc\x14+\
-^\xc2\x9c\x19\x01\xb5'f\xf2\xf3\xf5\xbd\xb5\x09\x9e\xe2\
-#\xab`\xcd\xe7\xc0\x0a\xf9\xd9\xffa\x9e\xb4\xaa\x13\xde\
-\xbf\xbf\xc8\xe5\xbf\x1a$\x15\x92\x18\x02\xe2\xa6\x9cv\x05\
-\xa3\x0a\xd6\x82\xa3\xa6\x0a\xe0\x02b\xa6\xa8U\x7f\x8c\xc0\
-\xeb\xe5\x9dI0'-\x89%!\xe7\xf8\xc0\xfb\xe8\xf2\
-4?\xdb[\xa0\xe0h\xaeX\x9cbQ\xca\xe2\xd2_\
-\x0e\xb2e\xac2\x85/\x0b|\xbeY\x15\xd3\xab\x8aB\
-\xc1\xf5\x05\xfd\xaa7+y\xbe\xda\x10\xab\xab\x18\xe4]\
-E@\xf3\x88\x18\xe2\xa8\xbab\x952\x14\x5c\x7f\xbc\xb1\
-\xa0\xfac+M\xc2\x94/Z\xec\xaa\x97\xca9\xaa\xb6\
-\xc9\xa3\x86 R\xd7w\xce\xf1O\xbc\x81?7Qc\
-\xaaC\xc8\xbb\x8a\x88\x1450U7@\xd9\xd5$\xea\
-\x0a\x13\xb2n.u0\x97qK`\x0a\x9fg\x1bA\
-U\xaa\xe8\xea\x1a\x97OX\xb2\xa6\xfb\xce\xc0\x9ci\x87\
-~C\x08r\x8e\x22g{\xc4M\x13W\xe9:\xce$\
-@H\x9f\xd8\xc5\x13>@k\xa5\x9f\xa9|\xc7\x10\xf0\
-\xc4H\x85\x96\x90\xe1\xebkZO\x95\x8f\xa6\xa1@T\
-\x0b\x07G\xe2U\xd5\x1a\xb9\xd2\xfe\x19\x85\x96\xb0\xaf\x88\
-jt\x8dgJ\xe1'$\xa7\xa6B\xac<#\x02\xc0\
-h\xc5\xe3\xda\xdf\x0f\xb3e\xb4B\xdc\x12/\x92\xae\x12\
-\x96\x98\x92\x8c\x19\x82)E\x01\x1d\x80\xe1\xf0\xd3FI\
-K\xd6\x92,\x15\x8c\xe1h\x9c\xd0\x92\x93\xe3U\xf8\x09\
-l\xd882\xb0\xab\x97\xd2!Y{\xbf\xc3\xcf\xf86\
-\x85\xfc\xbeu\xd0\xf7\xe1Q+\x15x\xd7\xfa4\xd2\x12\
-\x82ph*\xa0\x8f5\x97\xd5\xb9\x0e\x05\x9b\xe4\xf0\xf6\
-\x19\xa7B\xd3\xf1\xa8\xd5\x05\xc9\xd8\x8a+OKq\xfd\
-\x8a\x96i\x9f\x9e\xaar\x96G\x0e\x96\xb8r\xe3\xa1)\
-\x15\x96\x13zr\xc8\xd5\x84\x0cAO\xcc\xdf\xbb\x83E\
-\xd7\xf7\x90\x96D7\x8e_\x9dhs\xa6\x0d\xd4j\x98\
-)\xba\x9a\xb3\xda\xc3\xacl\x8fL!\xf6S\xcf-\xea\
-\xda\xff*\x90<\x0c\x01\xfb\xf3.\x0f\x0e\x96\x00]\xd3\
-\x14O\xf81\xb7 K\xb7\x03\xd7\x112\xfc\x12\xaf\xd7\
-\x00\xe9\xff_\xa0\xd6J}\x8e\x7f\xf8`\xba%\xb1*\
-g\x99I\xf6\xf7\xa7\xb6*\x8di\x1c\xba>\xb9\x80j\
-\xd6%\xe1\xd32\xffh\x98 qL)\xf6\xe8\xab\xed\
-\xe9\x93\xf3@s\x03\xa0'\xa7\x99\x1a\x94\x08N\x93\xce\
-lQ\x1b+\xdb\xb0?9-sesH\x1e\x08\x04\
-\xe4\x06\xe2\x1av\xb2\x01T\xbbJ\xd3\x115\xf6\xc9\x0b\
-{c\xf7\x14]\x85!\xf1\x1aS\xd3\xb0\x93*\xdcK\
-\xdc\x92\xa7\xb9\xb07\xf6#1Tt;.}``\
-S\xe3\xb7\xa7\x1av\x12yReJ\xd4hE\x99\x0b\
-\x9a\xacm\xf7\x5c\xd8\xbdFvD\x8dCw\xad\xe9|\
-\xcb\x9c\xa4\xb5g\xac\xa2LG58@\xc3N\x9ci\
-\xc0Q\x88\xd1\x8a2\x17\xfa\xbf\xe6\xf7\x96\x96\xb01&\
-\xaa\xbf\x8f:R\xf6\xda\xee\xea\xcf|\xfc\x81\x03\xc5\xcb\
-F\xca^\x97\xa7_\x81\x93U\x0dk\xd84\xcd\x10\xa8\
-\x8e\xa89xQo\xec\xfb\xef_\xdc\xf4\xf9\xea\xef\xa3\
-\xfe\x1f\x85\x18{Op\xed\xd1\xc5\x00\x00\x00\x00IE\
-ND\xaeB`\x82\
-\x00\x00\x01\xd3\
-\x89\
-PNG\x0d\x0a\x1a\x0a\x00\x00\x00\x0dIHDR\x00\
-\x00\x00\x18\x00\x00\x00\x18\x08\x06\x00\x00\x00\xe0w=\xf8\
-\x00\x00\x00\x06bKGD\x00\xff\x00\xff\x00\xff\xa0\xbd\
-\xa7\x93\x00\x00\x01\x88IDATH\x0d\xcd\x95?K\
-\xc3P\x14\xc5OZQ\x14Qt\x12\xff\x0d\x82\xae\xce\
-\xceZp\x13:\x14\x5c\x1c\xfc\x06\xba9\xf9\x09\x1c\x14\
-\x1c\x9c\x1c\xb4\xa0\xbb\xab\xaeNNR:\x88S\x93P\
-\x90\xaeZ\x10s</-%\xadI\xfa\xa2\x19\x0c\xef\
-\xa4\xef\xdd{\xdf\xef&7\xb7<\xe0\xdf^/\x1c\x83\
-\xcb\xf5a\xcfW\x18\x16\x90\xe8\x9f\xc0\x09\x02\xbc%\xfa\
-\xff\xe4\xf0\xb8\x03\x8f5\x1bF\xf67\xf0\xb9,\xf0\xa5\
-t/\x0d\x1d\xd9\x12\x90E\x10W\xa2\xceHV\x09\x14\
-\x97a\xf8<Ri(}\xe2\x95\xd3\x19vZ\x84\xba\
-\xdc\x08\xc1\x1eM\x82G\x8b\x1da\x88]\x89Z\x9cR\
-\xf4\xb54\x22\x01\x0e\xac\xcbc\x97\xe0\x03\xe7\x82\xae\x84\
-ps\x0b\xec\x138&>U.+\x82\xdf\xf6\xc5\x10\
-\xa7\xb2\xb5{\xb6\x00U,9\xcf\xbdud\x92\x9e\xc0\
-\xe5\x9a@O\x8a\x9f\x94\x92\xc6\x03\xe6Q\x82\xe3\x04q\
-\x01\x858ch\xabqT\xf0\xaa\xe6i\xf0\x96\xfe\xcd\
-{Ip\xed\x15\xc2\xdc\xe3\xd4\xe0*\x0a(G\x5c\xe3\
-\x9a\x1fK\xd1\xb1\x8b\x05\xe7&j\xf8\xfd\xdccIm\
-jZ\xb4#\x97\x176\xb0\xe4\x12\xfd\xdc\xbd\x191\xd5\
-\xf5v\x07\x91u\xe2\xb4\xd3\xd7\x89\xee>\xc7Vw\xd5\
-F\x11\x15\xcc9\xef\xddu\x0e?\x0d\xce\xaa<_\x12\
-u\x06\x1c\xe6@\x1c@\xf8,\x87p\x9fw \xd3[\
-{`\xab\xdd7 L\xfd\x9b\xaa\xfb\xbeZ\x92\x03\x8c\
-\x1c\x96\x1e\xeb\xf0\xb9\x9d\x03)\x06\xe1rQ\xe59\x8b\
-\xf1\xe4d2\x07\xbb9\xe0s\xc2\xe5\x8e\xf9\x06\x15\xeb\
-{\x973\x94U\xaf\x00\x00\x00\x00IEND\xaeB\
-`\x82\
-\x00\x00\x01n\
-\x89\
-PNG\x0d\x0a\x1a\x0a\x00\x00\x00\x0dIHDR\x00\
-\x00\x00\x18\x00\x00\x00\x18\x08\x06\x00\x00\x00\xe0w=\xf8\
-\x00\x00\x00\x06bKGD\x00\xff\x00\xff\x00\xff\xa0\xbd\
-\xa7\x93\x00\x00\x01#IDATH\x0dc`\x18\x05\
-\x03\x1d\x02\x8c0\x07\xfc_\xc0\xe0\x0ddO\x06bE\
- FE\x8c\x0c\x15\x8c\xf1\x0c\x9d\xa8\x82\xc4\xf1\x98\x90\
-\x94M\x07\xb21\x0d\x07\x0a2\xfcg\xe8\xf8\xbf\x90\xa1\
-\x1c\xc4$\x153\xc24\x00}\xf0\x1f\xc6\xa6\x80\xbe\x07\
-tL.c\x22\xc36\x98\x19\xc8>\x80\x89QB+\
-101LC6\x80\xda\x160\x00} \x8fl\x01\
-\x0b2\x07\x85-)\xc1\xc0\xc0\xcf\xc7\xc0\xc0D\xba\x1b\
-\xfe\x9fbx\x0e\xb4\xa8\x82\xd1\xfc\xc6B\xecq\xc0\xc5\
-\xc5\xc0\xa0 \x87b\x1f\x19\x9c\xcf\x0c_%\x84\xb0;\
-\x8f\x8b\x83\x0c\xf30\xb4p1\x88\xbd\xc6\xe1\x7fv*\
-X\xc0\xc8x\x8bQ\xfb\xea/\xec>\xe0`\xc7p\x0e\
-\xc9\x02\xff\x19.\x83\xf4`Z\xc0\x04\x8c\x16v6\x90\
-\x1c\x85\xf8\x1f\x0e\x0b\xd8@\xae\x07ZB\xa1\xf1\x0c\x8c\
-\x0c\x97@F`\xfa\x80\x1dd\x01H\x8aB\xfc\x87\x11\
-\x87\x05\xd4\x08\x7f\x06\x86O\x0c\x167\x1e\x82\x9c\x88\xec\
-\x83\xa7 \x01\x06\xeaXp\x86\x91\x11\x98\xd5\x80\x06\x22\
-[\x90\x0e\xe4?c\xa04\x88\xfe\xfcy\xcf\xf0\xff_\
-\x11\xd0\xacQ4HB\x00\x005\x8e2c\xa0*\xac\
-\x9c\x00\x00\x00\x00IEND\xaeB`\x82\
-\x00\x00\x03\x11\
-\x89\
-PNG\x0d\x0a\x1a\x0a\x00\x00\x00\x0dIHDR\x00\
-\x00\x00\x18\x00\x00\x00\x18\x08\x06\x00\x00\x00\xe0w=\xf8\
-\x00\x00\x00\x06bKGD\x00\xff\x00\xff\x00\xff\xa0\xbd\
-\xa7\x93\x00\x00\x02\xc6IDATH\x0d\xb5U\xcdO\
-\x13Q\x10\x9fy\xc5\xb4\xddmc\x8c\xc6\x04l z\
-A\x10\x83\x17\x10n \x18\xafz\xd0x\xd4\x13j\xfc\
-\x00\x13\x15\xfc\x0b$\xd1\x83H\xd4\x8b\x07o\xfe\x07^\
-\x80\xc2A\xa1~\x1dH\x14\xc1\x10\x94\xe8\xc5\x8b1\xfd\
-\xa0\x86\xf4\x8d3o\xdb\xb5\xcf\xee\x06\x94\xd0\xccow\
->\x7f\xd3\xf7\xe6\xed.\xc06\xffp3\xfc\xb9\xde\xce\
-vPt\x18\x00\xf7z\xf9\xf4\x1d@\xcd'&3\xf3\
-\x9e\x1d~\x0dm@==\xb1|]~\x10\x08/p\
-y\x13#H>\x03\xc1cW;\xf7qz\xba\x18\x94\
-\x10\xd8\xa0\xd0\x7f\xb4K\x13=\xe3\x820b\x0eY\xb2\
-\xa2H\x9fu\xa6\xde\xbc\xb2\xbcl(\x86%\xd9\xfe\x8e\
-3L>\x0d\x00\x9b%\xe7T\xd8\xafQ\xcdd\x8fu\
-\x9e\x16\xa3\x1a\xd6\x0ar\xc7;\xfa@\xe3sN\xd8\xc1\
-\xf8\x1fY'\xc0\x13\xc9\xc9L\xbaR\xec7\xa0\xee\xee\
-x\xde)-q \xc5\xd8\x8a\xac\xba%\xa7\xb92\x13\
-\x7f\x8b\x98\xfc\x0a\xb3\xd6\x92#\x02:\x0e\x87l\x09\xf2\
-\x953\x1a\xf3j\xedrY\x07\xbf\x01;.1lA\
-\x05\xd1\xa1\x11\x88=|\x0a\xb8{\x8f\x1f\x13]|\xd1\
-\xeb\xb7\xf9\xe4VSx)\x84t\xd1\xd3\xf80\x8b\x92\
-\xed\xed8\xc4\xf7&\x86%\xf2/Uk\x1b\xa8T#\
-\xc4\xee\x8c\x01\xee\xdce \xba\xf8TK\x1b`<n\
-\xd5\x88\xc1\xfb~ \xdb\xdf\xd5\x22z\x9d\x5c0\x82\xed\
-|\x9eE\xb5@\xf9\x1c\x14\x07\x07 6:\x06\xaa\xb9\
-\x15\xe2\xe3OL\x9a\xaa\xdf\x07z\xf1\x03\x14o]\x05\
-*\xe4\xad\x9a\x8a\x81Z\x1fa}\xc1[\x1fQ=\x1b\
-\x81B\xb9\xac!\xd2\xcbK\x80Ll\xc8Y7\xe4\x1c\
-\x0b,\x12'R\x83\xdc\xca\x0d\x14\xafJ\xcc\x10D\xa3\
-\x00q\xc7\x0f\xa2\xe8\xe2\xf3=\xe1\x8a\xd7\x00\xe8[X\
-\x8a\x19\xe8\xbdG\xa0\x1aR\xa0?-\x1a \xeb1\xf6\
-I,\xac\x8e\x00\xbeJ\xcc4 \xa2\xc0\x97\x16\xba\x09\
-o\xffy\xc8ze\x19\x8a\xc3\xd7\x0cD\x97!\xcb\xb0\
-\xd1q\x85\xa7\x16\x181\x9c\xa6A2\xfd\xfa=g,\
-1,\x91!\x97^\xccx\x03\x1d\x1a\x00\xfa\xf9\xc3\xa0\
-\xc8\xba\x0c\xb9\xf4r&x\xc8\x84\x1f\x93\x13s\x0bB\
-\xe6\xef}\xae\xaf\xf3&;F\x19\xb6\xc8\x83\xc6G\x91\
-\x0a\x05\xcb/G\xf8o\x9f\x9f@x#1\x95\xb9+\
-\xb6Y\x81(n!\xf2\x80\xeff\xdf\xf8\xfeG\x88\xf8\
-_\xda\xe4\x12\x0c%\x07Xuu|\x5cr\x04~\x03\
-\x9c\x9d]C\x8d'\xd9Y\xcb\xc6\xceMJ\x01I\x9d\
-\xaa\xbc\x87\xa4\xc6o \x86\x9b\xce\xbc\xe5\xc7\xfc<\xeb\
-\xbf\x18\xff*E^\xec9wj\xee]u!V\x1b\
-\x15}[?8\xd2\xc4\x99\xc8\xcc\xf1+\xf7  \x8d\
-\xb0\xfd\x85\x11&\xf2\xc9\x1c\xe6\xdc\xd6\xa0\xaf\x99\x14\xa1\
-\x5c6\xc2V>\xfa\x1bqo9\xfe\x1bK\x1c\x00N\
-l\xa2TU\x00\x00\x00\x00IEND\xaeB`\x82\
-\
-\x00\x00\x01\xbf\
-\x89\
-PNG\x0d\x0a\x1a\x0a\x00\x00\x00\x0dIHDR\x00\
-\x00\x00\x18\x00\x00\x00\x18\x08\x06\x00\x00\x00\xe0w=\xf8\
-\x00\x00\x00\x06bKGD\x00\xff\x00\xff\x00\xff\xa0\xbd\
-\xa7\x93\x00\x00\x01tIDATH\x0d\xedS\xc1J\
-\xc3@\x10\x9d\xad\x82\x90B\x84~\x81\x9fa\x0f\x1eL\
-\x8b1\xe05\xbdi\xc0zQi/\xfe@\xfe@\x11\
-\xea\xb1\x9a\x9b4\x07\x05=4R\xf5$\xfd\x0d\xbf@\
-\xd0C\xd4C\xba\xbe\x09ih\xd0\x906\xf1\x980\xb3\
-\xbb\xb3\xb3\xf3^\xf2vBT>\xa5\x02E\x15\x10E\
-\x01f\xeb\x1b\xcev\x9d\xa4<\xf1\x15uw\xdcr?\
-9\xb7\xcc\xc3\x7fx\x04>\x04\x96Z\xf5\xdf_0\x9f\
-\xc2\xa9\xc2CQ\xd7\xfa[\x1a\xde|\x04\x1c\x15\xde\x1b\
-Y\x0fg\x98C+,\x11\x83\x8b\x8a\xb8\x03\x9a\x02\xef\
-=Z^\x87\x04I\xacC+D\x90\x05\xce\x0c\xb9\x09\
-\xe6\x01\xcfM0/8\x13\xc4\x97l\x9c\x1b+MG\
-\x1f4/\x8duN\xa49w\x0b4\xbfA\x9e5\xbf\
-\xdax\xadwg5\xc7~\xc2b\x82o5\xe8HI\
-\xa6\x14\x13/\x8d\x84\xc1\xd1-C p\xb70x\xdb\
-\xb6\xed\x09\xe2T\x8b\xef\xc0\x1c\x98Ko\xfeG\x1f'\
-\xf7\xe0>\xdej\x07\x1d\xf1\x8cuh\x8b\xc8\x12\x16D\
-C\xfc\x05n\xcb\x0dj\x8a\xbaOR8\xc8)h\xb4\
-\xfb\x86\xa3obMy\xc1\xb96&\xe0\x80I\x82\xb5\
-\xaf\x03\x22y\x8d\x98In!\xcb\xd1\x22\x9a\xa3.a\
-\x22\x11M\x03IBs\xf4\x1e\x92\x87\xd3-\xcc\xbf~\
-\x22\xeceZ\xe2\x0b\xe2\xd3\xf8\x13\x9f,\xef\x18\x17z\
-\x11\xed\xe5\x02\xe7\xda\xbf\x098\x03\x92Zu\xb5+\xa4\
-lg\xb5\x22\x1f/=\xb7\x02?(\xc9\x8d!:\xa7\
-N\xe6\x00\x00\x00\x00IEND\xaeB`\x82\
-\x00\x00\x02J\
-\x89\
-PNG\x0d\x0a\x1a\x0a\x00\x00\x00\x0dIHDR\x00\
-\x00\x00\x18\x00\x00\x00\x18\x08\x06\x00\x00\x00\xe0w=\xf8\
-\x00\x00\x00\x06bKGD\x00\xff\x00\xff\x00\xff\xa0\xbd\
-\xa7\x93\x00\x00\x01\xffIDATH\x0d\xb5UMk\
-\x14A\x10}\xd5.1kf\xf5 \x08\x89b\xb2z\
-\x88H\xc0\x5c=\x8bx\x14\x0f~\x1c\xd5\x8bl\x0c\x22\
-\xfe\x0aOB\xc0h.\xe6\xea?PAA\xbc\x8az\
-\x88BD\x89\xbb\x91\xe0\xc1\xa3\xb3\xae\xf1k\xcaW\xb3\
-Ng]z\xb2\xc9\xba\xb3\xd4\x9b\xae\xae\x8fW=]\
-;\xdd@\xc1?\xd9\x0a\xff\xc4|sZ\x04S\x0c\xde\
-g\xf1\x0a|\xe6\xb8T\x9f\x89\x968n*\xcc\x09\xfb\
-\x0f\xdc\xd2\xf2\xd0p|\x9ddW\x00\x19\x0fGIC\
-\x91,\xa0\x5c\x99k\x5c\x92\xf5PL\xb0\xc0\xf8\xc2\x97\
-\xe3.\xc1\xfd|\xe2n*\xa9C~_\xa8\xd7\xf6<\
-\xef\xf6\xb8n\xc3\xc4||\xde%\xf2t\xeb\xe4\xc6\xa0\
-U\xa8{V\xbd\x13\x9f\xb5Y'\xfey\x83C\xb7\x9b\
-'\xd4\xe9#\x06\x94\x88~\xe4g\xa28\xb5z\xb5\xc2\
-\x05\xb6\xd3}\x81\xf6\x9e7\xdf+\xb0\xbf\xed\xea\xfb\xf9\
-Q\xcb\xd1d\xd6\x13\xbfE\xa5\xe1\xf8\xdaf\xe4\xbbw\
-\x0a\x1e\x9e\xdb\x85\x07D4\xe4\xd7\x15Z\xc5Ai}\
-\x9d\xcd\x1c\xbe\x00Sj\x9914\x8eF\x82\xc9\xbd\x0e\
-G\x881\xea\xa1\x18o\x13\xf5\x5c\xe4\x05\x0e\xdf\x8d\xa7\
-\xb8w\xaf}@\x8er\xb2Z\x82\xf25\x9f4~\xe5\
-Dl\x98\xc9w\x94\xbdXN\x9b\xa9\x90c\x0037\
-\xfcA\xedq\xbd7q\x96\xb8\x032M}9\xdd\x22\
-M0\xcaIO\xf9P\x8b`\xe8\x19\xc8\x00u\x18\xe3\
-\x80\xb4\x80)E!-\xc0s\xe6\xd3\xa0\x0bh\xa2k\
-\xc6\xf9\xb7\x80\xf6<\xb4,x;`GS\xce\xb4\xc0\
-J\xad\xf2\x86\xc9\xef\x88\xc1\x88\xe2\xad\xfd\x83\x8c\xacd\
-\x0f\x83B\x17\x05r\xd3\xf4<\xcc\xbd\xf8\x91\xe7\xea\xb2\
-\xcb\xbd\xcc\x90~\x076)\xfc\xa8X\xbb!\xdf\x04\xee\
-4\x8b\xb5\x88~\xa5\x95$\xeeLv\x0e\x19I\xda\x03\
-S\x0c+3#/\xf9\xa5^\xa6\xfe\x9d\xd8\xae\xac3\
-\xe1\xe2\xea\xec\xc8+\x8e^\xfc\x16y\x0b\x95A^8\
-\xc1\x02\xac\x81vO\x0a\xba2\xad@'\xfe\xe7\xd2\xef\
-\xe4)D\xff\x032\x9f\xa4\x13\x8c\xc7$]\x00\x00\x00\
-\x00IEND\xaeB`\x82\
-\x00\x00\x035\
-\x89\
-PNG\x0d\x0a\x1a\x0a\x00\x00\x00\x0dIHDR\x00\
-\x00\x00\x18\x00\x00\x00\x18\x08\x06\x00\x00\x00\xe0w=\xf8\
-\x00\x00\x00\x06bKGD\x00\xff\x00\xff\x00\xff\xa0\xbd\
-\xa7\x93\x00\x00\x02\xeaIDATH\x0d\xedTYH\
-\xd4A\x18\xff\xcd\xec\x99{\x88\xae\x17\xe4}\x87m\xb2\
-m\x9a\xabvl\x81\x10e\x19!\xd8\x83A\x19\xd9K\
-\xbd\xa5\x11\xf5P\x0f=D\x0f]\x84e\xd0\x83D\x10\
-X\x0f\x11%\x15\x1eDJ\x86\x0f\x09)VD\x09V\
-\x1e\xc8Z\xbb\xee\x7f\xfd\xef\x7f\x9a\xddUwW\xf7\xf2\
-5\x1a\xbe\x99\xf9}\xf7\xcc7\x1f\x03\xfc\x1fQ*@\
-\xa2\xe8\x97\xd5\x05\xa6\xad\x87\x08\xa1W\x00\x96\xc9\x85=\
-\x0c8\xfdih`\x84\xe3\x88\x14S\x02\xa3\xb1:A\
-P\x88\x93<\x92\x9c\xcf%\x1a\x1e\x1b\x1a\xd8\xb4\xc4\x84\
-\xdbi8E\xa0\x5cP.\x94df\xa4\xcb\x95\x0a%\
-J\x8dFX\xca\xcb<jc\xa1\xd9R\xec\x01\x91f\
-\xe0\x89\xc2\xda1IFwZ\xca019\x83\xf4\xb4\
-\x14\xe8uz\xf4\xbf\x1b\x04u#1\xac\xd3\xa2\x22\xa6\
-\x04\x04\xa2-?\xae\x0bM;\xde\xc3!\xea1\xf8\xa3\
-\xd4\xeb\xce(K\xf7\x82\x08KL%\x82\x9c\xfd.N\
-\x18u\xbb\x04\x01pM\xa2\xbaX\x80LFE\x06\xb2\
-/Bl\xaf*\xa6\x04\x89\xf1\x86#\xe3\x09\xb7\xdd\x06\
-\xd3%$U=\x82\xda\xdc\xc9\xdf\xa1\xdc\xce;\xaa\xa1\
-`s\xc5\x06o\xa40K\xd4\x04\x9e\x00\x0e\x87\xb3\xd5\
-\xb4\xa5R\xe9L:\x89\x05\x9d\xd5\x1b\xaa\xfe`]<\
-\x07\x0a\x02t\x98\xcdf\x05\xc7!)j\x82\xb8\xb8u\
-\xed\x8d\x0d\xf5\x0a\xb5J\x15\x14\xc0l*ENv\x16\
-d\x94\x1a\xe7\x98\xa2%H\x19\xc0\xc8\x02\xf0*Xh\
-\xb2\xec\xce\xca\xc8h\xba\xd0zF/\x93\x05\x9b\x12B\
-\xe0v\x8bp\x0a.LMMW\x18r2o\xcd\x8c\
-\x8f\xbbV\x06\x89x\x03B\xd1|\xe2hc\xb2B\x19\
-\xba\x02\x05yy\xd0i52\xc6$-q\x92\xda\x95\
-\xc1=|\xd8\x04\xf9\xf9{T\x84\x92J\xe3\xc6\x92\xb0\
-\xad\x9c\x92\x9c\x8c\x5c^&\x891HL\xccF\x88\x11\
-6\xc1\xc7\xf6\xbe\x86g-#\xf1\xdd/;C\xb8\x01\
-D\x12\x90\xc2\x9ec\x81\x97j}\x9an\xd6Zl\xfb\
-\x15\xcapU\x02\xd6\xab\xcea=\xaa\x1b\x0a*\xde\xc9\
-Mqh\x8b\xd8U\xe9\xca\xb5\xeb\x10E1\xc8\x9f\xba\
-\xbe u\xfa,\xdc3/p\xef\xf8\xb0\xbe\xad\xf9\xeb\
-\xae \x83E\x86.\xee\x01\x9bT\x09\x82S\x5c\xe0m\
-\x9bmE\xd3\xd4\xfe\xed!\xeew<\xe0\x22?\x11q\
-\x0e\xfc\xf0\xb8X\xf3\x1a\xb9\x86Y\xde\x01\xec\x00\xebS\
-\xed\xf5[\xf8\xd0\xea\x04\x94\xd8|*\xffz\xf9\xf0\x84\
-\xa8U\x0b\xd2\x1f\xbb\xdd{\x937o\xfb\xf1\xf4I\xdb\
-J;\x0d\x18Z\xfd^>\xb4\xfa\x01%d\xf9T\xfe\
-U\xafv\xcamcw\xed5\xfb;5\xbc]\x1d\xfc\
-\x86\xee\xf3u\xdf?s\x0b3\x9f\x1e\x9a\xe7\xb2s\xf8\
-)\xdc\xf40\x81\x93\x042K\x98\xbd\xd2\xa4B\xbe\xb0\
-\x1d\x14\xb5`\x94\xff7,\x1e\x12\xad\x22\xd6\xf9\x81e\
-\x9b^U\x0d\xc7\x8f\xf9w\xf1\x01\x12\x8e\x11\xabk\x94\
-\xf3k'\xd6\xcd\xbf\xba.h\xd6\xee\xf9\xafx\xfc\x05\
-\xe35\xd8\x9a\xca\xb3`0\x00\x00\x00\x00IEND\
-\xaeB`\x82\
-\x00\x00\x02x\
-\x89\
-PNG\x0d\x0a\x1a\x0a\x00\x00\x00\x0dIHDR\x00\
-\x00\x00\x18\x00\x00\x00\x18\x08\x06\x00\x00\x00\xe0w=\xf8\
-\x00\x00\x00\x06bKGD\x00\xff\x00\xff\x00\xff\xa0\xbd\
-\xa7\x93\x00\x00\x02-IDATH\x0d\xe5T\xcfk\
-\x13A\x14\xfe\xded7\xda\xa44\xa9\xa6\xe9EPH\
-ZP!\x86\x12PP\xbc\xa8\xd4\x82\x08\x1eBA\xc5\
-\x8b\xe8\xcd?\xc0\x83\xd0\x93\xb7B\xaf\xfe@\x10\xbcx\
-UA<x\xf4P\xf0P\x0b^\x8a\x1e\x84\x84\x9a6\
-(\x06\xbbh\xcc\xce8\xb35\xeb\xbc\xdd(I\xbc\x08\
-]\xe6\xcd\xbc\xef\xcd\xf7\xbd/;\xbbY`\xe7\x5cu\
-\xb5\x80\xbaR\xbfb\x01}^N/\xde\xec\xe5\xeb3\
-\xd2\xf7\xcf\x81\x90\xea\xee\xaf\xae,\x9fh\x94\x8f\x06p\
-re\xf9t\xe9\xe2\xd5\xdd\x01\x08&\xda\x12B>y\
-\xf1\xe8\xc1\x9b\x00ZS\xcc\xe0\xd4\xfc\xb5i)\xe5+\
-\x10Y\x0d\x80\xf4\xe6F(\xd3\xf9q\x80t\x84%H\
-)njm\xf9\xe5\xe3{k\xbf\xab\x80\xb0\x81\xc9E\
-B\xcd\xeb\x955\xd7\xb8\x9f1BBU\xa3\xc4\x98\x01\
-A\x1d\x89\x92\xfa\xc5\x04\x94\xa3\xdc\x98\x81\x02\x1d\x8e\x92\
-\xfa\xc6\x021-3\x98\x9b\xbb\xb1K7+\xea\x18n\
-(\x14\xab\xd5j\xd2\x16;6\xf0s\xde\x14|b\xb5\
-F\xa9\x82\x1f\xa9\x14Z\xfb\xf6\x87T\x93\xd7\x8e\x9d\x84\
-\xeby\x98\x5c}\x1d\xd6u\xe2\xb6\x9c\xec\x94^\xdf\xea\
-\x08\x06\xbb\x03\xc8\xf8\xf1\xa47?\xe2\xdd\xd9\x0bh\x1e\
-,\x05\x023\x99\xfc\xfd\x99\xf3\x18m\xd4\x0dd\xe1\x83\
-\x1f\x133\xd0\xe7\x7f\x88\xb15\x18]\xaf\xa1rg\x11\
-\xee\xd6W\x8d\xb6G\xb2\xf5\x05\x95\xbb\x8bH7\xd6\xb7\
-\x0b\xd6,H\xb1\x1e\xcc\x80\x94\x8c=$\xa3\xb5M\xfe\
-\xd6\xdcp\xf5\x7f\x9d\xf5`\xe7\xad\xef\x80m\x1aA7\
-\x8c\xc9\xcc\xfd\xa5\x00\xf6\xfa\xe5\xc1\x86\x99\x22o\x123\
- \x12\x05\xa5\xa4\xa1\xf5\x8c\xb1\xda\x87\x9eu\xbb(\x88\
-\x0a\x0c\xdb \x9b\xcd\xba6\x1e&\xcfd\xc6\xff\xfc\x9a\
-\x1e(\x141\xd6l\xa2\xe3w\x86\xe9\x0d'\xe1`o\
-n\x82i\xd9\x11\x09!\x90\xcb\xe7\x19\xe1_\x01{\x8b\
-\x86i\xd6\xce\xaf\xe1\xd3\xecm\xb4'\xd8G4l\x15\
-5h\x87;\x83$\xc2\xd7_\xf7P\xf0=\xcct\xc2\
-\x0c\x14\xf0L\xd7\x06\x1a\xc9\x8di\xecy~\x0b\xae^\
-\x8dP\x11=5k7\xd83\x18\xc9$.}ku\
-\xae@\xd1x\x970\xd0J\xea\xb3G\xde\xc3\x814\xff\
-=\xf9'\xb1K\x93\xf6p\x0c1\x88\x00\x00\x00\x00I\
-END\xaeB`\x82\
-\x00\x00\x01_\
-\x89\
-PNG\x0d\x0a\x1a\x0a\x00\x00\x00\x0dIHDR\x00\
-\x00\x00\x18\x00\x00\x00\x18\x08\x06\x00\x00\x00\xe0w=\xf8\
-\x00\x00\x00\x06bKGD\x00\xff\x00\xff\x00\xff\xa0\xbd\
-\xa7\x93\x00\x00\x01\x14IDATH\x0dc`\x18\x05\
-\xa3!\x80+\x04\xec\x02\xb7\xb630\xfcg\xc4%\x0f\
-\x13'\xa8\x00\xa6\x10\x9d\xb6\x0f\xdc\xfa\x9f\x81\x91a\xc3\
-\x97\xdf\xff\xa2\xcfn\xf6\xfd\x86.\x0f\xe33\xc1\x18d\
-\xd1\xff\x19\x02\xb8Y\x99\xf6Y\x05\xee\x14\xc3\xa5\x9f2\
-\x0b\x80\xa62\xfeg0ge\xf8s\xdc\xd1o\xbb:\
-\x90\x8b\x81\xe0A\xe4\x10\xb4\xb5\x81\x81\x04\xf0\xff?C\
-=\x9a\xf2w\x8c\x0cL\xfe\x07\xd6{\x1eA\x16\x87[\
-\x00\x0eSd\x19\xf2\xd8?\xff32\xc6\x1fZ\xe7\xb5\
-\x12\xa6\x9d\xe2 \x82\x19\x04\xa5\xd9\x19\xff\xff_n\x17\
-\xb8\xa5\x1c\xcag\xa0\xb6\x05`s\x99\x18\x18\xe1!\xc3\
-\x02\x16\xa1\x1e\xf1\x8d\xf1?c\xf4\x81\x0d^\x1b`F\
-\xc2-\x00\xda\xd9\x08\x13$\x86\xc6\x12\xc9\xaf\xfe\xfd\xff\
-\xe7{x\x83\xef)d\xfd\x8c\xc8\x1cR\xd8h\x89\xe2\
-\xe6_\xa6\xff^G\xd6\xfa\xdcC7\x83\x1aqp\xf8\
-\x17\x0b\xb3\x156\xc3A\x96Qh\x01\xe3\x0a\xae\x1f\x8c\
-\xae\xc7W{\xbc\x03\x19FU\xec\x10\xb8\xad\x83\x98\xc2\
-\x8e\xaa\x96\x8e\x1a68C\x00\x00Q\xa6I\xadY\xe7\
-\x9dl\x00\x00\x00\x00IEND\xaeB`\x82\
-\x00\x00\x0f\xa1\
-\x89\
-PNG\x0d\x0a\x1a\x0a\x00\x00\x00\x0dIHDR\x00\
-\x00\x00\x18\x00\x00\x00\x18\x08\x06\x00\x00\x00\xe0w=\xf8\
-\x00\x00\x0a'iCCPicc\x00\x00H\xc7\x9d\
-\x96wTT\xd7\x16\x87\xcf\xbdwz\xa1\xcd0\x02R\
-\x86\xde\xbb\xc0\x00\xd2{\x93^Ea\x98\x19`(\x03\
-\x0e34\xb1!\xa2\x02\x11ED\x9a\x22HP\xc4\x80\
-\xd1P$VD\xb1\x10\x14T\xb0\x07$\x08(1\x18\
-ET,oF\xd6\x8b\xae\xac\xbc\xf7\xf2\xf2\xfb\xe3\xac\
-o\xed\xb3\xf7\xb9\xfb\xec\xbd\xcfZ\x17\x00\x92\xa7/\x97\
-\x97\x06K\x01\x90\xca\x13\xf0\x83<\x9c\xe9\x11\x91Qt\
-\xec\x00\x80\x01\x1e`\x80)\x00LVF\xba_\xb0{\
-\x08\x10\xc9\xcb\xcd\x85\x9e!r\x02_\x04\x01\xf0zX\
-\xbc\x02p\xd3\xd03\x80N\x07\xff\x9f\xa4Y\xe9|\x81\
-\xe8\x98\x00\x11\x9b\xb39\x19,\x11\x17\x888%K\x90\
-.\xb6\xcf\x8a\x98\x1a\x97,f\x18%f\xbe(A\x11\
-\xcb\x899a\x91\x0d>\xfb,\xb2\xa3\x98\xd9\xa9<\xb6\
-\x88\xc59\xa7\xb3S\xd9b\xee\x15\xf1\xb6L!G\xc4\
-\x88\xaf\x88\x0b3\xb9\x9c,\x11\xdf\x12\xb1F\x8a0\x95\
-+\xe27\xe2\xd8T\x0e3\x03\x00\x14Il\x17pX\
-\x89\x226\x111\x89\x1f\x12\xe4\x22\xe2\xe5\x00\xe0H\x09\
-_q\xdcW,\xe0d\x0b\xc4\x97rIK\xcf\xe1s\
-\x13\x12\x05t\x1d\x96.\xdd\xd4\xda\x9aA\xf7\xe4d\xa5\
-p\x04\x02\xc3\x00&+\x99\xc9g\xd3]\xd2R\xd3\x99\
-\xbc\x1c\x00\x16\xef\xfcY2\xe2\xda\xd2EE\xb64\xb5\
-\xb6\xb44432\xfd\xaaP\xffu\xf3oJ\xdc\xdb\
-Ez\x19\xf8\xb9g\x10\xad\xff\x8b\xed\xaf\xfc\xd2\x1a\x00\
-`\xcc\x89j\xb3\xf3\x8b-\xae\x0a\x80\xce-\x00\xc8\xdd\
-\xfbb\xd38\x00\x80\xa4\xa8o\x1d\xd7\xbf\xba\x0fM<\
-/\x89\x02A\xba\x8d\xb1qVV\x96\x11\x97\xc32\x12\
-\x17\xf4\x0f\xfdO\x87\xbf\xa1\xaf\xbeg$>\xee\x8f\xf2\
-\xd0]9\xf1La\x8a\x80.\xae\x1b+-%M\xc8\
-\xa7g\xa43Y\x1c\xba\xe1\x9f\x87\xf8\x1f\x07\xfeu\x1e\
-\x06A\x9cx\x0e\x9f\xc3\x13E\x84\x89\xa6\x8c\xcbK\x10\
-\xb5\x9b\xc7\xe6\x0a\xb8i<:\x97\xf7\x9f\x9a\xf8\x0f\xc3\
-\xfe\xa4\xc5\xb9\x16\x89\xd2\xf8\x11Pc\x8c\x80\xd4u*\
-@~\xed\x07(\x0a\x11 \xd1\xfb\xc5]\xff\xa3o\xbe\
-\xf80 ~y\xe1*\x93\x8bs\xff\xef7\xfdg\xc1\
-\xa5\xe2%\x83\x9b\xf09\xce%(\x84\xce\x12\xf23\x17\
-\xf7\xc4\xcf\x12\xa0\x01\x01H\x02*\x90\x07\xca@\x1d\xe8\
-\x00C`\x06\xac\x80-p\x04n\xc0\x1b\xf8\x83\x10\x10\
-\x09V\x03\x16H\x04\xa9\x80\x0f\xb2@\x1e\xd8\x04\x0aA\
-1\xd8\x09\xf6\x80jP\x07\x1aA3h\x05\xc7A'\
-8\x05\xce\x83K\xe0\x1a\xb8\x01n\x83\xfb`\x14L\x80\
-g`\x16\xbc\x06\x0b\x10\x04a!2D\x81\xe4!\x15\
-H\x13\xd2\x87\xcc \x06d\x0f\xb9A\xbeP\x10\x14\x09\
-\xc5B\x09\x10\x0f\x12By\xd0f\xa8\x18*\x83\xaa\xa1\
-z\xa8\x19\xfa\x1e:\x09\x9d\x87\xae@\x83\xd0]h\x0c\
-\x9a\x86~\x87\xde\xc1\x08L\x82\xa9\xb0\x12\xac\x05\x1b\xc3\
-\x0c\xd8\x09\xf6\x81C\xe0Up\x02\xbc\x06\xce\x85\x0b\xe0\
-\x1dp%\xdc\x00\x1f\x85;\xe0\xf3\xf05\xf86<\x0a\
-?\x83\xe7\x10\x80\x10\x11\x1a\xa2\x8a\x18\x22\x0c\xc4\x05\xf1\
-G\xa2\x90x\x84\x8f\xacG\x8a\x90\x0a\xa4\x01iE\xba\
-\x91>\xe4&2\x8a\xcc oQ\x18\x14\x05EG\x19\
-\xa2lQ\x9e\xa8P\x14\x0b\xb5\x06\xb5\x1eU\x82\xaaF\
-\x1dFu\xa0zQ7Qc\xa8Y\xd4G4\x19\xad\
-\x88\xd6G\xdb\xa0\xbd\xd0\x11\xe8\x04t\x16\xba\x10]\x81\
-nB\xb7\xa3/\xa2o\xa3'\xd0\xaf1\x18\x0c\x0d\xa3\
-\x8d\xb1\xc2xb\x221I\x98\xb5\x98\x12\xcc>L\x1b\
-\xe6\x1cf\x103\x8e\x99\xc3b\xb1\xf2X}\xac\x1d\xd6\
-\x1f\xcb\xc4\x0a\xb0\x85\xd8*\xecQ\xecY\xec\x10v\x02\
-\xfb\x06G\xc4\xa9\xe0\xccp\xee\xb8(\x1c\x0f\x97\x8f\xab\
-\xc0\x1d\xc1\x9d\xc1\x0d\xe1&q\x0bx)\xbc&\xde\x06\
-\xef\x8fg\xe3s\xf0\xa5\xf8F|7\xfe:~\x02\xbf\
-@\x90&h\x13\xec\x08!\x84$\xc2&B%\xa1\x95\
-p\x91\xf0\x80\xf0\x92H$\xaa\x11\xad\x89\x81D.q\
-#\xb1\x92x\x8cx\x998F|K\x92!\xe9\x91\x5c\
-H\xd1$!i\x07\xe9\x10\xe9\x1c\xe9.\xe9%\x99L\
-\xd6\x22;\x92\xa3\xc8\x02\xf2\x0er3\xf9\x02\xf9\x11\xf9\
-\x8d\x04E\xc2H\xc2K\x82-\xb1A\xa2F\xa2Cb\
-H\xe2\xb9$^RS\xd2Ir\xb5d\xaed\x85\xe4\
-\x09\xc9\xeb\x923Rx)-)\x17)\xa6\xd4z\xa9\
-\x1a\xa9\x93R#Rs\xd2\x14iSi\x7f\xe9T\xe9\
-\x12\xe9#\xd2W\xa4\xa7d\xb02Z2n2l\x99\
-\x02\x99\x832\x17d\xc6)\x08E\x9d\xe2BaQ6\
-S\x1a)\x17)\x13T\x0cU\x9b\xeaEM\xa2\x16S\
-\xbf\xa3\x0ePgeed\x97\xc9\x86\xc9f\xcb\xd6\xc8\
-\x9e\x96\x1d\xa5!4-\x9a\x17-\x85VJ;N\x1b\
-\xa6\xbd[\xa2\xb4\xc4i\x09g\xc9\xf6%\xadK\x86\x96\
-\xcc\xcb-\x95s\x94\xe3\xc8\x15\xc9\xb5\xc9\xdd\x96{'\
-O\x97w\x93O\x96\xdf%\xdf)\xffP\x01\xa5\xa0\xa7\
-\x10\xa8\x90\xa5\xb0_\xe1\xa2\xc2\xccR\xeaR\xdb\xa5\xac\
-\xa5EK\x8f/\xbd\xa7\x08+\xea)\x06)\xaeU<\
-\xa8\xd8\xaf8\xa7\xa4\xac\xe4\xa1\x94\xaeT\xa5tAi\
-F\x99\xa6\xec\xa8\x9c\xa4\x5c\xae|FyZ\x85\xa2b\
-\xaf\xc2U)W9\xab\xf2\x94.Kw\xa2\xa7\xd0+\
-\xe9\xbd\xf4YUEUOU\xa1j\xbd\xea\x80\xea\x82\
-\x9a\xb6Z\xa8Z\xbeZ\x9b\xdaCu\x82:C=^\
-\xbd\x5c\xbdG}VCE\xc3O#O\xa3E\xe3\x9e\
-&^\x93\xa1\x99\xa8\xb9W\xb3Os^K[+\x5c\
-k\xabV\xa7\xd6\x94\xb6\x9c\xb6\x97v\xaev\x8b\xf6\x03\
-\x1d\xb2\x8e\x83\xce\x1a\x9d\x06\x9d[\xba\x18]\x86n\xb2\
-\xee>\xdd\x1bz\xb0\x9e\x85^\xa2^\x8d\xdeu}X\
-\xdfR\x9f\xab\xbfO\x7f\xd0\x00m`m\xc03h0\
-\x181$\x19:\x19f\x1a\xb6\x18\x8e\x19\xd1\x8c|\x8d\
-\xf2\x8d:\x8d\x9e\x1bk\x18G\x19\xef2\xee3\xfeh\
-ba\x92b\xd2hr\xdfT\xc6\xd4\xdb4\xdf\xb4\xdb\
-\xf4w3=3\x96Y\x8d\xd9-s\xb2\xb9\xbb\xf9\x06\
-\xf3.\xf3\x17\xcb\xf4\x97q\x96\xed_v\xc7\x82b\xe1\
-g\xb1\xd5\xa2\xc7\xe2\x83\xa5\x95%\xdf\xb2\xd5r\xdaJ\
-\xc3*\xd6\xaa\xd6j\x84Ae\x040J\x18\x97\xad\xd1\
-\xd6\xce\xd6\x1b\xacOY\xbf\xb5\xb1\xb4\x11\xd8\x1c\xb7\xf9\
-\xcd\xd6\xd06\xd9\xf6\x88\xed\xd4r\xed\xe5\x9c\xe5\x8d\xcb\
-\xc7\xed\xd4\xec\x98v\xf5v\xa3\xf6t\xfbX\xfb\x03\xf6\
-\xa3\x0e\xaa\x0eL\x87\x06\x87\xc7\x8e\xea\x8el\xc7&\xc7\
-I']\xa7$\xa7\xa3N\xcf\x9dM\x9c\xf9\xce\xed\xce\
-\xf3.6.\xeb\x5c\xce\xb9\x22\xae\x1e\xaeE\xae\x03n\
-2n\xa1n\xd5n\x8f\xdc\xd5\xdc\x13\xdc[\xdcg=\
-,<\xd6z\x9c\xf3D{\xfax\xee\xf2\x1c\xf1R\xf2\
-by5{\xcdz[y\xaf\xf3\xee\xf5!\xf9\x04\xfb\
-T\xfb<\xf6\xd5\xf3\xe5\xfbv\xfb\xc1~\xde~\xbb\xfd\
-\x1e\xac\xd0\x5c\xc1[\xd1\xe9\x0f\xfc\xbd\xfcw\xfb?\x0c\
-\xd0\x0eX\x13\xf0c &0 \xb0&\xf0I\x90i\
-P^P_0%8&\xf8H\xf0\xeb\x10\xe7\x90\xd2\
-\x90\xfb\xa1:\xa1\xc2\xd0\x9e0\xc9\xb0\xe8\xb0\xe6\xb0\xf9\
-p\xd7\xf0\xb2\xf0\xd1\x08\xe3\x88u\x11\xd7\x22\x15\x22\xb9\
-\x91]Q\xd8\xa8\xb0\xa8\xa6\xa8\xb9\x95n+\xf7\xac\x9c\
-\x88\xb6\x88.\x8c\x1e^\xa5\xbd*{\xd5\x95\xd5\x0a\xab\
-SV\x9f\x8e\x91\x8ca\xc6\x9c\x88E\xc7\x86\xc7\x1e\x89\
-}\xcf\xf4g60\xe7\xe2\xbc\xe2j\xe3fY.\xac\
-\xbd\xacglGv9{\x9ac\xc7)\xe3L\xc6\xdb\
-\xc5\x97\xc5O%\xd8%\xecN\x98NtH\xacH\x9c\
-\xe1\xbap\xab\xb9/\x92<\x93\xea\x92\xe6\x93\xfd\x93\x0f\
-%\x7fJ\x09OiK\xc5\xa5\xc6\xa6\x9e\xe4\xc9\xf0\x92\
-y\xbdi\xcai\xd9i\x83\xe9\xfa\xe9\x85\xe9\xa3kl\
-\xd6\xecY3\xcb\xf7\xe17e@\x19\xab2\xba\x04T\
-\xd1\xcfT\xbfPG\xb8E8\x96i\x9fY\x93\xf9&\
-+,\xebD\xb6t6/\xbb?G/g{\xced\
-\xae{\xee\xb7kQkYk{\xf2T\xf36\xe5\x8d\
-\xadsZW\xbf\x1eZ\x1f\xb7\xbeg\x83\xfa\x86\x82\x0d\
-\x13\x1b=6\x1e\xdeD\xd8\x94\xbc\xe9\xa7|\x93\xfc\xb2\
-\xfcW\x9b\xc37w\x17(\x15l,\x18\xdf\xe2\xb1\xa5\
-\xa5P\xa2\x90_8\xb2\xd5vk\xdd6\xd46\xee\xb6\
-\x81\xed\xe6\xdb\xab\xb6\x7f,b\x17]-6)\xae(\
-~_\xc2*\xb9\xfa\x8d\xe97\x95\xdf|\xda\x11\xbfc\
-\xa0\xd4\xb2t\xffN\xccN\xde\xce\xe1]\x0e\xbb\x0e\x97\
-I\x97\xe5\x96\x8d\xef\xf6\xdb\xddQN//*\x7f\xb5\
-'f\xcf\x95\x8ae\x15u{\x09{\x85{G+}\
-+\xbb\xaa4\xaavV\xbd\xafN\xac\xbe]\xe3\x5c\xd3\
-V\xabX\xbb\xbdv~\x1f{\xdf\xd0~\xc7\xfd\xadu\
-Ju\xc5u\xef\x0ep\x0f\xdc\xa9\xf7\xa8\xefh\xd0j\
-\xa88\x889\x98y\xf0IcXc\xdf\xb7\x8co\x9b\
-\x9b\x14\x9a\x8a\x9b>\x1c\xe2\x1d\x1a=\x1ct\xb8\xb7\xd9\
-\xaa\xb9\xf9\x88\xe2\x91\xd2\x16\xb8E\xd82}4\xfa\xe8\
-\x8d\xef\x5c\xbf\xebj5l\xado\xa3\xb5\x15\x1f\x03\xc7\
-\x84\xc7\x9e~\x1f\xfb\xfd\xf0q\x9f\xe3='\x18'Z\
-\x7f\xd0\xfc\xa1\xb6\x9d\xd2^\xd4\x01u\xe4t\xccv&\
-v\x8evEv\x0d\x9e\xf4>\xd9\xd3m\xdb\xdd\xfe\xa3\
-\xd1\x8f\x87N\xa9\x9e\xaa9-{\xba\xf4\x0c\xe1L\xc1\
-\x99Ogs\xcf\xce\x9dK?7s>\xe1\xfcxO\
-L\xcf\xfd\x0b\x11\x17n\xf5\x06\xf6\x0e\x5c\xf4\xb9x\xf9\
-\x92\xfb\xa5\x0b}N}g/\xdb]>u\xc5\xe6\xca\
-\xc9\xab\x8c\xab\x9d\xd7,\xafu\xf4[\xf4\xb7\xffd\xf1\
-S\xfb\x80\xe5@\xc7u\xab\xeb]7\xacot\x0f.\
-\x1f<3\xe40t\xfe\xa6\xeb\xcdK\xb7\xbcn]\xbb\
-\xbd\xe2\xf6\xe0p\xe8\xf0\x9d\x91\xe8\x91\xd1;\xec;S\
-wS\xee\xbe\xb8\x97yo\xe1\xfe\xc6\x07\xe8\x07E\x0f\
-\xa5\x1eV<R|\xd4\xf0\xb3\xee\xcfm\xa3\x96\xa3\xa7\
-\xc7\x5c\xc7\xfa\x1f\x07?\xbe?\xce\x1a\x7f\xf6K\xc6/\
-\xef'\x0a\x9e\x90\x9fTL\xaaL6O\x99M\x9d\x9a\
-v\x9f\xbe\xf1t\xe5\xd3\x89g\xe9\xcf\x16f\x0a\x7f\x95\
-\xfe\xb5\xf6\xb9\xce\xf3\x1f~s\xfc\xad\x7f6bv\xe2\
-\x05\xff\xc5\xa7\xdfK^\xca\xbf<\xf4j\xd9\xab\x9e\xb9\
-\x80\xb9G\xafS_/\xcc\x17\xbd\x91\x7fs\xf8-\xe3\
-m\xdf\xbb\xf0w\x93\x0bY\xef\xb1\xef+?\xe8~\xe8\
-\xfe\xe8\xf3\xf1\xc1\xa7\xd4O\x9f\xfe\x05\x03\x98\xf3\xfcj\
-\xd8\x05`\x00\x00\x00\x09pHYs\x00\x00.#\x00\
-\x00.#\x01x\xa5?v\x00\x00\x00\x18zTXt\
-author\x00\x00\x08\xd7\xf3/K-\xca\xcd\
-\xccK\x01\x00\x0e\x81\x03E\xa4,\x8d\xcc\x00\x00\x04\xfc\
-IDATH\xc7\xa5UihTW\x14\xfe\xde:\
-[&\x93\xc9L&\x92\xc9j\xd2\x89i4\xb6V\x8a\
-VH0V\xa5\xd6B[\x8dE\xfaG\xa8\x96V\x0b\
-\x85\xd2\x85J\x89\xb6R\xba\x19\x95\xae\x08-\xf9Q\x9b\
-Z-\xa8\xb8\xa4n\x88\xd6J!&\x8e&\x9a\x18\x8d\
-\x1a\xc7\xcc\x92\xd9'\x93\x997o\xed\x9d@\x8b\xd8$\
-#x\xe0\xfdx\xdcs\xcew\xeew\xbes.\x85\xe9\
-\x8dnnn\xae]\xb8p\xe1|\xa7\xd3\xf9\x84\xd9l\
-.\xa7i\x9aK&\x93\xdeP(\xd4\xdf\xdb\xdb\xdb\xb5\
-w\xef\xde\xcb\xc4/=U\x02j\xaa\x83\x0d\x1b6\xbc\
-\xb0d\xc9\x92\x8d3\xab\xaa\x9eq8\x1c\xf9\xc4@\xb3\
-\xfc\xc4\x99\x22\x8b\x10\xd2i\x8c\x8e\x8eJ^\xaf\xf7J\
-wO\xcf/\xad\xad\xad?\x92\xa31<\x84\x99v\xb4\
-\xed\xf8\xee\xb2\xdb-\xc7c1-\x1e\x8fk\xb1xB\
-\x0b\x8e\xdc\xd2n\xec\xdb\xac\xf9\xae\x9c\xd1\xa2\x89q-\
-\x1c\x89h\xe1pX\x8bE\xa3\xda=\x8fG\xdb\xbf\x7f\
-\xff\xb9\xc6\xc6\xc6\xda\x07\x931\x0f\xfe\xb7\xb5\xb5}\xd3\
-\xb2z\xd5\x1b6\xbb\x9d\xd6(\x06\x0c\xc3\x80\xe58\xf0\
-z#\xd4\x98\x07\x99\xde\x83`8\x1e\x86b\x17h\x86\
-\x83$f@Q\x14\x5c.WE\x89\xd3\xb9\xf8\xc6\xcd\
-\x9b\x87|^\xef\xd8\xa4\x00\xeb\xd6\xad[\xd6\xd2\xd2\xd2\
-f\xb7;((\x22\x12gw!s\xed(\xc4{\xdd\
-\x90\x03\x03`x=h9\x05\xf8\xdc\x10#\xc3\xe0\x1c\
-.\xb0F\x0bTE\x86(\x8a\xa8\xac\xact\xb0\x0c\xa3\
-vvv\x9e\xfc\xaf\x89\xf7\x03<5o\xde\xcb\xe5e\
-\xa5\xb4\xaa\xaa\xe0H\x95\xd9\xaa\x19\x9d\x09Rp\x08\xca\
-\xed\xb3\xd0\x0b\x01\xd8\xe7\xae@\xe1\xd3kaR\xa2H\
-\x9e\xf8\x04r\xd4\x03Vg\x98\xb8\x05M\xbe\xc7\xeb\xea\
-VZ,\x16\xf3d\x00\x94\xb5\xb0\xd0\x05\x8a\x9e\xe8<\
-\xa3\xcfC\xd1\xf3\x9ba\xac\x7f\x0e:\x1d\x0f\xa3\xbd\x02\
-\xd2\xecW\xb1/0\x13\xbb\x06\xcbp\xcb\xb5\x11F9\
-\x82\xe4\x91\xf7\xa0\x92\xa6g\xe3$Y\x86\xc1h*i\
-hh\x98\xf1oR\xf6>\x00M\x92\x15QV5\xd0\
-\x9c\x9ep\x9bF\xe2\xf4\x17\x90\xdd\x1d\xd0\x9b\xf2\xa1\xab\
-~\x0d\xe7\xfc4v\x1e\xb8\x80\xcb\xc3Q\xf46\xd5c\
-\xf7\xec\xf9\xa0\x0e\x7f8A\x97j\xa9$\xf2\x92 )\
-\xb2*\xa4\x05eR\x8a\x02\x81@_F\xd1\x90\xf6\x0d\
- \xd2\xbe\x0a\x99\xbf\x7f\x00=w-\xa9\x8e\x82\xec\xeb\
-E\x01#\x80Re\x94\x98\x19,\xae\xb3\x91\xbe\x5c\x03\
-\xcb\xb2P\x08\xa5\x92\xa2B%9B\xa1\x88\xa7\xebb\
-\x97\x7f\xb2\x1b\xe0\xd2\xa5K\xc7\x164-}\xbbx\xf8\
-\x08C\x87nA\xf7\x12\x91v\xcdR\xa4F\xfba\xe8\
-nG\xcdx\x02{V\xbf\x02\x0968\x83\xed\xa0\xdc\
-?C)o\x86d,\x81\x98&\xcd\xd7T\x5c\xbf~\
-\xfd8I\x95\x9aj\xd0\xf8\xaf\xbf\xdf}x\xf9\xb3M\
-\xcb\xb2\xce\xbc\xd5\x89\xd1\x80\x1f\xbe\xbe\xf3x\xcc\xbd\x15\
-\xd5\xf0@g\xd2\x93\x061\x90\x93\xe3\xf0\xea\xab\xe1[\
-\xb4\x1d\xa6\xaa\xf9\xe0\x09\x17\xfdW\xafF\xb6\x7f\xfe\xe9\
-\xa2\xf3\xe7\xff\x1c\x98j\x0e\x14\x828TV3k\x8d\
-\xddY\xa1\x13\xc6\x93\x10\x844\xe22\x8f>\xb9\x0aw\
-\x12dTe\x0e~\xb5\x08\xfd\xf9M\xb8[\xb7\x11l\
-q-x\x86\xc2X2\x89\xce\xa3\x87\xb7\xfd\xf6k\xc7\
-\xc1\x9c\xabb\xfd\x9b\x9b^\x7fq\xf5\x9ao\xcb\xca+\
-8\x954=\xeb\x95\x16D\xc4\xc6R\x90\x84\x14\x910\
-\x07C^>\xf4\x1c\x0d\x8e$\x97e\x05':\x8f\xec\
-i\xfd\xe0\xdd\xf5$<3\xdd$OX\xcf\xc5\xaen\
-^\xa7\xf3[m\x8e&\xab\xcd\xaecy\x1d\xcc\x16\x0b\
-l\x85V\x149\x8aPh\xb3A\xcfs\x84E\x15\x91\
-H\x04\xa7\x8ew\xfe\xf4\xf1\xe6\xf7\xdf\x9al\xe91S\
--$wOwOF\xcc\xf49JJ\x97\x17:\x8a\
-\x8dD\xbc\xd0\xb2\x1cj\x1ad\x928C&7\x18\x0c\
-\xe2\xd8\xa1\x03\x9f}\xb5m\xcb;\x0fV\x9e\x13 k\
-\x83\xfd\xd7\x06\x0d\x06C\xa8zV\xfdJ\xa3\xd9L+\
-\x84.9+G\x82$J\x12\xce\x9e\xfc\xe3\xf7/\xb7\
-~\xb4)\x8b;\xe5\xbe\xcf\xb5Z;\xda\x7f\xec\x18\xba\
-y\xa3O\x22\x22\xf7\xfa\xfd\xf0\xfa\xfcH\x09\x19\x8c\x8c\
-\x8cd\xfe:sz\xe7t\xc9\xff7\x07S\x98\x90H\
-\x8c\x0d\x86#\xe1\xb9\x89H\x98h]\x83D\xaa'+\
-<vg\xb0\x7f8W0\xfd0\x0f\x84\x0cp\x92$\
-cNi\x11\x16\xd5\x96\x83\xd2\x14\xa2g\xc6\xe4(-\
-\xb7>2\x809\xcfT\xc0\xea\x8c\xb3(\x83\x19C1\
-\x01W\xfd1\xa8\x06\x0b\x198s\xde\x8c\x8a\xea\x86G\
-\x06\x98\xb3\xa0\xb1\x81\xd1\x9bj\x92i\x01i}\x01\xa2\
-l>D\x8d\x86B\xb30Y\xedO\xe6\x8ags\xd3\
-C\xeb#\xe3i\x96\x0a\x04'v\xbeBV2\xc3e\
-_2\x11I!c\xc8\x15\xcf\xe4rH\xa7R\x11\xae\
-\xc0>O\xa0\xf9\xea\x04\x99\xe6x*\x83`(\x8c\xdb\
-\x03}#\x03\x17/l\x09zn{\xa6\x8b\xa7\xf0p\
-VP\xd7\xbcr\x85\xd1j\xaf'\xb7\xe0\xa5Tr\xf8\
-\xee\x95\xaeS\xd1{w\x06r\x05\xfe\x03'j3D\
-?,\xc2(\x00\x00\x00\x00IEND\xaeB`\x82\
-\
-"
-
-qt_resource_name = b"\
-\x00\x09\
-\x0cxT\x88\
-\x00n\
-\x00e\x00w\x00P\x00r\x00e\x00f\x00i\x00x\
-\x00\x06\
-\x07\x03}\xc3\
-\x00i\
-\x00m\x00a\x00g\x00e\x00s\
-\x00\x10\
-\x03+\xbb\xa7\
-\x00B\
-\x00l\x00e\x00n\x00d\x00e\x00r\x00-\x00i\x00c\x00o\x00n\x00.\x00p\x00n\x00g\
-\x00\x10\
-\x00\xaa\x11\xa7\
-\x00W\
-\x00i\x00n\x00d\x00o\x00w\x00s\x00-\x00i\x00c\x00o\x00n\x00.\x00p\x00n\x00g\
-\x00\x10\
-\x0b\xe4\x1f\xc7\
-\x00R\
-\x00e\x00f\x00r\x00e\x00s\x00h\x00-\x00i\x00c\x00o\x00n\x00.\x00p\x00n\x00g\
-\x00\x19\
-\x02\xc9L\x07\
-\x00A\
-\x00p\x00p\x00l\x00i\x00c\x00a\x00t\x00i\x00o\x00n\x00-\x00e\x00x\x00i\x00t\x00-\
-\x00i\x00c\x00o\x00n\x00.\x00p\x00n\x00g\
-\x00\x0e\
-\x08\xc4B\xa7\
-\x00A\
-\x00p\x00p\x00l\x00e\x00-\x00i\x00c\x00o\x00n\x00.\x00p\x00n\x00g\
-\x00\x0e\
-\x013\xfcg\
-\x00o\
-\x00r\x00a\x00n\x00g\x00e\x00_\x00i\x00m\x00g\x00.\x00p\x00n\x00g\
-\x00\x1a\
-\x05]\xe7\xa7\
-\x00A\
-\x00c\x00t\x00i\x00o\x00n\x00s\x00-\x00q\x00u\x00i\x00c\x00k\x00o\x00p\x00e\x00n\
-\x00-\x00i\x00c\x00o\x00n\x00.\x00p\x00n\x00g\
-\x00\x14\
-\x08=.\x07\
-\x00O\
-\x00p\x00e\x00n\x00-\x00f\x00o\x00l\x00d\x00e\x00r\x00-\x00i\x00c\x00o\x00n\x00.\
-\x00p\x00n\x00g\
-\x00\x0f\
-\x03\x97\x96\xa7\
-\x00C\
-\x00a\x00n\x00c\x00e\x00l\x00-\x00i\x00c\x00o\x00n\x00.\x00p\x00n\x00g\
-\x00\x0e\
-\x07R\x82\xc7\
-\x00C\
-\x00h\x00e\x00c\x00k\x00-\x00i\x00c\x00o\x00n\x00.\x00p\x00n\x00g\
-\x00\x14\
-\x00\xb7\x15G\
-\x00I\
-\x00n\x00f\x00o\x00r\x00m\x00a\x00t\x00i\x00o\x00n\x00-\x00i\x00c\x00o\x00n\x00.\
-\x00p\x00n\x00g\
-\x00\x0e\
-\x0b\x18$g\
-\x00L\
-\x00i\x00n\x00u\x00x\x00-\x00i\x00c\x00o\x00n\x00.\x00p\x00n\x00g\
-\x00\x18\
-\x04\x8a?\xa7\
-\x00s\
-\x00o\x00f\x00t\x00w\x00a\x00r\x00e\x00-\x00u\x00p\x00d\x00a\x00t\x00e\x00-\x00i\
-\x00c\x00o\x00n\x00.\x00p\x00n\x00g\
-\x00\x1c\
-\x04\xea\x95\xc7\
-\x00A\
-\x00c\x00t\x00i\x00o\x00n\x00s\x00-\x00a\x00r\x00r\x00o\x00w\x00-\x00r\x00i\x00g\
-\x00h\x00t\x00-\x00i\x00c\x00o\x00n\x00.\x00p\x00n\x00g\
-\x00\x0b\
-\x0a\xb1\xba\xa7\
-\x00a\
-\x00p\x00p\x00i\x00c\x00o\x00n\x00.\x00p\x00n\x00g\
-"
-
-qt_resource_struct = b"\
-\x00\x00\x00\x00\x00\x02\x00\x00\x00\x01\x00\x00\x00\x01\
-\x00\x00\x00\x00\x00\x02\x00\x00\x00\x01\x00\x00\x00\x02\
-\x00\x00\x00\x18\x00\x02\x00\x00\x00\x0f\x00\x00\x00\x03\
-\x00\x00\x00P\x00\x00\x00\x00\x00\x01\x00\x00\x02\x9e\
-\x00\x00\x01\xc6\x00\x00\x00\x00\x00\x01\x00\x00%\xfb\
-\x00\x00\x00\xf6\x00\x00\x00\x00\x00\x01\x00\x00\x0b\xef\
-\x00\x00\x00\x9c\x00\x00\x00\x00\x00\x01\x00\x00\x07\x06\
-\x00\x00\x00*\x00\x00\x00\x00\x00\x01\x00\x00\x00\x00\
-\x00\x00\x01\x80\x00\x00\x00\x00\x00\x01\x00\x00!#\
-\x00\x00\x02\x16\x00\x00\x00\x00\x00\x01\x00\x00+\x82\
-\x00\x00\x02L\x00\x00\x00\x00\x00\x01\x00\x00-\xfe\
-\x00\x00\x01\x18\x00\x00\x00\x00\x00\x01\x00\x00\x1d\xda\
-\x00\x00\x01\xa4\x00\x00\x00\x00\x00\x01\x00\x00$8\
-\x00\x00\x01R\x00\x00\x00\x00\x00\x01\x00\x00\x1f\xb1\
-\x00\x00\x00\xd4\x00\x00\x00\x00\x00\x01\x00\x00\x09Z\
-\x00\x00\x02\x8a\x00\x00\x00\x00\x00\x01\x00\x00/a\
-\x00\x00\x01\xf4\x00\x00\x00\x00\x00\x01\x00\x00(I\
-\x00\x00\x00v\x00\x00\x00\x00\x00\x01\x00\x00\x04\x1f\
-"
-
-def qInitResources():
-    QtCore.qRegisterResourceData(0x01, qt_resource_struct, qt_resource_name, qt_resource_data)
-
-def qCleanupResources():
-    QtCore.qUnregisterResourceData(0x01, qt_resource_struct, qt_resource_name, qt_resource_data)
-
-qInitResources()
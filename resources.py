@@ -0,0 +1,67 @@
+"""
+    Copyright 2016-2019 Tobias Kummer/Overmind Studios.
+
+    This program is free software: you can redistribute it and/or modify
+    it under the terms of the GNU General Public License as published by
+    the Free Software Foundation, either version 3 of the License, or
+    (at your option) any later version.
+
+    This program is distributed in the hope that it will be useful,
+    but WITHOUT ANY WARRANTY; without even the implied warranty of
+    MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+    GNU General Public License for more details.
+
+    You should have received a copy of the GNU General Public License
+    along with this program.  If not, see <https://www.gnu.org/licenses/>.
+"""
+
+import logging
+import os
+import sys
+
+from PySide2 import QtCore, QtGui
+
+logger = logging.getLogger(__name__)
+
+RCC_FILE = "res.rcc"
+PREFIX = ":/newPrefix/images/"
+
+_registered = False
+_pixmaps = {}
+_icons = {}
+
+
+def rcc_path():
+    """Location of res.rcc, also inside a frozen (pyinstaller) build."""
+    base = getattr(sys, "_MEIPASS", os.path.dirname(os.path.abspath(__file__)))
+    return os.path.join(base, RCC_FILE)
+
+
+def register():
+    """Register the binary resource file with Qt, once.
+
+    Qt maps the file instead of copying it, so only images that are
+    actually displayed get read and decoded.
+    """
+    global _registered
+    if not _registered:
+        path = rcc_path()
+        if not QtCore.QResource.registerResource(path):
+            logger.error(f"Unable to register resources from {path}")
+        _registered = True
+
+
+def pixmap(name):
+    """Return the cached QPixmap for an image in the resource file."""
+    if name not in _pixmaps:
+        register()
+        _pixmaps[name] = QtGui.QPixmap(PREFIX + name)
+    return _pixmaps[name]
+
+
+def icon(name):
+    """Return the cached QIcon for an image in the resource file."""
+    if name not in _icons:
+        register()
+        _icons[name] = QtGui.QIcon(PREFIX + name)
+    return _icons[name]
@@ -0,0 +1,159 @@
+"""
+    Copyright 2016-2019 Tobias Kummer/Overmind Studios.
+
+    This program is free software: you can redistribute it and/or modify
+    it under the terms of the GNU General Public License as published by
+    the Free Software Foundation, either version 3 of the License, or
+    (at your option) any later version.
+
+    This program is distributed in the hope that it will be useful,
+    but WITHOUT ANY WARRANTY; without even the implied warranty of
+    MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+    GNU General Public License for more details.
+
+    You should have received a copy of the GNU General Public License
+    along with this program.  If not, see <https://www.gnu.org/licenses/>.
+"""
+
+import glob
+import logging
+import os
+import random
+import threading
+
+import engine
+import reaper
+
+logger = logging.getLogger(__name__)
+
+RETRY_DELAY = 30
+# Fields kept per build between polls, the rest of the catalog is dropped
+COMPACT_FIELDS = (
+    "hash",
+    "version",
+    "filename",
+    "url",
+    "arch",
+    "os",
+    "channel",
+    "build_date",
+    "size",
+)
+
+
+def compact(entry):
+    return {key: entry[key] for key in COMPACT_FIELDS}
+
+
+def backoff_delay(failures, interval, retry=RETRY_DELAY):
+    """Seconds to wait after the given number of consecutive failures.
+
+    Doubles from retry up to interval, with 10% jitter so many machines
+    don't hit the server in lockstep.
+    """
+    if failures <= 0:
+        delay = interval
+    else:
+        delay = min(interval, retry * 2 ** (failures - 1))
+    return delay * random.uniform(0.9, 1.1)
+
+
+class Poller:
+    """Polls the catalog on an interval and stages new builds in the background.
+
+    Between polls only one compact record per subscribed channel is kept.
+    The catalog request is conditional, so an unchanged builder page costs
+    a 304. New builds are downloaded and extracted next to the install
+    directory, so installing them later is a directory swap.
+    """
+
+    def __init__(self, eng, interval=3600, channels=(), stage=True, on_new=None):
+        self.engine = eng
+        self.interval = interval
+        self.channels = list(channels)
+        self.stage = stage
+        self.on_new = on_new
+        self.latest = {}
+        self.failures = 0
+        self._stop = threading.Event()
+        self._thread = None
+
+    def poll(self):
+        """Check once; returns the compact records of newly found builds."""
+        main = self.engine.config.section("main")
+        channels = self.channels or [main.get("channel")]
+        found = []
+        try:
+            builds = self.engine.catalog()
+        finally:
+            # Keep the idle footprint small, the next poll fetches again
+            self.engine.builds = []
+        for channel in channels:
+            entry = engine.newest(
+                builds,
+                os_=main.get("os") or engine.current_os(),
+                arch=main.get("flavor"),
+                channel=channel,
+            )
+            if entry is None or self.engine.is_installed(entry):
+                continue
+            record = compact(entry)
+            if self.latest.get(channel, {}).get("hash") == record["hash"]:
+                continue
+            if self.stage and main.get("path"):
+                self.engine.stage(entry, main["path"])
+                self._remove_stale(main["path"], record["hash"])
+            self.latest[channel] = record
+            found.append(record)
+            logger.info(f"New build for {channel}: {record['version']}")
+            if self.on_new:
+                self.on_new(record)
+        return found
+
+    def _remove_stale(self, path, keep):
+        """Delete staged builds superseded by the one just staged."""
+        staged = engine.staged_path({"hash": "*"}, path)
+        keep_paths = {engine.staged_path(r, path) for r in self.latest.values()}
+        keep_paths.add(engine.staged_path({"hash": keep}, path))
+        for directory in glob.glob(staged):
+            # Extractions in progress (.tmp) and folders already being removed
+            if directory.endswith(".tmp") or reaper.TRASH_MARKER in directory:
+                continue
+            if directory not in keep_paths and os.path.isdir(directory):
+                logger.info(f"Removing superseded staged build {directory}")
+                self.engine.reaper.discard(directory)
+
+    def run(self):
+        while not self._stop.is_set():
+            try:
+                self.poll()
+                self.failures = 0
+            except Exception as e:
+                self.failures += 1
+                logger.error(f"Poll failed ({self.failures} in a row): {e}")
+            self._stop.wait(backoff_delay(self.failures, self.interval))
+
+    def start(self):
+        """Poll in a daemon thread until stop() is called."""
+        self._stop.clear()
+        self._thread = threading.Thread(target=self.run, name="Poller", daemon=True)
+        self._thread.start()
+
+    def stop(self):
+        self._stop.set()
+
+    @property
+    def running(self):
+        return self._thread is not None and self._thread.is_alive()
+
+
+def from_settings(eng, on_new=None):
+    """Create a poller configured from the "schedule" settings section."""
+    config = eng.config.section("schedule")
+    return Poller(
+        eng,
+        interval=config.get("interval", 3600),
+        channels=config.get("channels", []),
+        stage=config.get("stage", True),
+        on_new=on_new,
+    )
@@ -0,0 +1,298 @@
+"""
+    Copyright 2016-2019 Tobias Kummer/Overmind Studios.
+
+    This program is free software: you can redistribute it and/or modify
+    it under the terms of the GNU General Public License as published by
+    the Free Software Foundation, either version 3 of the License, or
+    (at your option) any later version.
+
+    This program is distributed in the hope that it will be useful,
+    but WITHOUT ANY WARRANTY; without even the implied warranty of
+    MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+    GNU General Public License for more details.
+
+    You should have received a copy of the GNU General Public License
+    along with this program.  If not, see <https://www.gnu.org/licenses/>.
+"""
+
+import atexit
+import configparser
+import copy
+import json
+import logging
+import os
+import tempfile
+import threading
+import time
+
+from locks import FileLock
+
+logger = logging.getLogger(__name__)
+
+SETTINGS_FILE = "settings.json"
+LEGACY_FILE = "config.ini"
+SCHEMA_VERSION = 1
+
+# Sections and their default content. "main" holds the keys the old
+# config.ini had, the others are free-form mappings keyed by version,
+# URL or metric name.
+DEFAULTS = {
+    "main": {
+        "path": "",
+        "lastcheck": "Never",
+        "lastdl": "",
+        "installed": "",
+        "flavor": "",
+        "os": "",
+        "channel": "",
+        # Further directories every install is written to
+        "targets": [],
+    },
+    # Named install profiles, see profiles.py, and what each has installed
+    "profiles": {},
+    "profile_state": {},
+    # Order in which reflink, hardlink and copy are tried per target, and
+    # globs of archive members to extract or skip, see archives.Rules
+    "install": {
+        "methods": ["reflink", "hardlink", "copy"],
+        "include": [],
+        "exclude": [],
+    },
+    "installed": {},
+    "cache": {},
+    "metrics": {},
+    # Scheduled polling, see scheduler.py
+    "schedule": {
+        "enabled": False,
+        "interval": 3600,
+        "channels": [],
+        "stage": True,
+    },
+    # Download queue, see downloads.py. rate in bytes/s, 0 is unlimited
+    "downloads": {
+        "workers": 3,
+        "rate": 0,
+    },
+    # Download mirrors with the builder's layout, see mirrors.py. The
+    # fastest one by a Range probe of probe_size bytes is used for ttl seconds
+    "mirrors": {
+        "urls": [],
+        "probe_size": 256 * 1024,
+        "ttl": 600,
+    },
+    # LAN cache server, see cacheserver.py. Clients set "url", the serving
+    # machine leaves it empty and keeps "keep" archives
+    "lan": {
+        "url": "",
+        "host": "0.0.0.0",
+        "port": 8977,
+        "keep": 10,
+    },
+    # Peer-to-peer piece sharing, see swarm.py. peers are the base URLs of
+    # other instances, each serving on "port"
+    "swarm": {
+        "enabled": False,
+        "peers": [],
+        "host": "0.0.0.0",
+        "port": 8978,
+        "workers": 4,
+    },
+    # Resource class of installs, see priority.py. "classes" adds to or
+    # changes the built-in normal, background and idle classes
+    "priority": {
+        "class": "normal",
+        "classes": {},
+    },
+    # Launch-time and render benchmarks, see benchmark.py. Timeouts in
+    # seconds per run; with on_install the scenes are rendered after each
+    # install, a slowdown over threshold against the median of the
+    # baseline previous builds is reported
+    "benchmark": {
+        "runs": 5,
+        "timeout": 300,
+        "scenes": [],
+        "frame": 1,
+        "render_timeout": 3600,
+        "on_install": False,
+        "baseline": 3,
+        "threshold": 0.1,
+    },
+    # Post-install warm-up, see warmup.py. workers 0 compiles on all cores
+    "warmup": {
+        "enabled": False,
+        "workers": 0,
+        "timeout": 600,
+    },
+    # Speculative download after a check, see prefetch.py. rate in bytes/s
+    "prefetch": {
+        "enabled": False,
+        "rate": 2 * 1024 * 1024,
+    },
+    # Background service, see daemon.py. "url" is where clients find it.
+    "daemon": {
+        "url": "",
+        "port": 8976,
+        "interval": 900,
+        "channels": [],
+    },
+}
+
+
+class Settings:
+    """Keeps settings in memory and writes them back debounced and atomically.
+
+    Changes are collected per (section, key) and flushed ``delay`` seconds
+    after the last change. A flush takes an inter-process lock, re-reads the
+    file, applies only the keys this process changed and replaces the file
+    with a temporary one, so concurrent instances don't lose each other's
+    updates and a crash never leaves a half written file behind.
+    """
+
+    def __init__(self, filename=SETTINGS_FILE, legacy=LEGACY_FILE, delay=0.5):
+        self.filename = filename
+        self.delay = delay
+        self._lock = threading.RLock()
+        self._file_lock = FileLock(filename + ".lock")
+        self._dirty = set()
+        self._changed = threading.Condition(self._lock)
+        self._deadline = 0
+        self._flusher = None
+        self._data = copy.deepcopy(DEFAULTS)
+        self.exists = os.path.isfile(filename)
+        if self.exists:
+            self._merge(self._read())
+        elif legacy and os.path.isfile(legacy):
+            logger.info(f"Migrating {legacy} to {filename}")
+            self._merge(self._read_legacy(legacy))
+            self.exists = True
+            self._dirty.update(
+                (section, key) for section in self._data for key in self._data[section]
+            )
+            self.flush()
+        atexit.register(self.flush)
+
+    def _read(self):
+        try:
+            with open(self.filename, encoding="utf-8") as f:
+                data = json.load(f)
+        except (OSError, ValueError):
+            logger.error(f"Unable to read {self.filename}, using defaults")
+            return {}
+        if not isinstance(data, dict):
+            logger.error(f"{self.filename} holds no settings object, using defaults")
+            return {}
+        data.pop("schema", None)
+        return data
+
+    @staticmethod
+    def _read_legacy(legacy):
+        parser = configparser.ConfigParser()
+        parser.read(legacy)
+        return {section: dict(parser.items(section)) for section in parser.sections()}
+
+    def _merge(self, data):
+        for section, values in data.items():
+            if isinstance(values, dict):
+                self._data.setdefault(section, {}).update(values)
+
+    def get(self, section, key, default=None):
+        with self._lock:
+            value = self._data.get(section, {}).get(key, default)
+            return copy.deepcopy(value)
+
+    def section(self, section):
+        """Return a copy of a whole section."""
+        with self._lock:
+            return copy.deepcopy(self._data.get(section, {}))
+
+    def set(self, section, key, value):
+        self.update(section, {key: value})
+
+    def update(self, section, values):
+        """Set several keys of a section with a single scheduled flush."""
+        with self._lock:
+            target = self._data.setdefault(section, {})
+            for key, value in values.items():
+                target[key] = copy.deepcopy(value)
+                self._dirty.add((section, key))
+            self._schedule()
+
+    def delete(self, section, key):
+        with self._lock:
+            if key in self._data.get(section, {}):
+                del self._data[section][key]
+                self._dirty.add((section, key))
+                self._schedule()
+
+    def _schedule(self):
+        # Called with the lock held; one thread serves all pending changes
+        self._deadline = time.monotonic() + self.delay
+        if self._flusher is None:
+            self._flusher = threading.Thread(
+                target=self._flush_later, name="Settings", daemon=True
+            )
+            self._flusher.start()
+
+    def _flush_later(self):
+        """Flush once no change came in for delay seconds."""
+        with self._lock:
+            try:
+                while self._dirty:
+                    remaining = self._deadline - time.monotonic()
+                    if remaining <= 0:
+                        self.flush()
+                    else:
+                        self._changed.wait(remaining)
+            finally:
+                self._flusher = None
+
+    def flush(self):
+        """Write pending changes to disk now."""
+        with self._lock:
+            if not self._dirty:
+                return
+            with self._file_lock:
+                on_disk = copy.deepcopy(DEFAULTS)
+                if os.path.isfile(self.filename):
+                    for section, values in self._read().items():
+                        on_disk.setdefault(section, {}).update(values)
+                for section, key in self._dirty:
+                    if key in self._data.get(section, {}):
+                        on_disk.setdefault(section, {})[key] = self._data[section][key]
+                    else:
+                        on_disk.get(section, {}).pop(key, None)
+                self._write(on_disk)
+                self._data = on_disk
+            self._dirty.clear()
+            self.exists = True
+            self._changed.notify_all()
+
+    def _write(self, data):
+        directory = os.path.dirname(os.path.abspath(self.filename))
+        fd, tmp = tempfile.mkstemp(prefix=".settings-", dir=directory)
+        try:
+            with os.fdopen(fd, "w", encoding="utf-8") as f:
+                json.dump(
+                    dict(data, schema=SCHEMA_VERSION), f, indent=2, sort_keys=True
+                )
+                f.flush()
+                os.fsync(f.fileno())
+            os.replace(tmp, self.filename)
+        except BaseException:
+            if os.path.exists(tmp):
+                os.remove(tmp)
+            raise
+
+    def reload(self):
+        """Pick up changes written by other processes."""
+        with self._lock:
+            pending = {
+                (section, key): self._data[section][key]
+                for section, key in self._dirty
+                if key in self._data.get(section, {})
+            }
+            self._data = copy.deepcopy(DEFAULTS)
+            if os.path.isfile(self.filename):
+                self._merge(self._read())
+            for (section, key), value in pending.items():
+                self._data.setdefault(section, {})[key] = value
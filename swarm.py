@@ -0,0 +1,605 @@
+"""
+    Copyright 2016-2019 Tobias Kummer/Overmind Studios.
+
+    This program is free software: you can redistribute it and/or modify
+    it under the terms of the GNU General Public License as published by
+    the Free Software Foundation, either version 3 of the License, or
+    (at your option) any later version.
+
+    This program is distributed in the hope that it will be useful,
+    but WITHOUT ANY WARRANTY; without even the implied warranty of
+    MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+    GNU General Public License for more details.
+
+    You should have received a copy of the GNU General Public License
+    along with this program.  If not, see <https://www.gnu.org/licenses/>.
+"""
+
+import hashlib
+import json
+import logging
+import os
+import random
+import subprocess
+import sys
+import tempfile
+import threading
+import time
+import urllib.parse
+import uuid
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import requests
+
+import downloads
+
+logger = logging.getLogger(__name__)
+
+PIECE_SIZE = 1024 * 1024
+# Seconds between polls of the peers' piece lists during a download
+REFRESH_INTERVAL = 0.5
+# Seconds to wait for pieces other peers are fetching before fetching upstream
+STALL_TIMEOUT = 10
+
+
+def upstream_size(urls, session=None):
+    """Return the size of an archive from a one byte Range request."""
+    for url in urls:
+        try:
+            with (session or requests).get(
+                url, headers={"Range": "bytes=0-0"}, stream=True, timeout=10
+            ) as req:
+                req.raise_for_status()
+                if req.status_code == 206:
+                    return int(req.headers["Content-Range"].rsplit("/", 1)[1])
+                return int(req.headers["Content-Length"])
+        except (requests.RequestException, KeyError, ValueError):
+            continue
+    raise IOError("Size of the archive unknown")
+
+
+def file_manifest(path, piece_size=PIECE_SIZE):
+    """Hash a complete archive into a manifest of piece hashes."""
+    whole = hashlib.sha256()
+    pieces = []
+    with open(path, "rb") as f:
+        for data in iter(lambda: f.read(piece_size), b""):
+            whole.update(data)
+            pieces.append(hashlib.sha256(data).hexdigest())
+    return {
+        "size": os.path.getsize(path),
+        "piece_size": piece_size,
+        "sha256": whole.hexdigest(),
+        "pieces": pieces,
+    }
+
+
+class Transfer:
+    """Piece bookkeeping of one archive being assembled from the swarm.
+
+    have are the pieces written to the .part file, pending the ones a
+    worker is fetching. Both are announced to the other peers.
+    """
+
+    def __init__(self, name, manifest, part):
+        self.name = name
+        self.manifest = manifest
+        self.part = part
+        self.count = -(-manifest["size"] // manifest["piece_size"])
+        self.have = set()
+        self.pending = set()
+        self.peers = {}
+        self.refreshed = 0
+        self.upstream_bytes = 0
+        self.peer_bytes = 0
+        self.error = None
+        self.lock = threading.Lock()
+
+    def span(self, index):
+        """Return the offset and length of a piece."""
+        offset = index * self.manifest["piece_size"]
+        return offset, min(self.manifest["piece_size"], self.manifest["size"] - offset)
+
+    def verify(self, index, data):
+        if len(data) != self.span(index)[1]:
+            return False
+        pieces = self.manifest.get("pieces")
+        return not pieces or hashlib.sha256(data).hexdigest() == pieces[index]
+
+    def state(self, peer_id):
+        with self.lock:
+            return {
+                "id": peer_id,
+                "manifest": self.manifest,
+                "have": sorted(self.have),
+                "pending": sorted(self.pending),
+            }
+
+
+class Swarm:
+    """Shares archive pieces with other instances on the network.
+
+    Every instance serves the pieces it has over HTTP. A download asks
+    the configured peers which pieces they have and fetches those in
+    parallel, rarest first. The upstream URLs only seed pieces no peer has
+    or is fetching. A peer's manifest is only used if its whole-file
+    checksum matches the one published upstream. Its piece hashes catch
+    pieces damaged in transit, but a peer could make them up: only the
+    check of the assembled archive against the upstream checksum protects
+    against that, and a mismatch falls back to a plain download.
+    """
+
+    def __init__(
+        self,
+        peers=(),
+        host="127.0.0.1",
+        port=8978,
+        workers=4,
+        cache=None,
+        piece_size=PIECE_SIZE,
+    ):
+        self.peers = [peer.rstrip("/") for peer in peers if peer]
+        self.host = host
+        self.port = port
+        self.workers = workers
+        self.cache = cache
+        self.piece_size = piece_size
+        # Announced to the other peers to divide the upstream pieces
+        self.id = uuid.uuid4().hex
+        self.transfers = {}
+        # Archives completed by swarm downloads, by name
+        self.complete = {}
+        self.results = {}
+        self._manifests = {}
+        self._lock = threading.Lock()
+        self._server = None
+
+    def start(self):
+        """Serve pieces in a daemon thread; does nothing if already serving."""
+        with self._lock:
+            if self._server is not None:
+                return
+            try:
+                self._server = ThreadingHTTPServer(
+                    (self.host, self.port), _handler(self)
+                )
+            except OSError as e:
+                logger.warning(f"Can't serve pieces on port {self.port}: {e}")
+                return
+        self.port = self._server.server_address[1]
+        threading.Thread(
+            target=self._server.serve_forever, name="Swarm", daemon=True
+        ).start()
+        logger.info(f"Serving pieces on http://{self.host}:{self.port}")
+
+    def stop(self):
+        if self._server is not None:
+            self._server.shutdown()
+            self._server.server_close()
+            self._server = None
+
+    def download(self, url, filename, progress=None, session=None, throttle=None):
+        """Download like downloads.download(), but from the swarm.
+
+        Falls back to a plain download if no peers are configured, there
+        is no upstream checksum or the swarm download fails.
+        """
+        urls = [url] if isinstance(url, str) else list(url)
+        if self.peers:
+            self.start()
+            try:
+                return self._download(urls, filename, progress, session, throttle)
+            except downloads.Cancelled:
+                raise
+            except Exception as e:
+                logger.warning(f"Swarm download of {filename} failed ({e})")
+        return downloads.download(urls, filename, progress, session, throttle)
+
+    def _download(self, urls, filename, progress, session, throttle):
+        session = session or requests.Session()
+        name = os.path.basename(filename)
+        checksum = downloads.upstream_checksum(urls, session)
+        if checksum is None:
+            raise IOError("No upstream checksum to verify against")
+        manifest = self._peer_manifest(name, checksum) or {
+            "size": upstream_size(urls, session),
+            "piece_size": self.piece_size,
+            "sha256": checksum,
+            "pieces": None,
+        }
+        transfer = Transfer(name, manifest, filename + ".part")
+        with open(transfer.part, "wb") as f:
+            f.truncate(manifest["size"])
+        started = time.monotonic()
+        with self._lock:
+            self.transfers[name] = transfer
+        try:
+            workers = [
+                threading.Thread(
+                    target=self._work,
+                    args=(transfer, urls, progress, throttle),
+                    daemon=True,
+                )
+                for _ in range(self.workers)
+            ]
+            for worker in workers:
+                worker.start()
+            for worker in workers:
+                worker.join()
+            if transfer.error is not None:
+                raise transfer.error
+            result = file_manifest(transfer.part, manifest["piece_size"])
+            if result["sha256"] != checksum:
+                raise IOError(f"Checksum mismatch for {name}")
+            os.replace(transfer.part, filename)
+        except BaseException:
+            if os.path.exists(transfer.part):
+                os.remove(transfer.part)
+            raise
+        finally:
+            with self._lock:
+                del self.transfers[name]
+        self._manifests[filename] = (os.path.getmtime(filename), result)
+        self.complete[name] = filename
+        self.results[name] = {
+            "size": manifest["size"],
+            "upstream_bytes": transfer.upstream_bytes,
+            "peer_bytes": transfer.peer_bytes,
+            "seconds": round(time.monotonic() - started, 3),
+        }
+        logger.info(f"Swarm download of {name} done: {self.results[name]}")
+        return filename
+
+    def _peer_manifest(self, name, checksum):
+        """Return the manifest of the first peer whose checksum matches.
+
+        The piece hashes in it are the peer's word, see Swarm.
+        """
+        for peer in self.peers:
+            state = self._peer_state(peer, name)
+            if state and state["manifest"]["sha256"] == checksum:
+                return state["manifest"]
+        return None
+
+    def _peer_state(self, peer, name):
+        try:
+            req = requests.get(f"{peer}/swarm/{urllib.parse.quote(name)}", timeout=2)
+            if req.status_code == 404:
+                return None
+            req.raise_for_status()
+            return req.json()
+        except (requests.RequestException, ValueError):
+            return None
+
+    def _refresh(self, transfer):
+        """Poll the peers' piece lists, at most every REFRESH_INTERVAL."""
+        with transfer.lock:
+            if time.monotonic() - transfer.refreshed < REFRESH_INTERVAL:
+                return
+            transfer.refreshed = time.monotonic()
+        peers = {}
+        for peer in self.peers:
+            state = self._peer_state(peer, transfer.name)
+            if not state or state["manifest"]["sha256"] != transfer.manifest["sha256"]:
+                continue
+            peers[peer] = {
+                "id": state["id"],
+                "have": set(state["have"]),
+                "pending": set(state["pending"]),
+            }
+            if not transfer.manifest.get("pieces") and state["manifest"].get("pieces"):
+                transfer.manifest = state["manifest"]
+        with transfer.lock:
+            transfer.peers = peers
+
+    def _next(self, transfer, waiting):
+        """Pick the next piece and where to get it (a peer or None for upstream).
+
+        Pieces some peer has are fetched from peers, rarest first. Upstream
+        pieces are striped over the peers by their ids, so each only seeds
+        its share. Returns (None, None) when nothing is left and (-1, None)
+        when the remaining pieces are for other peers to seed; after
+        STALL_TIMEOUT of waiting for them they are fetched upstream anyway.
+        """
+        self._refresh(transfer)
+        with transfer.lock:
+            missing = [
+                index
+                for index in range(transfer.count)
+                if index not in transfer.have and index not in transfer.pending
+            ]
+            if not missing:
+                return None, None
+            holders = {}
+            fetching = set()
+            for peer, state in transfer.peers.items():
+                fetching |= state["pending"]
+                for index in state["have"]:
+                    holders.setdefault(index, []).append(peer)
+            available = [index for index in missing if index in holders]
+            if available:
+                # Rarest first, ties broken randomly to spread the load
+                random.shuffle(available)
+                index = min(available, key=lambda index: len(holders[index]))
+                source = random.choice(holders[index])
+            else:
+                ids = sorted([self.id] + [s["id"] for s in transfer.peers.values()])
+                rank = ids.index(self.id)
+                unclaimed = [index for index in missing if index not in fetching]
+                own = [index for index in unclaimed if index % len(ids) == rank]
+                if own:
+                    # Alone so far (others may be starting too): spread out
+                    index = own[0] if transfer.peers else random.choice(own)
+                elif waiting >= STALL_TIMEOUT:
+                    index = random.choice(unclaimed or missing)
+                else:
+                    return -1, None
+                source = None
+            transfer.pending.add(index)
+            return index, source
+
+    def _work(self, transfer, urls, progress, throttle):
+        session = requests.Session()
+        waiting = 0
+        while transfer.error is None:
+            try:
+                index, source = self._next(transfer, waiting)
+                if index is None:
+                    return
+                if index < 0:
+                    time.sleep(REFRESH_INTERVAL / 2)
+                    waiting += REFRESH_INTERVAL / 2
+                    continue
+                waiting = 0
+                data = None
+                if source is not None:
+                    data = self._from_peer(transfer, source, index)
+                if data is None:
+                    data = self._from_upstream(transfer, urls, session, index)
+                self._store(transfer, index, data, progress)
+                if throttle:
+                    throttle(len(data))
+            except BaseException as e:
+                transfer.error = e
+                return
+
+    def _from_peer(self, transfer, peer, index):
+        try:
+            req = requests.get(
+                f"{peer}/piece/{urllib.parse.quote(transfer.name)}/{index}", timeout=10
+            )
+            req.raise_for_status()
+        except requests.RequestException as e:
+            logger.debug(f"Piece {index} from {peer} failed: {e}")
+            return None
+        if not transfer.verify(index, req.content):
+            logger.warning(f"Piece {index} from {peer} is corrupt")
+            return None
+        with transfer.lock:
+            transfer.peer_bytes += len(req.content)
+        return req.content
+
+    def _from_upstream(self, transfer, urls, session, index):
+        offset, length = transfer.span(index)
+        headers = {"Range": f"bytes={offset}-{offset + length - 1}"}
+        for url in urls:
+            try:
+                req = session.get(url, headers=headers, timeout=30)
+                req.raise_for_status()
+            except requests.RequestException as e:
+                logger.debug(f"Piece {index} from {url} failed: {e}")
+                continue
+            if req.status_code == 206 and transfer.verify(index, req.content):
+                with transfer.lock:
+                    transfer.upstream_bytes += len(req.content)
+                return req.content
+        raise IOError(f"Piece {index} not available upstream")
+
+    def _store(self, transfer, index, data, progress):
+        offset, _ = transfer.span(index)
+        with open(transfer.part, "r+b") as f:
+            f.seek(offset)
+            f.write(data)
+        with transfer.lock:
+            transfer.pending.discard(index)
+            transfer.have.add(index)
+            done = sum(transfer.span(index)[1] for index in transfer.have)
+        if progress:
+            progress(done, transfer.manifest["size"])
+
+    def state(self, name):
+        """Return the manifest and piece lists of an archive, None if unknown."""
+        with self._lock:
+            transfer = self.transfers.get(name)
+        if transfer is not None:
+            return transfer.state(self.id)
+        path = self._complete(name)
+        if path is None:
+            return None
+        manifest = self.manifest(path)
+        return {
+            "id": self.id,
+            "manifest": manifest,
+            "have": list(range(len(manifest["pieces"]))),
+            "pending": [],
+        }
+
+    def manifest(self, path):
+        """Return the manifest of a complete archive, hashed once per mtime."""
+        mtime = os.path.getmtime(path)
+        cached = self._manifests.get(path)
+        if cached is None or cached[0] != mtime:
+            cached = (mtime, file_manifest(path, self.piece_size))
+            self._manifests[path] = cached
+        return cached[1]
+
+    def _complete(self, name):
+        path = self.complete.get(name)
+        if path is None and self.cache and valid_name(name):
+            path = os.path.join(self.cache, name)
+        return path if path and os.path.isfile(path) else None
+
+    def piece(self, name, index):
+        """Return the data of a piece this instance has, None otherwise."""
+        with self._lock:
+            transfer = self.transfers.get(name)
+        if transfer is not None:
+            with transfer.lock:
+                if index not in transfer.have:
+                    return None
+            path = transfer.part
+            offset, length = transfer.span(index)
+        else:
+            path = self._complete(name)
+            if path is None:
+                return None
+            offset, length = index * self.piece_size, self.piece_size
+        try:
+            with open(path, "rb") as f:
+                f.seek(offset)
+                return f.read(length) or None
+        except FileNotFoundError:
+            # The download finished and renamed its .part file meanwhile
+            return None
+
+
+def valid_name(name):
+    """Whether a requested archive name stays inside the cache folder."""
+    return (
+        os.path.basename(name) == name
+        and "\\" not in name
+        and ".." not in name
+        and not name.startswith(".")
+    )
+
+
+def _handler(swarm):
+    class Handler(BaseHTTPRequestHandler):
+        def log_message(self, format, *args):
+            logger.debug(format % args)
+
+        def send(self, code, body, content_type):
+            self.send_response(code)
+            self.send_header("Content-Type", content_type)
+            self.send_header("Content-Length", str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+
+        def do_GET(self):
+            parts = urllib.parse.unquote(self.path).strip("/").split("/")
+            try:
+                if len(parts) == 2 and parts[0] == "swarm":
+                    state = swarm.state(parts[1])
+                    if state is not None:
+                        body = json.dumps(state).encode()
+                        return self.send(200, body, "application/json")
+                elif len(parts) == 3 and parts[0] == "piece":
+                    data = swarm.piece(parts[1], int(parts[2]))
+                    if data is not None:
+                        return self.send(200, data, "application/octet-stream")
+            except ValueError:
+                pass
+            self.send(404, b'{"error": "not found"}', "application/json")
+
+    return Handler
+
+
+_shared = None
+_shared_lock = threading.Lock()
+
+
+def shared_swarm(config, cache):
+    """Return the process wide swarm, created from the settings."""
+    global _shared
+    with _shared_lock:
+        if _shared is None:
+            section = config.section("swarm")
+            # Only reachable from the network when sharing is switched on
+            host = "127.0.0.1"
+            if section.get("enabled"):
+                host = section.get("host") or "0.0.0.0"
+            _shared = Swarm(
+                section.get("peers", []),
+                host=host,
+                port=section.get("port", 8978),
+                workers=section.get("workers", 4),
+                cache=cache,
+            )
+        return _shared
+
+
+def bench(url, hash_, peers=4, base_port=8990, timeout=600, cli=None, workers=None):
+    """Download one build with N local peer processes and compare the traffic.
+
+    Every peer runs ``cli.py swarm`` with its own temporary directory,
+    archive cache and port, knowing all others, with workers download
+    threads each (default: swarm.workers of the settings). Returns the summed upstream ("WAN") bytes,
+    what N independent downloads would have cost and the time until the
+    last peer completed.
+    """
+    cli = cli or os.path.join(os.path.dirname(os.path.abspath(__file__)), "cli.py")
+    workdir = tempfile.mkdtemp(prefix="swarm-bench-")
+    ports = [base_port + number for number in range(peers)]
+    procs = []
+    started = time.monotonic()
+    try:
+        for port in ports:
+            directory = os.path.join(workdir, str(port))
+            os.makedirs(directory)
+            others = [f"http://127.0.0.1:{other}" for other in ports if other != port]
+            config = {
+                "swarm": {
+                    "enabled": True,
+                    "peers": others,
+                    "host": "127.0.0.1",
+                    "port": port,
+                }
+            }
+            if workers:
+                config["swarm"]["workers"] = workers
+            with open(os.path.join(directory, "settings.json"), "w") as f:
+                json.dump(config, f)
+            command = [sys.executable, cli, "--url", url, "swarm", "--hash", hash_]
+            command += ["--stats", "stats.json", "--linger", str(timeout)]
+            procs.append(
+                subprocess.Popen(
+                    command,
+                    cwd=directory,
+                    env=dict(
+                        os.environ,
+                        BLENDERUPDATER_CACHE=os.path.join(directory, "cache"),
+                    ),
+                    stdout=subprocess.DEVNULL,
+                    stderr=subprocess.DEVNULL,
+                )
+            )
+        stats = {}
+        while len(stats) < peers and time.monotonic() - started < timeout:
+            for port in ports:
+                path = os.path.join(workdir, str(port), "stats.json")
+                if port not in stats and os.path.isfile(path):
+                    with open(path) as f:
+                        stats[port] = json.load(f)
+            if any(proc.poll() not in (None, 0) for proc in procs):
+                raise RuntimeError("A peer process failed")
+            time.sleep(0.1)
+    finally:
+        for proc in procs:
+            proc.terminate()
+            proc.wait()
+    if len(stats) < peers:
+        raise TimeoutError(f"Only {len(stats)} of {peers} peers completed")
+    wall = time.monotonic() - started
+    size = next(iter(stats.values()))["size"]
+    wan = sum(result["upstream_bytes"] for result in stats.values())
+    return {
+        "peers": peers,
+        "size": size,
+        "wan_bytes": wan,
+        "baseline_wan_bytes": size * peers,
+        "wan_saved": round(1 - wan / (size * peers), 3),
+        "time_to_complete": max(result["seconds"] for result in stats.values()),
+        "wall_seconds": round(wall, 3),
+        "per_peer": stats,
+        "workdir": workdir,
+    }
@@ -0,0 +1,181 @@
+"""
+    Copyright 2016-2019 Tobias Kummer/Overmind Studios.
+
+    This program is free software: you can redistribute it and/or modify
+    it under the terms of the GNU General Public License as published by
+    the Free Software Foundation, either version 3 of the License, or
+    (at your option) any later version.
+
+    This program is distributed in the hope that it will be useful,
+    but WITHOUT ANY WARRANTY; without even the implied warranty of
+    MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+    GNU General Public License for more details.
+
+    You should have received a copy of the GNU General Public License
+    along with this program.  If not, see <https://www.gnu.org/licenses/>.
+"""
+
+import concurrent.futures
+import logging
+import os
+import shutil
+import time
+
+from cancellation import Cancelled, check
+
+try:
+    import fcntl
+except ImportError:  # Windows
+    fcntl = None
+
+logger = logging.getLogger(__name__)
+
+# Fastest first. Links and clones share the data with the extracted build,
+# the first method that works for a target is used for all its files.
+METHODS = ("reflink", "hardlink", "copy")
+FICLONE = 0x40049409
+# Bytes copied between cancellation checks
+COPY_CHUNK = 4 * 1024 * 1024
+
+
+def reflink(source, target, cancel=None, throttle=None):
+    """Clone a file on copy-on-write filesystems (btrfs, xfs)."""
+    if fcntl is None:
+        raise OSError("reflink not supported on this platform")
+    with open(source, "rb") as src, open(target, "wb") as dst:
+        fcntl.ioctl(dst.fileno(), FICLONE, src.fileno())
+    shutil.copystat(source, target)
+
+
+def _hardlink(source, target, cancel=None, throttle=None):
+    os.link(source, target)
+
+
+def _copy(source, target, cancel=None, throttle=None):
+    """Copy a file in chunks, checking the CancelToken cancel between them.
+
+    throttle(nbytes) is called per chunk written, like in downloads.py.
+    """
+    with open(source, "rb") as src, open(target, "wb") as dst:
+        for data in iter(lambda: src.read(COPY_CHUNK), b""):
+            check(cancel)
+            dst.write(data)
+            if throttle:
+                throttle(len(data))
+    shutil.copystat(source, target)
+
+
+PLACERS = {"reflink": reflink, "hardlink": _hardlink, "copy": _copy}
+
+
+def _files(source):
+    """Relative paths of all directories and files below source."""
+    dirs, files = [], []
+    for root, dirnames, filenames in os.walk(source):
+        rel = os.path.relpath(root, source)
+        for name in dirnames:
+            path = os.path.join(root, name)
+            # Symlinked directories are recreated as links, not walked
+            (files if os.path.islink(path) else dirs).append(os.path.join(rel, name))
+        files.extend(os.path.join(rel, name) for name in filenames)
+    return dirs, files
+
+
+def place_tree(
+    source, target, methods=METHODS, progress=None, cancel=None, throttle=None
+):
+    """Write the tree below source into target using the fastest method.
+
+    Existing files in target are replaced, never written through, so a
+    target linked to an earlier build doesn't change that build's files.
+    progress(done, total) is called per file and throttle(nbytes) per
+    chunk copied. Copies stop with Cancelled shortly after the CancelToken
+    cancel fires. Returns the method used.
+    """
+    dirs, files = _files(source)
+    os.makedirs(target, exist_ok=True)
+    for rel in dirs:
+        os.makedirs(os.path.join(target, rel), exist_ok=True)
+    candidates = list(methods)
+    used = None
+    for done, rel in enumerate(files, 1):
+        check(cancel)
+        src = os.path.join(source, rel)
+        dst = os.path.join(target, rel)
+        if os.path.lexists(dst):
+            os.remove(dst)
+        if os.path.islink(src):
+            os.symlink(os.readlink(src), dst)
+        else:
+            while True:
+                method = candidates[0]
+                try:
+                    PLACERS[method](src, dst, cancel, throttle)
+                    break
+                except Cancelled:
+                    os.remove(dst)
+                    raise
+                except OSError:
+                    if len(candidates) == 1:
+                        raise
+                    logger.debug(f"{method} not possible for {target}, trying next")
+                    if os.path.lexists(dst):
+                        os.remove(dst)
+                    candidates.pop(0)
+            used = used or method
+        if progress:
+            progress(done, len(files))
+    return used or candidates[0]
+
+
+def place_all(
+    source,
+    targets,
+    methods=METHODS,
+    progress=None,
+    workers=None,
+    cancel=None,
+    throttle=None,
+    initializer=None,
+):
+    """Write source into several targets in parallel.
+
+    Every target is handled independently; one failing doesn't stop the
+    others, cancelling stops all and raises Cancelled. progress(target,
+    done, total) is called per file. At most workers targets are written
+    at once, by threads that first call initializer(), e.g. to lower their
+    priority. Returns a dict per target with "ok", "method", "seconds" and
+    "error".
+    """
+    results = {}
+
+    def place(target):
+        started = time.monotonic()
+        try:
+            if not os.path.isdir(target):
+                raise NotADirectoryError(f"Not a valid destination directory: {target}")
+            method = place_tree(
+                source,
+                target,
+                methods,
+                (lambda done, total: progress(target, done, total))
+                if progress
+                else None,
+                cancel,
+                throttle,
+            )
+            result = {"ok": True, "method": method, "error": None}
+        except Cancelled:
+            raise
+        except Exception as e:
+            logger.exception(f"Writing {target} failed")
+            result = {"ok": False, "method": None, "error": str(e)}
+        result["seconds"] = round(time.monotonic() - started, 3)
+        return result
+
+    with concurrent.futures.ThreadPoolExecutor(
+        min(workers or len(targets), len(targets)) or 1, initializer=initializer
+    ) as pool:
+        for target, result in zip(targets, pool.map(place, targets)):
+            results[target] = result
+    return results
@@ -0,0 +1,233 @@
+"""
+    Copyright 2016-2019 Tobias Kummer/Overmind Studios.
+
+    This program is free software: you can redistribute it and/or modify
+    it under the terms of the GNU General Public License as published by
+    the Free Software Foundation, either version 3 of the License, or
+    (at your option) any later version.
+
+    This program is distributed in the hope that it will be useful,
+    but WITHOUT ANY WARRANTY; without even the implied warranty of
+    MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+    GNU General Public License for more details.
+
+    You should have received a copy of the GNU General Public License
+    along with this program.  If not, see <https://www.gnu.org/licenses/>.
+"""
+
+import hashlib
+import io
+import os
+import re
+import socket
+import sys
+import tarfile
+import tempfile
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import pytest
+
+# The modules live in the top folder of the repository
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+# Keep the per-user cache (history, benchmarks, ...) out of the home folder
+os.environ["BLENDERUPDATER_CACHE"] = tempfile.mkdtemp(prefix="blenderupdater-tests-")
+
+import engine  # noqa: E402
+import settings  # noqa: E402
+
+ARCHIVE = "blender-3.0.0-alpha+master.aaaa11112222-linux.x86_64-release.tar.xz"
+# Builds on the fixture builder page, oldest first: (hash, date)
+BUILDS = (("aaaa11112222", "May 24, 07:44:19"), ("bbbb33334444", "May 25, 07:44:19"))
+# Executable of the fixture builds; prints its hash
+BLENDER = "#!/bin/sh\necho Blender {hash}\n"
+
+
+class FileServer:
+    """Local HTTP server with one behaviour per URL prefix.
+
+    /range/ honours Range requests, /norange/ always sends the whole file,
+    /truncated/ honours Range but closes the connection after cut bytes,
+    /slow/ honours Range but answers after latency seconds and sends rate
+    bytes per second, and /broken/ answers 500. pages are served as is by
+    path, with an ETag. Requests are logged as (path, Range header).
+    """
+
+    def __init__(self, files, cut, pages=None, latency=0.2, rate=1024 * 1024):
+        self.files = files
+        self.cut = cut
+        self.pages = pages or {}
+        self.latency = latency
+        self.rate = rate
+        self.requests = []
+        self._server = ThreadingHTTPServer(("127.0.0.1", 0), _handler(self))
+        self.url = f"http://127.0.0.1:{self._server.server_address[1]}"
+
+    def base(self, mode):
+        return f"{self.url}/{mode}/"
+
+    def start(self):
+        threading.Thread(target=self._server.serve_forever, daemon=True).start()
+
+    def stop(self):
+        self._server.shutdown()
+        self._server.server_close()
+
+
+def _handler(server):
+    class Handler(BaseHTTPRequestHandler):
+        def log_message(self, format, *args):
+            pass
+
+        def do_GET(self):
+            server.requests.append((self.path, self.headers.get("Range")))
+            if self.path in server.pages:
+                page = server.pages[self.path]
+                etag = '"' + hashlib.sha1(page).hexdigest() + '"'
+                if self.headers.get("If-None-Match") == etag:
+                    self.send_response(304)
+                    self.end_headers()
+                    return
+                self.send_response(200)
+                self.send_header("ETag", etag)
+                self.send_header("Content-Length", str(len(page)))
+                self.end_headers()
+                self.wfile.write(page)
+                return
+            _, mode, name = self.path.split("/", 2)
+            data = server.files.get(name)
+            if data is None or mode == "broken":
+                self.send_error(404 if data is None else 500)
+                return
+            if mode == "slow":
+                time.sleep(server.latency)
+            first = 0
+            match = re.match(r"bytes=(\d+)-(\d*)$", self.headers.get("Range", ""))
+            if match and mode != "norange":
+                first = int(match.group(1))
+                last = int(match.group(2) or len(data) - 1)
+                body = data[first : last + 1]
+                self.send_response(206)
+                self.send_header("Content-Range", f"bytes {first}-{last}/{len(data)}")
+            else:
+                body = data
+                self.send_response(200)
+            self.send_header("Content-Length", str(len(body)))
+            self.end_headers()
+            if mode == "truncated":
+                body = body[: max(server.cut - first, 0)]
+            if mode != "slow":
+                self.wfile.write(body)
+                return
+            chunk = 16 * 1024
+            for offset in range(0, len(body), chunk):
+                time.sleep(chunk / server.rate)
+                self.wfile.write(body[offset : offset + chunk])
+
+    return Handler
+
+
+@pytest.fixture
+def archive_data():
+    return os.urandom(1024 * 1024 + 123)
+
+
+@pytest.fixture
+def file_server(archive_data):
+    server = FileServer({ARCHIVE: archive_data}, cut=300 * 1024)
+    server.start()
+    yield server
+    server.stop()
+
+
+@pytest.fixture
+def slow_server(archive_data):
+    """A second server, throttled below /slow/: 0.3 s latency, 256 kB/s."""
+    server = FileServer(
+        {ARCHIVE: archive_data}, cut=300 * 1024, latency=0.3, rate=256 * 1024
+    )
+    server.start()
+    yield server
+    server.stop()
+
+
+@pytest.fixture
+def dead_url():
+    """URL of a port nothing listens on."""
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        port = sock.getsockname()[1]
+    return f"http://127.0.0.1:{port}/"
+
+
+def build_name(hash_):
+    return f"blender-3.0.0-alpha+master.{hash_}-linux.x86_64-release"
+
+
+def make_archive(hash_, size=2 * 1024 * 1024 + 4321):
+    """Return a .tar.xz of a small Linux build with size bytes of payload."""
+    name = build_name(hash_)
+    members = {
+        "blender": BLENDER.format(hash=hash_).encode(),
+        "3.0/scripts/startup/startup.py": b"x = 1\n",
+        "3.0/datafiles/locale/de/blender.mo": os.urandom(64 * 1024),
+        "payload.bin": os.urandom(size),
+    }
+    buffer = io.BytesIO()
+    with tarfile.open(fileobj=buffer, mode="w:xz", preset=0) as tar:
+        for path, data in members.items():
+            info = tarfile.TarInfo(f"{name}/{path}")
+            info.size = len(data)
+            info.mode = 0o755 if path == "blender" else 0o644
+            tar.addfile(info, io.BytesIO(data))
+    return buffer.getvalue()
+
+
+@pytest.fixture(scope="session")
+def build_archives():
+    """Archive data of BUILDS by filename, made once per test run."""
+    return {build_name(hash_) + ".tar.xz": make_archive(hash_) for hash_, _ in BUILDS}
+
+
+@pytest.fixture
+def builder(build_archives):
+    """FileServer with a builder page listing BUILDS.
+
+    The archives are served with a .sha256 next to them. The page at
+    /download/ links them below /range/, the one at /slow/download/ below
+    /slow/.
+    """
+    files = dict(build_archives)
+    for name, data in build_archives.items():
+        files[name + ".sha256"] = hashlib.sha256(data).hexdigest().encode()
+    server = FileServer(files, cut=0)
+    for mode, path in (("range", "/download/"), ("slow", "/slow/download/")):
+        items = []
+        for hash_, date in BUILDS:
+            name = build_name(hash_) + ".tar.xz"
+            size = len(build_archives[name]) / 1e6
+            items.append(
+                f'<li class="os linux"><a href="{server.base(mode)}{name}">'
+                f'<div class="name">Blender 3.0.0<small>{date} - {hash_} - '
+                f'tar.xz - {size:.2f}MB</small></div><span class="build">x86_64 '
+                f'</span><span class="build-var">master</span></a></li>'
+            )
+        page = f"<html><body><ul>{''.join(items)}</ul></body></html>"
+        server.pages[path] = page.encode()
+    server.catalog_url = server.url + "/download/"
+    server.start()
+    yield server
+    server.stop()
+
+
+@pytest.fixture
+def eng(builder, tmp_path):
+    """Engine with its own settings, staging and cache, using builder."""
+    config = settings.Settings(str(tmp_path / "settings.json"), legacy=None)
+    return engine.Engine(
+        config,
+        staging=str(tmp_path / "staging"),
+        url=builder.catalog_url,
+        cache=str(tmp_path / "cache"),
+    )
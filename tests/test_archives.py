@@ -0,0 +1,132 @@
+"""
+    Copyright 2016-2019 Tobias Kummer/Overmind Studios.
+
+    This program is free software: you can redistribute it and/or modify
+    it under the terms of the GNU General Public License as published by
+    the Free Software Foundation, either version 3 of the License, or
+    (at your option) any later version.
+
+    This program is distributed in the hope that it will be useful,
+    but WITHOUT ANY WARRANTY; without even the implied warranty of
+    MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+    GNU General Public License for more details.
+
+    You should have received a copy of the GNU General Public License
+    along with this program.  If not, see <https://www.gnu.org/licenses/>.
+"""
+
+import io
+import os
+import tarfile
+import zipfile
+
+import pytest
+
+import archives
+from cancellation import Cancelled, CancelToken
+from conftest import BUILDS, build_name
+
+NAME = build_name(BUILDS[0][0])
+
+
+class CountingToken(CancelToken):
+    """Cancels itself at the given check, counting from one."""
+
+    def __init__(self, at=None):
+        super().__init__()
+        self.at = at
+        self.checks = 0
+
+    def check(self):
+        self.checks += 1
+        if self.checks == self.at:
+            self.cancel()
+        super().check()
+
+
+@pytest.fixture
+def tar_archive(build_archives, tmp_path):
+    path = tmp_path / (NAME + ".tar.xz")
+    path.write_bytes(build_archives[NAME + ".tar.xz"])
+    return str(path)
+
+
+def test_cancel_while_skipping_a_member(tar_archive, tmp_path):
+    rules = archives.Rules(exclude=["payload.bin"])
+    counting = CountingToken()
+    archives.extract(tar_archive, str(tmp_path / "all"), counting, rules=rules)
+    # The skipped payload (over 2 MB) is read in chunks, checking in between
+    payload = 2 * 1024 * 1024 // archives.CHUNK_SIZE
+    cancel = CountingToken(at=counting.checks - payload)
+    with pytest.raises(Cancelled):
+        archives.extract(tar_archive, str(tmp_path / "cancelled"), cancel, rules=rules)
+    assert not os.path.exists(tmp_path / "cancelled" / NAME / "payload.bin")
+
+
+MEMBERS = {
+    "blender-3.0/blender": b"#!/bin/sh\n",
+    "blender-3.0/3.0/scripts/startup/startup.py": b"import bpy\n",
+    "blender-3.0/3.0/datafiles/locale/de/blender.mo": b"x" * 5000,
+    "blender-3.0/3.0/datafiles/locale/fr/blender.mo": b"y" * 3000,
+    "blender-3.0/3.0/datafiles/fonts/font.ttf": b"z" * 100,
+}
+RULES = archives.Rules(exclude=["*/datafiles/locale"])
+
+
+def make_tar(path):
+    with tarfile.open(path, "w:gz") as tar:
+        for name, data in MEMBERS.items():
+            info = tarfile.TarInfo(name)
+            info.size = len(data)
+            tar.addfile(info, io.BytesIO(data))
+        # Hard link to an excluded member
+        link = tarfile.TarInfo("blender-3.0/3.0/datafiles/de.mo")
+        link.type = tarfile.LNKTYPE
+        link.linkname = "blender-3.0/3.0/datafiles/locale/de/blender.mo"
+        tar.addfile(link)
+
+
+def make_zip(path):
+    with zipfile.ZipFile(path, "w") as zf:
+        zf.writestr("blender-3.0/3.0/datafiles/locale/", b"")
+        for name, data in MEMBERS.items():
+            zf.writestr(name, data)
+
+
+def extracted(folder):
+    return sorted(
+        os.path.relpath(os.path.join(root, name), folder)
+        for root, _, names in os.walk(folder)
+        for name in names
+    )
+
+
+@pytest.mark.parametrize("make, skipped", [(make_tar, 3), (make_zip, 2)])
+def test_excluded_members_never_land_on_disk(tmp_path, make, skipped):
+    archive = str(tmp_path / "build.archive")
+    make(archive)
+    staging = str(tmp_path / "staging")
+    stats = archives.extract(archive, staging, rules=RULES)
+    assert extracted(staging) == [
+        "blender-3.0/3.0/datafiles/fonts/font.ttf",
+        "blender-3.0/3.0/scripts/startup/startup.py",
+        "blender-3.0/blender",
+    ]
+    assert not os.path.exists(os.path.join(staging, "blender-3.0/3.0/datafiles/locale"))
+    assert stats["files"] == 3
+    assert stats["bytes"] == len(b"#!/bin/sh\n") + len(b"import bpy\n") + 100
+    # The tar's hard link counts as a file, without data
+    assert stats["skipped_files"] == skipped
+    assert stats["skipped_bytes"] == 8000
+
+
+def test_include_rules(tmp_path):
+    archive = str(tmp_path / "build.tar.gz")
+    make_tar(archive)
+    rules = archives.Rules(include=["blender", "*/scripts"], exclude=["*.mo"])
+    stats = archives.extract(archive, str(tmp_path / "staging"), rules=rules)
+    assert extracted(str(tmp_path / "staging")) == [
+        "blender-3.0/3.0/scripts/startup/startup.py",
+        "blender-3.0/blender",
+    ]
+    assert (stats["files"], stats["skipped_files"]) == (2, 4)
@@ -0,0 +1,190 @@
+"""
+    Copyright 2016-2019 Tobias Kummer/Overmind Studios.
+
+    This program is free software: you can redistribute it and/or modify
+    it under the terms of the GNU General Public License as published by
+    the Free Software Foundation, either version 3 of the License, or
+    (at your option) any later version.
+
+    This program is distributed in the hope that it will be useful,
+    but WITHOUT ANY WARRANTY; without even the implied warranty of
+    MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+    GNU General Public License for more details.
+
+    You should have received a copy of the GNU General Public License
+    along with this program.  If not, see <https://www.gnu.org/licenses/>.
+"""
+
+import os
+import time
+
+import pytest
+
+import benchmark
+
+pytestmark = pytest.mark.skipif(os.name == "nt", reason="shell script stubs")
+
+
+def stub_blender(directory, body):
+    """Write a shell script standing in for the blender executable."""
+    directory.mkdir(exist_ok=True)
+    path = directory / "blender"
+    path.write_text('#!/bin/sh\nhere=$(dirname "$0")\n' + body)
+    path.chmod(0o755)
+    return str(path)
+
+
+# Sleeps for the delay in line n of "delays" on its nth start
+DELAYED_START = """
+echo "$@" >> "$here/runs"
+n=$(wc -l < "$here/runs")
+sleep "$(sed -n "${n}p" "$here/delays")"
+echo BLENDERUPDATER-READY
+"""
+
+
+def test_run_once(tmp_path):
+    executable = stub_blender(tmp_path, "sleep 0.2\necho BLENDERUPDATER-READY\n")
+    result = benchmark.run_once(executable)
+    assert 0.2 <= result["startup"] <= result["total"] < 5
+    assert result["peak_rss"] is None or result["peak_rss"] > 0
+
+
+def test_run_once_without_marker(tmp_path):
+    executable = stub_blender(tmp_path, "echo starting\n")
+    with pytest.raises(RuntimeError):
+        benchmark.run_once(executable)
+
+
+def test_run_once_failing(tmp_path):
+    executable = stub_blender(tmp_path, "echo BLENDERUPDATER-READY\nexit 3\n")
+    with pytest.raises(RuntimeError, match="exit code 3"):
+        benchmark.run_once(executable)
+
+
+def test_run_once_timeout(tmp_path):
+    executable = stub_blender(tmp_path, "sleep 30\necho BLENDERUPDATER-READY\n")
+    started = time.monotonic()
+    with pytest.raises(RuntimeError, match="exit code -9"):
+        benchmark.run_once(executable, timeout=0.5)
+    # The sleeping child was killed as well, it would hold the output open
+    assert time.monotonic() - started < 5
+
+
+def test_launch_times(tmp_path):
+    stub_blender(tmp_path, DELAYED_START)
+    (tmp_path / "delays").write_text("0.4\n0.3\n0.05\n0.1\n")
+    result = benchmark.launch_times(str(tmp_path), runs=3)
+    runs = (tmp_path / "runs").read_text().splitlines()
+    # One cold run and three warm ones, all headless
+    assert len(runs) == 4
+    assert all(run.startswith("-b --factory-startup") for run in runs)
+    assert result["runs"] == 3
+    assert result["cold"] >= 0.4
+    # The median of 0.3, 0.05 and 0.1
+    assert 0.1 <= result["warm"] < 0.3
+    assert 0.05 <= result["warm_min"] < 0.1
+
+
+def test_bench_records_results(eng, tmp_path):
+    path = tmp_path / "build"
+    stub_blender(path, DELAYED_START)
+    (path / "delays").write_text("0\n" * 3)
+    results = benchmark.Results(str(tmp_path / "benchmarks.json"))
+    for _ in range(2):
+        benchmark.bench(eng, str(path), runs=1, hash_="aaaa11112222", results=results)
+    launches = results.get("aaaa11112222", "launch")
+    assert len(launches) == 2
+    assert all(launch["runs"] == 1 for launch in launches)
+
+
+def test_bench_needs_a_known_build(eng, tmp_path):
+    path = tmp_path / "build"
+    stub_blender(path, "echo BLENDERUPDATER-READY\n")
+    with pytest.raises(LookupError):
+        benchmark.bench(eng, str(path), results=benchmark.Results(str(tmp_path / "b")))
+
+
+# Reports the render time in "render_time" like Blender does
+RENDER = """
+# The scene and frame arguments, the script spans several lines
+echo "$3 $8 $9" >> "$here/renders"
+echo "Fra:1 Mem:12.00M (Peak 12.00M) | Time:00:00.10 | Rendering 1 / 16 samples"
+echo " Time: $(cat "$here/render_time") (Saving: 00:00.01)"
+"""
+
+
+@pytest.mark.parametrize(
+    "line, seconds",
+    [
+        (" Time: 00:12.50 (Saving: 00:00.02)", 12.5),
+        ("Time: 01:02.34 (Saving: 00:00.00)", 62.34),
+        (" Time: 1:00:00.00 (Saving: 00:00.00)", 3600),
+        ("Fra:1 Mem:12.00M (Peak 12.00M) | Time:00:00.10 | Rendering", None),
+    ],
+)
+def test_parse_render_time(line, seconds):
+    assert benchmark.parse_render_time(line) == seconds
+
+
+def test_render_times(tmp_path):
+    stub_blender(tmp_path, RENDER)
+    (tmp_path / "render_time").write_text("00:04.25")
+    times = benchmark.render_times(str(tmp_path), ["a.blend", "b.blend"], frame=7)
+    assert times == {"a.blend": 4.25, "b.blend": 4.25}
+    renders = (tmp_path / "renders").read_text().splitlines()
+    assert renders == ["a.blend -f 7", "b.blend -f 7"]
+
+
+def test_render_without_time(tmp_path):
+    executable = stub_blender(tmp_path, "echo Fra:1\n")
+    with pytest.raises(RuntimeError, match="no render times"):
+        benchmark.render_once(executable, "a.blend")
+
+
+def render_build(eng, path, hash_, seconds, results):
+    (path / "render_time").write_text(f"00:{seconds:05.2f}")
+    return benchmark.bench_render(
+        eng, str(path), ["scene.blend"], hash_=hash_, results=results
+    )
+
+
+def test_render_regressions(eng, tmp_path):
+    path = tmp_path / "build"
+    stub_blender(path, RENDER)
+    results = benchmark.Results(str(tmp_path / "benchmarks.json"))
+    eng.config.update("benchmark", {"baseline": 3, "threshold": 0.1})
+    for number, seconds in enumerate((30.0, 10.5, 9.5, 10.0)):
+        report = render_build(eng, path, f"build{number}", seconds, results)
+        # Faster than the first build or without one to compare to
+        assert report["regressions"] == []
+    # 20% slower than the median of the previous three builds
+    slower = render_build(eng, path, "slower", 12.0, results)
+    assert slower["regressions"] == [
+        {
+            "scene": "scene.blend",
+            "seconds": 12.0,
+            "baseline": 10.0,
+            "builds": 3,
+            "change": 0.2,
+        }
+    ]
+    # Within the threshold of the builds before it, the slower one included
+    faster = render_build(eng, path, "faster", 9.0, results)
+    assert faster["regressions"] == []
+
+
+def test_after_install(eng, tmp_path):
+    path = tmp_path / "build"
+    stub_blender(path, RENDER)
+    (path / "render_time").write_text("00:01.00")
+    eng.config.update("benchmark", {"scenes": ["scene.blend"], "on_install": False})
+    eng.config.set("installed", "Blender 3.0_cafe", {"path": str(path)})
+    assert benchmark.after_install(eng, str(path)) is None
+    eng.config.set("benchmark", "on_install", True)
+    report = benchmark.after_install(eng, str(path))
+    assert report["hash"] == "cafe"
+    assert report["render"]["scenes"] == {"scene.blend": 1.0}
+    # A failing benchmark doesn't fail the install
+    (path / "blender").write_text("#!/bin/sh\nexit 1\n")
+    assert benchmark.after_install(eng, str(path)) is None
@@ -0,0 +1,45 @@
+"""
+    Copyright 2016-2019 Tobias Kummer/Overmind Studios.
+
+    This program is free software: you can redistribute it and/or modify
+    it under the terms of the GNU General Public License as published by
+    the Free Software Foundation, either version 3 of the License, or
+    (at your option) any later version.
+
+    This program is distributed in the hope that it will be useful,
+    but WITHOUT ANY WARRANTY; without even the implied warranty of
+    MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+    GNU General Public License for more details.
+
+    You should have received a copy of the GNU General Public License
+    along with this program.  If not, see <https://www.gnu.org/licenses/>.
+"""
+
+from datetime import datetime, timezone
+
+import pytest
+
+import bisection
+
+BUILDS = [
+    {"hash": "aaaa", "date": "2026-09-30T12:00:00"},
+    {"hash": "bbbb", "date": "2026-10-01T12:00:00"},
+    {"hash": "cccc", "date": "2026-10-02T12:00:00"},
+]
+
+
+def test_resolve_hash_and_dates():
+    assert bisection.resolve(BUILDS, "bbbb", last=False)["hash"] == "bbbb"
+    assert bisection.resolve(BUILDS, "2026-10-01", last=True)["hash"] == "bbbb"
+    assert bisection.resolve(BUILDS, "2026-10-01", last=False)["hash"] == "bbbb"
+    assert bisection.resolve(BUILDS, "2026-10-01T13:00", last=True)["hash"] == "bbbb"
+    with pytest.raises(LookupError):
+        bisection.resolve(BUILDS, "2026-10-03", last=False)
+
+
+def test_resolve_date_with_offset():
+    # The same instant as 2026-10-01T12:30 local time
+    local = datetime(2026, 10, 1, 12, 30).astimezone()
+    ref = local.astimezone(timezone.utc).isoformat()
+    assert bisection.resolve(BUILDS, ref, last=True)["hash"] == "bbbb"
+    assert bisection.resolve(BUILDS, ref, last=False)["hash"] == "cccc"
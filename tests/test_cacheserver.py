@@ -0,0 +1,91 @@
+"""
+    Copyright 2016-2019 Tobias Kummer/Overmind Studios.
+
+    This program is free software: you can redistribute it and/or modify
+    it under the terms of the GNU General Public License as published by
+    the Free Software Foundation, either version 3 of the License, or
+    (at your option) any later version.
+
+    This program is distributed in the hope that it will be useful,
+    but WITHOUT ANY WARRANTY; without even the implied warranty of
+    MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+    GNU General Public License for more details.
+
+    You should have received a copy of the GNU General Public License
+    along with this program.  If not, see <https://www.gnu.org/licenses/>.
+"""
+
+import os
+import threading
+import time
+import types
+
+import pytest
+import requests
+
+import cacheserver
+import daemon
+import swarm
+from conftest import BUILDS, build_name
+
+
+@pytest.fixture
+def lan(eng):
+    server = cacheserver.CacheServer(eng, port=0, host="127.0.0.1")
+    eng.catalog(direct=True)
+    server.refresh = lambda: None
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    while server._server is None:
+        time.sleep(0.01)
+    server.url = f"http://127.0.0.1:{server.port}"
+    yield server
+    server.stop()
+
+
+def sparse_download(url, filename, progress=None, session=None, throttle=None):
+    """Fetcher writing the archive back to front, like a swarm download can."""
+    data = requests.get(url[0] if isinstance(url, list) else url).content
+    piece = 256 * 1024
+    part = filename + ".part"
+    with open(part, "wb") as f:
+        f.truncate(len(data))
+    done = 0
+    for offset in reversed(range(0, len(data), piece)):
+        with open(part, "r+b") as f:
+            f.seek(offset)
+            f.write(data[offset : offset + piece])
+        done += len(data[offset : offset + piece])
+        progress(done, len(data))
+        time.sleep(0.02)
+    os.replace(part, filename)
+    return filename
+
+
+def test_cache_server_leaves_the_daemon_token_alone(lan):
+    assert lan.token is None
+    assert not os.path.exists(daemon.TOKEN_FILE)
+    # Read-only, there is nothing to authorize
+    assert requests.post(lan.url + "/refresh").status_code == 501
+
+
+def test_archive_from_upstream(lan, build_archives):
+    name = build_name(BUILDS[0][0]) + ".tar.xz"
+    req = requests.get(f"{lan.url}/archive/{name}")
+    assert req.status_code == 200
+    assert req.content == build_archives[name]
+    req = requests.get(f"{lan.url}/archive/{name}", headers={"Range": "bytes=10-19"})
+    assert req.status_code == 206
+    assert req.content == build_archives[name][10:20]
+
+
+def test_out_of_order_download_sent_complete(lan, eng, build_archives, monkeypatch):
+    eng.config.set("swarm", "enabled", True)
+    monkeypatch.setattr(
+        swarm,
+        "shared_swarm",
+        lambda config, cache: types.SimpleNamespace(download=sparse_download),
+    )
+    name = build_name(BUILDS[-1][0]) + ".tar.xz"
+    req = requests.get(f"{lan.url}/archive/{name}")
+    assert req.content == build_archives[name]
@@ -0,0 +1,52 @@
+"""
+    Copyright 2016-2019 Tobias Kummer/Overmind Studios.
+
+    This program is free software: you can redistribute it and/or modify
+    it under the terms of the GNU General Public License as published by
+    the Free Software Foundation, either version 3 of the License, or
+    (at your option) any later version.
+
+    This program is distributed in the hope that it will be useful,
+    but WITHOUT ANY WARRANTY; without even the implied warranty of
+    MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+    GNU General Public License for more details.
+
+    You should have received a copy of the GNU General Public License
+    along with this program.  If not, see <https://www.gnu.org/licenses/>.
+"""
+
+import threading
+import time
+
+import pytest
+import requests
+
+import daemon
+
+
+@pytest.fixture
+def api(eng, tmp_path):
+    server = daemon.UpdateDaemon(eng, port=0, token_file=str(tmp_path / "daemon.token"))
+    server.refresh = lambda: None
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    while server._server is None:
+        time.sleep(0.01)
+    server.url = f"http://127.0.0.1:{server.port}"
+    server.headers = {"Authorization": f"Bearer {daemon.read_token(server.token_file)}"}
+    yield server
+    server.stop()
+
+
+def test_post_needs_the_token(api):
+    assert requests.post(api.url + "/refresh").status_code == 401
+    wrong = {"Authorization": "Bearer " + "0" * 64}
+    assert requests.post(api.url + "/refresh", headers=wrong).status_code == 401
+    assert requests.post(api.url + "/refresh", headers=api.headers).status_code == 200
+
+
+@pytest.mark.parametrize("body", [b"[]", b'"hash"', b"42", b"{broken", b"{}"])
+def test_bad_request_bodies(api, body):
+    req = requests.post(api.url + "/install", data=body, headers=api.headers)
+    assert req.status_code == 400
+    assert "error" in req.json()
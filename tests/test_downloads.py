@@ -0,0 +1,203 @@
+"""
+    Copyright 2016-2019 Tobias Kummer/Overmind Studios.
+
+    This program is free software: you can redistribute it and/or modify
+    it under the terms of the GNU General Public License as published by
+    the Free Software Foundation, either version 3 of the License, or
+    (at your option) any later version.
+
+    This program is distributed in the hope that it will be useful,
+    but WITHOUT ANY WARRANTY; without even the implied warranty of
+    MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+    GNU General Public License for more details.
+
+    You should have received a copy of the GNU General Public License
+    along with this program.  If not, see <https://www.gnu.org/licenses/>.
+"""
+
+import os
+import threading
+
+import pytest
+import requests
+
+import downloads
+import mirrors
+from cancellation import Cancelled
+from conftest import ARCHIVE
+
+
+def read(filename):
+    with open(filename, "rb") as f:
+        return f.read()
+
+
+def resumed_at(header):
+    """Offset of a "bytes=<first>-" Range header."""
+    return int(header[len("bytes=") : -1])
+
+
+def test_download(file_server, archive_data, tmp_path):
+    target = str(tmp_path / ARCHIVE)
+    downloads.download(file_server.base("range") + ARCHIVE, target)
+    assert read(target) == archive_data
+    assert not os.path.exists(target + ".part")
+
+
+def test_resume_after_truncated_transfer(file_server, archive_data, tmp_path):
+    target = str(tmp_path / ARCHIVE)
+    progress = []
+    urls = [file_server.base(mode) + ARCHIVE for mode in ("truncated", "range")]
+    downloads.download(urls, target, lambda done, total: progress.append(total))
+    assert read(target) == archive_data
+    path, first = file_server.requests[-1]
+    assert path == f"/range/{ARCHIVE}"
+    assert 0 < resumed_at(first) <= file_server.cut
+    assert set(progress) == {len(archive_data)}
+
+
+def test_restart_without_range_support(file_server, archive_data, tmp_path):
+    target = str(tmp_path / ARCHIVE)
+    urls = [file_server.base(mode) + ARCHIVE for mode in ("truncated", "norange")]
+    downloads.download(urls, target)
+    # The Range request was answered with the whole file, which replaces
+    # the partial one instead of being appended to it
+    assert resumed_at(file_server.requests[-1][1]) > 0
+    assert read(target) == archive_data
+
+
+def test_truncated_everywhere(file_server, tmp_path):
+    target = str(tmp_path / ARCHIVE)
+    with pytest.raises((requests.RequestException, downloads.IncompleteDownload)):
+        downloads.download(file_server.base("truncated") + ARCHIVE, target)
+    assert not os.path.exists(target)
+
+
+def test_failover_from_bad_mirrors(file_server, archive_data, dead_url, tmp_path):
+    target = str(tmp_path / ARCHIVE)
+    urls = [
+        dead_url + ARCHIVE,
+        file_server.base("broken") + ARCHIVE,
+        file_server.base("range") + ARCHIVE,
+    ]
+    downloads.download(urls, target)
+    assert read(target) == archive_data
+
+
+def test_cancel_removes_partial_download(file_server, tmp_path):
+    target = str(tmp_path / ARCHIVE)
+
+    def throttle(nbytes):
+        raise Cancelled()
+
+    with pytest.raises(Cancelled):
+        downloads.download(
+            file_server.base("range") + ARCHIVE, target, throttle=throttle
+        )
+    assert not os.path.exists(target + ".part")
+    assert not os.path.exists(target)
+
+
+def test_failed_mirrors_rank_last(file_server, archive_data, dead_url, tmp_path):
+    origin = file_server.base("range")
+    bad = [dead_url, file_server.base("broken")]
+    ranking = mirrors.Mirrors(bad + [file_server.base("norange")], origin, ttl=60)
+    urls = ranking.urls(origin + ARCHIVE)
+    assert urls[-2:] == [base + ARCHIVE for base in bad]
+    assert not ranking.results[dead_url]["ok"]
+    target = str(tmp_path / ARCHIVE)
+    downloads.download(urls, target)
+    assert read(target) == archive_data
+
+
+def test_download_once_reuses_finished_file(file_server, archive_data, tmp_path):
+    target = str(tmp_path / ARCHIVE)
+    url = file_server.base("range") + ARCHIVE
+    downloads.download_once(url, target)
+    downloads.download_once(url, target)
+    assert len(file_server.requests) == 1
+    assert read(target) == archive_data
+
+
+def test_probe_and_score(file_server, slow_server):
+    fast = mirrors.probe(file_server.base("range") + ARCHIVE, 64 * 1024)
+    slow = mirrors.probe(slow_server.base("slow") + ARCHIVE, 64 * 1024)
+    assert fast["ok"] and slow["ok"]
+    assert slow["rtt"] >= slow_server.latency > fast["rtt"]
+    assert slow["throughput"] < fast["throughput"]
+    assert mirrors.score(fast) < mirrors.score(slow)
+    assert file_server.requests[-1][1] == f"bytes=0-{64 * 1024 - 1}"
+
+
+def test_rank_prefers_the_faster_mirror(
+    file_server, slow_server, archive_data, dead_url, tmp_path
+):
+    fast, slow = file_server.base("range"), slow_server.base("slow")
+    # The origin fails as well and goes last with the dead mirror
+    origin = file_server.base("broken")
+    ranking = mirrors.Mirrors([slow, dead_url, fast], origin, size=64 * 1024)
+    assert ranking.rank(origin + ARCHIVE) == [fast, slow, dead_url, None]
+    assert ranking.results["origin"]["error"]
+    urls = ranking.urls(origin + ARCHIVE)
+    assert urls == [
+        fast + ARCHIVE,
+        slow + ARCHIVE,
+        dead_url + ARCHIVE,
+        origin + ARCHIVE,
+    ]
+    target = str(tmp_path / ARCHIVE)
+    downloads.download(urls, target)
+    assert read(target) == archive_data
+
+
+def test_queue_joins_the_same_download(file_server, archive_data, tmp_path):
+    queue = downloads.DownloadQueue(workers=2)
+    url = file_server.base("slow") + ARCHIVE
+    first = queue.submit(url, str(tmp_path / "a"))
+    second = queue.submit(url, str(tmp_path / "b"))
+    assert second is first and first.waiters == 2
+    assert [job["url"] for job in queue.status()] == [url]
+    assert second.wait(30) == first.wait(30) == str(tmp_path / "a")
+    assert read(str(tmp_path / "a")) == archive_data
+    assert len(file_server.requests) == 1
+    # Finished jobs are dropped, a new request downloads again
+    assert queue.status() == []
+    assert queue.submit(url, str(tmp_path / "c")) is not first
+
+
+def test_queue_cancelled_by_the_last_waiter(file_server, tmp_path):
+    queue = downloads.DownloadQueue(workers=1)
+    target = str(tmp_path / ARCHIVE)
+    job = queue.submit(file_server.base("slow") + ARCHIVE, target)
+    queue.submit(file_server.base("slow") + ARCHIVE, target)
+    job.wait_for(0, 10)
+    job.cancel()
+    assert not job.cancelled
+    job.cancel()
+    assert job.cancelled
+    with pytest.raises(Cancelled):
+        job.wait(10)
+    assert job.state == "cancelled"
+    assert not os.path.exists(target) and not os.path.exists(target + ".part")
+    assert queue.status() == []
+
+
+def test_queue_waiters_counted_under_lock(file_server, tmp_path):
+    queue = downloads.DownloadQueue(workers=1)
+    url = file_server.base("slow") + ARCHIVE
+    job = queue.submit(url, str(tmp_path / ARCHIVE))
+
+    def join_and_leave():
+        for _ in range(200):
+            queue.submit(url, str(tmp_path / ARCHIVE))
+            job.cancel()
+
+    threads = [threading.Thread(target=join_and_leave) for _ in range(8)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    assert job.waiters == 1 and not job.cancelled
+    job.cancel()
+    with pytest.raises(Cancelled):
+        job.wait(10)
@@ -0,0 +1,100 @@
+"""
+    Copyright 2016-2019 Tobias Kummer/Overmind Studios.
+
+    This program is free software: you can redistribute it and/or modify
+    it under the terms of the GNU General Public License as published by
+    the Free Software Foundation, either version 3 of the License, or
+    (at your option) any later version.
+
+    This program is distributed in the hope that it will be useful,
+    but WITHOUT ANY WARRANTY; without even the implied warranty of
+    MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+    GNU General Public License for more details.
+
+    You should have received a copy of the GNU General Public License
+    along with this program.  If not, see <https://www.gnu.org/licenses/>.
+"""
+
+from datetime import datetime
+
+import pytest
+
+import history
+
+
+def build(hash_, date, channel="master", os_="linux", arch="x86_64"):
+    return {
+        "filename": f"blender-3.0.0-{hash_}-{os_}-{arch}.tar.xz",
+        "hash": hash_,
+        "version": f"3.0.0_{hash_}",
+        "channel": channel,
+        "os": os_,
+        "arch": arch,
+        "size": "200MB",
+        "url": f"https://builder.example/{hash_}.tar.xz",
+        "build_date": date,
+        # Not a column, kept in "extra"
+        "link": f"/{hash_}",
+    }
+
+
+def dated(entry):
+    return datetime.strptime(entry["build_date"], "%Y-%m-%d %H:%M")
+
+
+BUILDS = [
+    build("aaaa", "2026-09-30 08:00"),
+    build("bbbb", "2026-10-01 08:00"),
+    build("bbbb", "2026-10-01 08:00", os_="windows", arch="amd64"),
+    build("cccc", "2026-10-02 08:00", channel="v293"),
+]
+
+
+@pytest.fixture
+def db(tmp_path):
+    return history.History(str(tmp_path / "history" / "builds.sqlite"))
+
+
+def test_add_counts_only_new_builds(db):
+    assert db.add(BUILDS[:2], dated) == 2
+    [first] = db.find("aaaa")
+    refreshed = dict(BUILDS[0], size="210MB")
+    assert db.add([refreshed] + BUILDS[1:], dated) == 2
+    assert db.find("aaaa")[0]["size"] == "210MB"
+    assert len(db) == 4
+    assert db.add(BUILDS, dated) == 0
+    assert len(db) == 4
+    [entry] = db.find("aaaa")
+    assert entry["size"] == "200MB"
+    assert entry["first_seen"] == first["first_seen"]
+    assert entry["link"] == "/aaaa"
+    assert entry["date"] == "2026-09-30T08:00:00"
+
+
+def test_filters(db):
+    db.add(BUILDS, dated)
+
+    def hashes(**filters):
+        return [entry["hash"] for entry in db.builds(**filters)]
+
+    assert hashes() == ["aaaa", "bbbb", "bbbb", "cccc"]
+    assert hashes(since="2026-10-01") == ["bbbb", "bbbb", "cccc"]
+    assert hashes(until="2026-10-01") == ["aaaa", "bbbb", "bbbb"]
+    assert hashes(until="2026-10-01T07:00:00") == ["aaaa"]
+    assert hashes(since="2026-10-01", until="2026-10-01") == ["bbbb", "bbbb"]
+    assert hashes(channel="master", os_="linux") == ["aaaa", "bbbb"]
+    assert hashes(os_="windows", arch="amd64") == ["bbbb"]
+    assert hashes(channel="v293", since="2026-10-03") == []
+
+
+def test_find_and_checksum(db):
+    db.add(BUILDS, dated)
+    found = db.find("bbbb")
+    assert sorted(entry["os"] for entry in found) == ["linux", "windows"]
+    assert db.find("dddd") == []
+    db.set_checksum(BUILDS[0]["filename"], "ab" * 32)
+    [entry] = db.find("aaaa")
+    assert entry["checksum"] == "ab" * 32
+    # A refresh keeps the checksum
+    db.add(BUILDS[:1], dated)
+    assert db.find("aaaa")[0]["checksum"] == "ab" * 32
@@ -0,0 +1,200 @@
+"""
+    Copyright 2016-2019 Tobias Kummer/Overmind Studios.
+
+    This program is free software: you can redistribute it and/or modify
+    it under the terms of the GNU General Public License as published by
+    the Free Software Foundation, either version 3 of the License, or
+    (at your option) any later version.
+
+    This program is distributed in the hope that it will be useful,
+    but WITHOUT ANY WARRANTY; without even the implied warranty of
+    MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+    GNU General Public License for more details.
+
+    You should have received a copy of the GNU General Public License
+    along with this program.  If not, see <https://www.gnu.org/licenses/>.
+"""
+
+import os
+import subprocess
+
+import pytest
+
+import archives
+import engine
+import journal
+from cancellation import Cancelled, CancelToken
+from conftest import BUILDS
+
+pytestmark = pytest.mark.skipif(os.name == "nt", reason="shell script builds")
+
+OLD, NEW = (hash_ for hash_, _ in BUILDS)
+
+
+def launch(path):
+    """Run the build at path; returns what it prints ("Blender <hash>")."""
+    executable = engine.blender_executable(path)
+    return (
+        subprocess.run([executable], stdout=subprocess.PIPE, check=True)
+        .stdout.decode()
+        .strip()
+    )
+
+
+@pytest.fixture
+def builds(eng):
+    return {entry["hash"]: entry for entry in eng.catalog(direct=True)}
+
+
+@pytest.fixture
+def installed(eng, builds, tmp_path):
+    """Install folder holding the OLD build."""
+    path = tmp_path / "blender"
+    path.mkdir()
+    eng.install(builds[OLD], str(path))
+    assert launch(str(path)) == f"Blender {OLD}"
+    return str(path)
+
+
+def test_cancel_during_extraction(eng, builds, installed, monkeypatch):
+    cancel = CancelToken()
+    write = archives._write
+
+    def write_and_cancel(*args):
+        cancel.cancel()
+        write(*args)
+
+    monkeypatch.setattr(archives, "_write", write_and_cancel)
+    with pytest.raises(Cancelled):
+        eng.install(builds[NEW], installed, cancel=cancel)
+    assert launch(installed) == f"Blender {OLD}"
+    assert eng.pending() == []
+    assert not os.path.exists(engine.staged_path(builds[NEW], installed))
+    assert eng.config.get("main", "installed") == builds[OLD]["version"]
+
+
+def test_cancel_while_writing_extra_targets(eng, builds, installed, tmp_path):
+    extra = tmp_path / "extra"
+    extra.mkdir()
+    cancel = CancelToken()
+
+    def target_progress(target, done, total):
+        cancel.cancel()
+
+    with pytest.raises(Cancelled):
+        eng.install(
+            builds[NEW],
+            installed,
+            extra=[str(extra)],
+            target_progress=target_progress,
+            cancel=cancel,
+        )
+    # Not swapped yet, but the extra target is half written: kept to resume
+    assert launch(installed) == f"Blender {OLD}"
+    [record] = eng.pending()
+    assert record.phase == "extracted"
+    assert os.path.isdir(engine.staged_path(builds[NEW], installed))
+    eng.resume(record)
+    assert launch(installed) == launch(str(extra)) == f"Blender {NEW}"
+    assert eng.pending() == []
+
+
+class Crash(BaseException):
+    """Stands in for the process being killed: nothing handles it."""
+
+
+def crash_after(monkeypatch, calls):
+    """Crash right after the journal was written calls times."""
+    advance = journal.Journal.advance
+    written = []
+
+    def advance_and_crash(record, phase, **values):
+        advance(record, phase, **values)
+        written.append(phase)
+        if len(written) == calls:
+            raise Crash(phase)
+
+    monkeypatch.setattr(journal.Journal, "advance", advance_and_crash)
+
+
+def half_swap(staged, path):
+    """Crash between the two renames of engine.swap()."""
+    os.rename(path, engine.old_path(path, 1))
+    raise Crash("swap")
+
+
+def crash(*args):
+    raise Crash()
+
+
+def resume_all(eng):
+    """Finish the interrupted installs, like the next start does."""
+    records = eng.pending()
+    for record in records:
+        eng.resume(record)
+    return len(records)
+
+
+@pytest.mark.parametrize(
+    "calls, phase, swapped",
+    [
+        (1, "downloaded", False),
+        (2, "verified", False),
+        (3, "extracted", False),
+        # Targets written, about to swap
+        (4, "extracted", False),
+        (5, "swapped", True),
+    ],
+)
+def test_resume_after_crash(eng, builds, installed, monkeypatch, calls, phase, swapped):
+    crash_after(monkeypatch, calls)
+    with pytest.raises(Crash):
+        eng.install(builds[NEW], installed)
+    monkeypatch.undo()
+    [record] = eng.pending()
+    assert record.phase == phase
+    assert launch(installed) == f"Blender {NEW if swapped else OLD}"
+    assert resume_all(eng) == 1
+    assert launch(installed) == f"Blender {NEW}"
+    assert eng.pending() == []
+    assert eng.config.get("main", "installed") == builds[NEW]["version"]
+
+
+def test_crash_between_the_swap_renames(eng, builds, installed, monkeypatch):
+    monkeypatch.setattr(engine, "swap", half_swap)
+    with pytest.raises(Crash):
+        eng.install(builds[NEW], installed)
+    monkeypatch.undo()
+    assert not os.path.exists(installed)
+    # Rolled back to the replaced build, which launches
+    assert engine.restore(installed)
+    assert launch(installed) == f"Blender {OLD}"
+    assert resume_all(eng) == 1
+    assert launch(installed) == f"Blender {NEW}"
+    assert eng.pending() == []
+
+
+def test_resume_rolls_back_an_interrupted_swap(eng, builds, installed, monkeypatch):
+    monkeypatch.setattr(engine, "swap", half_swap)
+    with pytest.raises(Crash):
+        eng.install(builds[NEW], installed)
+    monkeypatch.undo()
+    # Resuming restores the old build first, then swaps again
+    assert resume_all(eng) == 1
+    assert launch(installed) == f"Blender {NEW}"
+    assert eng.config.get("main", "installed") == builds[NEW]["version"]
+
+
+def test_crash_right_after_the_swap(eng, builds, installed, monkeypatch):
+    monkeypatch.setattr(engine.Engine, "_record", crash)
+    with pytest.raises(Crash):
+        eng.install(builds[NEW], installed)
+    monkeypatch.undo()
+    [record] = eng.pending()
+    assert record.get("swapping")
+    assert launch(installed) == f"Blender {NEW}"
+    # Nothing left to extract: the swap is only recorded
+    assert not os.path.exists(engine.staged_path(builds[NEW], installed))
+    assert resume_all(eng) == 1
+    assert eng.pending() == []
+    assert eng.config.get("main", "installed") == builds[NEW]["version"]
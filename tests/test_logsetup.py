@@ -0,0 +1,44 @@
+"""
+    Copyright 2016-2019 Tobias Kummer/Overmind Studios.
+
+    This program is free software: you can redistribute it and/or modify
+    it under the terms of the GNU General Public License as published by
+    the Free Software Foundation, either version 3 of the License, or
+    (at your option) any later version.
+
+    This program is distributed in the hope that it will be useful,
+    but WITHOUT ANY WARRANTY; without even the implied warranty of
+    MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+    GNU General Public License for more details.
+
+    You should have received a copy of the GNU General Public License
+    along with this program.  If not, see <https://www.gnu.org/licenses/>.
+"""
+
+import json
+import logging
+
+import logsetup
+
+
+def test_tracebacks_get_their_own_field(tmp_path):
+    root = logging.getLogger()
+    level = root.level
+    filename = tmp_path / "test.log"
+    logsetup.setup_logging("DEBUG", str(filename))
+    try:
+        try:
+            raise ValueError("broken")
+        except ValueError:
+            logging.getLogger("test").exception("Failed %s", "twice")
+    finally:
+        logsetup.shutdown_logging()
+        root.setLevel(level)
+    assert not any(
+        isinstance(handler, logging.handlers.QueueHandler) for handler in root.handlers
+    )
+    [entry] = [json.loads(line) for line in filename.read_text().splitlines()]
+    assert entry["message"] == "Failed twice"
+    assert entry["logger"] == "test"
+    assert entry["exception"].startswith("Traceback")
+    assert "ValueError: broken" in entry["exception"]
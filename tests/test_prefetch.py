@@ -0,0 +1,78 @@
+"""
+    Copyright 2016-2019 Tobias Kummer/Overmind Studios.
+
+    This program is free software: you can redistribute it and/or modify
+    it under the terms of the GNU General Public License as published by
+    the Free Software Foundation, either version 3 of the License, or
+    (at your option) any later version.
+
+    This program is distributed in the hope that it will be useful,
+    but WITHOUT ANY WARRANTY; without even the implied warranty of
+    MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+    GNU General Public License for more details.
+
+    You should have received a copy of the GNU General Public License
+    along with this program.  If not, see <https://www.gnu.org/licenses/>.
+"""
+
+import os
+import time
+
+import pytest
+
+import downloads
+import prefetch
+from cancellation import Cancelled
+
+
+@pytest.fixture
+def queue(monkeypatch):
+    """A fresh shared download queue for the test."""
+    queue = downloads.DownloadQueue()
+    monkeypatch.setattr(downloads, "_shared", queue)
+    return queue
+
+
+def started(queue, entry, timeout=5):
+    """Wait until the download of entry is in the queue; returns the job."""
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        job = queue.jobs.get(entry["url"])
+        if job is not None and job.done:
+            return job
+        time.sleep(0.01)
+    raise TimeoutError(f"{entry['url']} not downloading")
+
+
+def archive_requests(builder, entry):
+    return [path for path, _ in builder.requests if path.endswith(entry["filename"])]
+
+
+def test_fetch_joins_the_prefetch(eng, builder, queue):
+    entry = eng.catalog()[-1]
+    prefetcher = prefetch.Prefetcher(eng, entry, rate=64 * 1024)
+    prefetcher.start()
+    job = started(queue, entry)
+    assert job.priority == prefetch.PRIORITY
+    began = time.monotonic()
+    archive = eng.fetch(entry)
+    # Over 30 s at the prefetch rate
+    assert time.monotonic() - began < 10
+    assert os.path.getsize(archive) == job.total
+    prefetcher.wait(5)
+    assert not prefetcher.running and prefetcher.error is None
+    assert len(archive_requests(builder, entry)) == 1
+
+
+def test_fetch_cancels_another_prefetch(eng, builder, queue):
+    old, new = eng.catalog()
+    prefetcher = prefetch.Prefetcher(eng, old, rate=64 * 1024)
+    prefetcher.start()
+    job = started(queue, old)
+    eng.fetch(new)
+    prefetcher.wait(5)
+    assert not prefetcher.running
+    with pytest.raises(Cancelled):
+        job.wait(5)
+    assert eng.cached(new) and not eng.cached(old)
+    assert not os.path.exists(os.path.join(eng.cache, old["filename"] + ".part"))
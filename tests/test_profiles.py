@@ -0,0 +1,44 @@
+"""
+    Copyright 2016-2019 Tobias Kummer/Overmind Studios.
+
+    This program is free software: you can redistribute it and/or modify
+    it under the terms of the GNU General Public License as published by
+    the Free Software Foundation, either version 3 of the License, or
+    (at your option) any later version.
+
+    This program is distributed in the hope that it will be useful,
+    but WITHOUT ANY WARRANTY; without even the implied warranty of
+    MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+    GNU General Public License for more details.
+
+    You should have received a copy of the GNU General Public License
+    along with this program.  If not, see <https://www.gnu.org/licenses/>.
+"""
+
+import os
+
+import pytest
+
+import benchmark
+import engine
+import profiles
+from conftest import BUILDS
+
+pytestmark = pytest.mark.skipif(os.name == "nt", reason="shell script builds")
+
+
+def test_profiles_installing_the_same_build(eng, tmp_path):
+    paths = {}
+    for name in ("studio", "laptop"):
+        paths[name] = str(tmp_path / name)
+        os.mkdir(paths[name])
+        eng.config.set("profiles", name, {"os": "linux", "path": paths[name]})
+    results = profiles.batch(eng)
+    version = results["studio"]["version"]
+    assert results["laptop"]["version"] == version
+    for name, path in paths.items():
+        assert results[name]["state"] == "installed"
+        record = eng.config.get("installed", engine.install_key(version, name))
+        assert record["path"] == path
+        hash_, installed, _ = benchmark.installed_build(eng.config, path)
+        assert (hash_, installed) == (BUILDS[-1][0], version)
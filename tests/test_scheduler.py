@@ -0,0 +1,60 @@
+"""
+    Copyright 2016-2019 Tobias Kummer/Overmind Studios.
+
+    This program is free software: you can redistribute it and/or modify
+    it under the terms of the GNU General Public License as published by
+    the Free Software Foundation, either version 3 of the License, or
+    (at your option) any later version.
+
+    This program is distributed in the hope that it will be useful,
+    but WITHOUT ANY WARRANTY; without even the implied warranty of
+    MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+    GNU General Public License for more details.
+
+    You should have received a copy of the GNU General Public License
+    along with this program.  If not, see <https://www.gnu.org/licenses/>.
+"""
+
+import json
+import os
+
+import engine
+import scheduler
+from conftest import BUILDS
+
+
+def test_catalog_kept_out_of_the_settings(eng, builder, monkeypatch):
+    parsed = []
+    parse = engine.parse_catalog
+    monkeypatch.setattr(
+        engine, "parse_catalog", lambda html: parsed.append(html) or parse(html)
+    )
+    builds = eng.catalog(direct=True)
+    assert [entry["hash"] for entry in builds] == [hash_ for hash_, _ in BUILDS]
+    cached = eng.config.get("cache", eng.url)
+    assert set(cached) == {"etag", "modified"}
+    eng.config.flush()
+    with open(eng.config.filename) as f:
+        assert "builds" not in json.dumps(json.load(f)["cache"])
+    # Unchanged page: a 304, the builds are read back from the catalog file
+    assert eng.catalog(direct=True) == builds
+    assert len(parsed) == 1
+    os.remove(eng._catalog_file())
+    # Lost catalog file: fetched again in full
+    assert eng.catalog(direct=True) == builds
+    assert len(parsed) == 2
+
+
+def test_remove_stale_keeps_extractions_in_progress(eng, tmp_path):
+    path = str(tmp_path / "blender")
+    os.makedirs(path)
+    keep, old = BUILDS[-1][0], BUILDS[0][0]
+    kept = engine.staged_path({"hash": keep}, path)
+    stale = engine.staged_path({"hash": old}, path)
+    extracting = engine.staged_path({"hash": old}, path) + ".tmp"
+    for directory in (kept, stale, extracting):
+        os.makedirs(directory)
+    removed = []
+    eng.reaper.discard = removed.append
+    scheduler.Poller(eng)._remove_stale(path, keep)
+    assert removed == [stale]
@@ -0,0 +1,128 @@
+"""
+    Copyright 2016-2019 Tobias Kummer/Overmind Studios.
+
+    This program is free software: you can redistribute it and/or modify
+    it under the terms of the GNU General Public License as published by
+    the Free Software Foundation, either version 3 of the License, or
+    (at your option) any later version.
+
+    This program is distributed in the hope that it will be useful,
+    but WITHOUT ANY WARRANTY; without even the implied warranty of
+    MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+    GNU General Public License for more details.
+
+    You should have received a copy of the GNU General Public License
+    along with this program.  If not, see <https://www.gnu.org/licenses/>.
+"""
+
+import json
+import os
+import threading
+import time
+
+import pytest
+
+import settings
+
+
+def on_disk(filename):
+    with open(filename) as f:
+        return json.load(f)
+
+
+def test_changes_are_written_once_after_the_last(tmp_path, monkeypatch):
+    filename = str(tmp_path / "settings.json")
+    config = settings.Settings(filename, legacy=None, delay=0.3)
+    writes = []
+    write = config._write
+
+    def counting(data):
+        writes.append(data)
+        write(data)
+
+    monkeypatch.setattr(config, "_write", counting)
+    config.set("main", "path", "/opt/blender-0")
+    flusher = config._flusher
+    for number in range(1, 5):
+        time.sleep(0.1)
+        config.set("main", "path", f"/opt/blender-{number}")
+        # Every change reuses the waiting thread
+        assert config._flusher is flusher
+    assert writes == []
+    flusher.join(2)
+    assert config._flusher is None
+    assert len(writes) == 1
+    assert on_disk(filename)["main"]["path"] == "/opt/blender-4"
+
+
+def test_flush_merges_with_the_file(tmp_path):
+    filename = str(tmp_path / "settings.json")
+    first = settings.Settings(filename, legacy=None, delay=60)
+    second = settings.Settings(filename, legacy=None, delay=60)
+    first.set("main", "path", "/opt/first")
+    first.set("main", "installed", "first")
+    first.flush()
+    second.set("main", "installed", "second")
+    second.flush()
+    # Only the key second changed is taken from it
+    assert on_disk(filename)["main"]["path"] == "/opt/first"
+    assert on_disk(filename)["main"]["installed"] == "second"
+    assert second.get("main", "path") == "/opt/first"
+    first.delete("main", "path")
+    first.flush()
+    assert "path" not in on_disk(filename)["main"]
+    assert on_disk(filename)["main"]["installed"] == "second"
+
+
+def test_failed_write_keeps_the_old_file(tmp_path, monkeypatch):
+    filename = str(tmp_path / "settings.json")
+    config = settings.Settings(filename, legacy=None, delay=60)
+    config.set("main", "path", "/opt/old")
+    config.flush()
+
+    def broken(data, f, **kwargs):
+        f.write('{"main": ')
+        raise OSError("disk full")
+
+    monkeypatch.setattr(settings.json, "dump", broken)
+    config.set("main", "path", "/opt/new")
+    with pytest.raises(OSError):
+        config.flush()
+    monkeypatch.undo()
+    assert on_disk(filename)["main"]["path"] == "/opt/old"
+    assert sorted(os.listdir(tmp_path)) == ["settings.json", "settings.json.lock"]
+
+
+def test_concurrent_writers(tmp_path):
+    filename = str(tmp_path / "settings.json")
+    writers = [settings.Settings(filename, legacy=None, delay=0.01) for _ in range(2)]
+
+    def write(number, config):
+        for key in range(50):
+            config.set("metrics", f"{number}-{key}", key)
+            if key % 10 == 0:
+                config.flush()
+        config.flush()
+
+    threads = [
+        threading.Thread(target=write, args=(number, config))
+        for number, config in enumerate(writers)
+    ]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    metrics = on_disk(filename)["metrics"]
+    assert len(metrics) == 100
+    assert metrics["0-49"] == metrics["1-49"] == 49
+
+
+@pytest.mark.parametrize("content", ["[]", '"settings"', "{broken"])
+def test_unusable_file_falls_back_to_the_defaults(tmp_path, content):
+    filename = tmp_path / "settings.json"
+    filename.write_text(content)
+    config = settings.Settings(str(filename), legacy=None, delay=60)
+    assert config.section("main") == settings.DEFAULTS["main"]
+    config.set("main", "path", "/opt/blender")
+    config.flush()
+    assert on_disk(str(filename))["main"]["path"] == "/opt/blender"
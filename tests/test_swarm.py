@@ -0,0 +1,64 @@
+"""
+    Copyright 2016-2019 Tobias Kummer/Overmind Studios.
+
+    This program is free software: you can redistribute it and/or modify
+    it under the terms of the GNU General Public License as published by
+    the Free Software Foundation, either version 3 of the License, or
+    (at your option) any later version.
+
+    This program is distributed in the hope that it will be useful,
+    but WITHOUT ANY WARRANTY; without even the implied warranty of
+    MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+    GNU General Public License for more details.
+
+    You should have received a copy of the GNU General Public License
+    along with this program.  If not, see <https://www.gnu.org/licenses/>.
+"""
+
+import shutil
+import socket
+
+import pytest
+
+import swarm
+from conftest import BUILDS
+
+
+def free_port():
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        return sock.getsockname()[1]
+
+
+def test_bench_shares_pieces_between_peers(builder):
+    hash_ = BUILDS[-1][0]
+    # A slow origin gives the peers time to find each other
+    url = builder.url + "/slow/download/"
+    result = swarm.bench(
+        url, hash_, peers=3, base_port=free_port(), timeout=120, workers=1
+    )
+    try:
+        assert result["size"] > 2 * swarm.PIECE_SIZE
+        assert len(result["per_peer"]) == 3
+        for stats in result["per_peer"].values():
+            assert stats["size"] == result["size"]
+            assert stats["upstream_bytes"] + stats["peer_bytes"] == stats["size"]
+        # Every piece came from upstream about once, not once per peer
+        assert result["wan_bytes"] < result["baseline_wan_bytes"]
+        assert result["wan_saved"] > 0.3
+    finally:
+        shutil.rmtree(result["workdir"], ignore_errors=True)
+
+
+@pytest.mark.parametrize(
+    "name, valid",
+    [
+        ("blender.tar.xz", True),
+        ("../blender.tar.xz", False),
+        ("..\\\\blender.tar.xz", False),
+        ("sub/blender.tar.xz", False),
+        (".hidden", False),
+    ],
+)
+def test_valid_name(name, valid):
+    assert swarm.valid_name(name) == valid
@@ -0,0 +1,131 @@
+"""
+    Copyright 2016-2019 Tobias Kummer/Overmind Studios.
+
+    This program is free software: you can redistribute it and/or modify
+    it under the terms of the GNU General Public License as published by
+    the Free Software Foundation, either version 3 of the License, or
+    (at your option) any later version.
+
+    This program is distributed in the hope that it will be useful,
+    but WITHOUT ANY WARRANTY; without even the implied warranty of
+    MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+    GNU General Public License for more details.
+
+    You should have received a copy of the GNU General Public License
+    along with this program.  If not, see <https://www.gnu.org/licenses/>.
+"""
+
+import glob
+import logging
+import os
+import subprocess
+import threading
+import time
+
+logger = logging.getLogger(__name__)
+
+COMPILE_TIMEOUT = 600
+READ_CHUNK = 4 * 1024 * 1024
+
+
+def _roots(path):
+    """Folders holding the versioned data folder (e.g. 3.0/) of a build."""
+    return [path] + glob.glob(os.path.join(path, "*.app", "Contents", "Resources"))
+
+
+def find_python(path):
+    """Return the Python interpreter bundled with the build at path, or None."""
+    for root in _roots(path):
+        pattern = os.path.join(root, "*", "python", "bin", "python*")
+        for candidate in sorted(glob.glob(pattern)):
+            name = os.path.basename(candidate)
+            if name.endswith("-config") or not os.access(candidate, os.X_OK):
+                continue
+            return candidate
+    return None
+
+
+def python_trees(path):
+    """Return the bundled python/lib and scripts/ folders of a build."""
+    trees = []
+    for root in _roots(path):
+        trees += glob.glob(os.path.join(root, "*", "python", "lib"))
+        trees += glob.glob(os.path.join(root, "*", "scripts"))
+    return sorted(tree for tree in trees if os.path.isdir(tree))
+
+
+def hot_files(path, executable):
+    """Return the Blender binary and the shared libraries it loads at start."""
+    files = [executable] if os.path.isfile(executable) else []
+    for pattern in ("*.dll", "*.so*", os.path.join("lib", "**", "*.so*")):
+        files += glob.glob(os.path.join(path, pattern), recursive=True)
+    return [f for f in files if os.path.isfile(f) and not os.path.islink(f)]
+
+
+def compile_trees(python, trees, workers=0, timeout=COMPILE_TIMEOUT):
+    """Byte-compile trees with the given interpreter, workers processes at once.
+
+    workers 0 uses all CPU cores. Using Blender's own Python writes the
+    .pyc files with the cache tag Blender looks for. Returns the exit code.
+    """
+    command = [python, "-m", "compileall", "-q", "-j", str(workers), *trees]
+    logger.info(f"Compiling {', '.join(trees)}")
+    try:
+        proc = subprocess.run(
+            command, stdout=subprocess.DEVNULL, stderr=subprocess.PIPE, timeout=timeout
+        )
+    except (OSError, subprocess.TimeoutExpired) as e:
+        logger.warning(f"Compiling with {python} failed: {e}")
+        return None
+    if proc.returncode:
+        # Some bundled test modules don't compile, that's expected
+        logger.debug(f"compileall: {proc.stderr.decode(errors='replace')[-500:]}")
+    return proc.returncode
+
+
+def readahead(files):
+    """Pull files into the page cache; returns the number of bytes."""
+    total = 0
+    for filename in files:
+        try:
+            with open(filename, "rb") as f:
+                size = os.fstat(f.fileno()).st_size
+                if hasattr(os, "posix_fadvise"):
+                    os.posix_fadvise(f.fileno(), 0, 0, os.POSIX_FADV_WILLNEED)
+                else:
+                    while f.read(READ_CHUNK):
+                        pass
+                total += size
+        except OSError as e:
+            logger.debug(f"Read-ahead of {filename} failed: {e}")
+    return total
+
+
+def warm_up(path, executable, workers=0, timeout=COMPILE_TIMEOUT):
+    """Prepare a fresh install at path for a fast first start.
+
+    Compiles the bundled Python modules and add-ons with Blender's own
+    interpreter while the binary and its libraries are read into the page
+    cache. Returns what was done; a build without a bundled Python is
+    only read ahead.
+    """
+    started = time.monotonic()
+    files = hot_files(path, executable)
+    result = {"python": find_python(path), "trees": python_trees(path)}
+    reader = threading.Thread(
+        target=lambda: result.update(readahead_bytes=readahead(files)),
+        name="Readahead",
+        daemon=True,
+    )
+    reader.start()
+    if result["python"] and result["trees"]:
+        result["returncode"] = compile_trees(
+            result["python"], result["trees"], workers, timeout
+        )
+    else:
+        logger.info(f"No bundled Python found in {path}, skipping compilation")
+    reader.join()
+    result["readahead_files"] = len(files)
+    result["seconds"] = round(time.monotonic() - started, 3)
+    logger.info(f"Warmed up {path} in {result['seconds']}s")
+    return result